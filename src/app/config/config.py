@@ -1 +1,86 @@
 DB_ADDR="C:\\Users\\bjain\\OneDrive - WatchGuard Technologies Inc\\Python\\Project\\Library_Management\\src\\app\\utils\\db\\library.db"
+
+# Connection pool settings
+DB_POOL_SIZE = 8
+DB_POOL_TIMEOUT = 5.0  # seconds to wait for a free connection
+DB_POOL_MAX_LIFETIME = 3600  # seconds before a connection is recycled
+DB_POOL_MAX_IDLE = 300  # seconds an idle connection may sit in the pool
+DB_POOL_HEALTH_CHECK_INTERVAL = 30  # seconds of idleness before a checkout is pinged
+
+# SQLite PRAGMA profile applied to every pooled connection: "durable", "balanced" or "throughput"
+DB_PRAGMA_PROFILE = "balanced"
+DB_PRAGMA_OVERRIDES = {}  # e.g. {"cache_size": -64000}
+
+# Keyset pagination for the catalog and issued-book listings
+PAGE_SIZE_DEFAULT = 100
+PAGE_SIZE_MAX = 500
+
+# Catalog full-text search
+SEARCH_LIMIT_DEFAULT = 20
+SEARCH_LIMIT_MAX = 100
+
+# Read-through catalog cache in front of BooksRepository
+CATALOG_CACHE_ENABLED = True
+CATALOG_CACHE_MAX_ENTRIES = 10000
+CATALOG_CACHE_TTL = 60  # seconds
+CATALOG_CACHE_NEGATIVE_TTL = 10  # seconds to remember that a title/id does not exist
+
+# Serve the default GET /user/book page from a pre-encoded snapshot
+CATALOG_SNAPSHOT_ENABLED = True
+
+# Answer GET requests on the book and issue-book routes with 304 when the tables they read haven't changed
+CONDITIONAL_GET_ENABLED = True
+
+# Application log level; request details logged by api_logger are only built when DEBUG is enabled
+LOG_LEVEL = "DEBUG"
+
+# Asynchronous logging: request threads enqueue records and a background thread writes them in batches
+LOG_ASYNC_ENABLED = True
+LOG_QUEUE_SIZE = 10000
+LOG_OVERFLOW_POLICY = "drop-debug"  # "drop-oldest", "drop-debug" or "block"
+LOG_BATCH_SIZE = 256
+
+# "text" is the classic one-line format; "json" writes one JSON object per line with request_id, user_id,
+# role, route, status and duration
+LOG_FORMAT = "text"
+# Fraction of requests whose DEBUG/INFO lines are logged; warnings and errors are always logged
+LOG_SAMPLE_RATE = 1.0
+LOG_SAMPLE_RATES = {}  # per-route overrides, e.g. {"/user/book": 0.01}
+
+# bcrypt runs on a dedicated pool so login/signup bursts can't occupy every request thread
+PASSWORD_HASH_WORKERS = 2
+PASSWORD_HASH_QUEUE_SIZE = 32  # requests allowed to wait for a worker before answering 429
+PASSWORD_HASH_ROUNDS = 12  # bcrypt cost factor for new hashes; existing hashes keep their own
+
+# Claims of verified JWTs are cached until the token's exp, so repeat requests skip signature verification
+AUTH_TOKEN_CACHE_ENABLED = True
+AUTH_TOKEN_CACHE_MAX_ENTRIES = 10000
+
+# Concurrent lookups of the same book by id/title share one query
+BOOK_LOOKUP_COALESCING_ENABLED = True
+
+# Bulk catalog import (CSV/JSONL): rows per transaction and how many row errors to report back
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+# Most books a single batch issue/return request may contain
+BATCH_MAX_ITEMS = 50
+
+# Circulation export: rows fetched from the cursor and encoded per streamed chunk
+EXPORT_CHUNK_SIZE = 1000
+
+# JSON provider for responses: "auto" uses orjson when installed, else the stdlib encoder; or "orjson" / "stdlib"
+JSON_PROVIDER = "auto"
+
+# Request latency, SQL statement counts/time and error counters, served in Prometheus text format at /metrics
+METRICS_ENABLED = True
+# /metrics needs an admin bearer token, like /admin/*; turn off only where the port is private to the scraper
+METRICS_REQUIRE_ADMIN = True
+
+# Slow-query log: statements slower than the threshold are kept (newest SLOW_QUERY_BUFFER_SIZE) with their
+# repository method and EXPLAIN QUERY PLAN, written to SLOW_QUERY_LOG_FILE and served at /admin/db/slow-queries
+SLOW_QUERY_LOG_ENABLED = True
+SLOW_QUERY_THRESHOLD_MS = 100
+SLOW_QUERY_BUFFER_SIZE = 200
+SLOW_QUERY_EXPLAIN = True
+SLOW_QUERY_LOG_FILE = "slow_queries.log"
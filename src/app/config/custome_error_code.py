@@ -11,4 +11,6 @@ TOKEN_INVALID = 4103
 TOKEN_MISSING = 4104
 
 DB_ERROR = 5000
-UNEXPECTED_ERROR = 5001
\ No newline at end of file
+UNEXPECTED_ERROR = 5001
+BATCH_ITEMS_FAILED = 4090
+TOO_MANY_REQUESTS = 4290
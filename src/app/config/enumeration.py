@@ -14,4 +14,9 @@ class Branch(Enum):
 
 class Status(Enum):
     SUCCESS = "success"
-    FAIL = "fail"
\ No newline at end of file
+    FAIL = "fail"
+
+class LogOverflowPolicy(Enum):
+    DROP_OLDEST = "drop-oldest"
+    DROP_DEBUG = "drop-debug"
+    BLOCK = "block"
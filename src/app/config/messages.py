@@ -20,4 +20,18 @@ BOOK_DELETE_SUCCESSFULLY = "Book delete successfully"
 BOOK_FETCH_SUCCESSFULLY = "Book fetched successfully"
 INVALID_DATE_FORMAT = "Invalid return_date format. Expected YYYY-MM-DD."
 SOMETHING_WENT_WRONG = "Something went wrong"
-USER_ALREADY_EXISTS = "User already exists"
\ No newline at end of file
+USER_ALREADY_EXISTS = "User already exists"
+INVALID_CURSOR = "Invalid pagination cursor"
+INVALID_PAGE_LIMIT = "limit must be a positive integer"
+SEARCH_QUERY_REQUIRED = "Search query is required"
+BOOK_SEARCH_SUCCESSFULLY = "Books searched successfully"
+SERVER_BUSY_TRY_AGAIN = "Server is busy, please try again shortly"
+BOOKS_IMPORTED_SUCCESSFULLY = "Books imported successfully"
+BOOKS_ISSUED_SUCCESSFULLY = "Books issued successfully"
+BOOKS_RETURNED_SUCCESSFULLY = "Books returned successfully"
+ISSUE_BOOK_EXPORT_STARTED = "Issue book export started"
+SLOW_QUERIES_FETCH_SUCCESSFULLY = "Slow queries fetched successfully"
+SLOW_QUERIES_CLEARED = "Slow queries cleared"
+BATCH_PARTIALLY_APPLIED = "Some items in the batch failed"
+BATCH_NOT_APPLIED = "Batch not applied because some items failed"
+BATCH_ALL_ITEMS_FAILED = "Every item in the batch failed"
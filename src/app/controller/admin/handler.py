@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from flask import request
+
+from src.app.config.enumeration import Status
+from src.app.config.messages import *
+from src.app.config.custome_error_code import *
+from src.app.model.responses import Response
+from src.app.utils.db.slow_query_log import SlowQueryLog
+from src.app.utils.errors.error import *
+from src.app.utils.logger.logger import Logger
+from src.app.utils.logger.api_logger import api_logger
+from src.app.utils.pagination import parse_limit
+from src.app.utils.utils import Utils
+
+
+@dataclass
+class AdminHandler:
+    slow_query_log: SlowQueryLog
+    logger = Logger()
+
+    @classmethod
+    def create(cls,slow_query_log: SlowQueryLog):
+        return cls(slow_query_log)
+
+    @Utils.admin
+    @api_logger(logger)
+    def get_slow_queries(self):
+        """Most recent slow statements first, with the repository method and query plan of each."""
+        try:
+            limit = parse_limit(request.args.get('limit'))
+            entries = self.slow_query_log.entries(limit)
+            self.logger.info(SLOW_QUERIES_FETCH_SUCCESSFULLY)
+            return Response.response(SLOW_QUERIES_FETCH_SUCCESSFULLY, Status.SUCCESS.value,
+                                     data=[entry.to_dict() for entry in entries] if entries else []), 200
+
+        except InvalidRequestBody as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, VALIDATION_FAILURE), 422
+
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, UNEXPECTED_ERROR), 500
+
+    @Utils.admin
+    @api_logger(logger)
+    def clear_slow_queries(self):
+        try:
+            self.slow_query_log.clear()
+            self.logger.info(SLOW_QUERIES_CLEARED)
+            return Response.response(SLOW_QUERIES_CLEARED, Status.SUCCESS.value), 200
+
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, UNEXPECTED_ERROR), 500
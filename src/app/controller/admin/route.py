@@ -0,0 +1,27 @@
+from flask import Blueprint
+
+from src.app.controller.admin.handler import AdminHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.utils.db.slow_query_log import SlowQueryLog
+
+
+def create_admin_route(slow_query_log:SlowQueryLog) -> Blueprint:
+    admin_route_blueprint = Blueprint('admin_route', __name__)
+    admin_route_blueprint.before_request(auth_middleware)
+    admin_handler = AdminHandler.create(slow_query_log)
+
+    admin_route_blueprint.add_url_rule(
+        '/admin/db/slow-queries',
+        "get-slow-queries",
+        admin_handler.get_slow_queries,
+        methods=['GET']
+    )
+
+    admin_route_blueprint.add_url_rule(
+        '/admin/db/slow-queries',
+        "clear-slow-queries",
+        admin_handler.clear_slow_queries,
+        methods=['DELETE']
+    )
+
+    return admin_route_blueprint
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from flask import request,g,jsonify
+from flask import request,g,jsonify,current_app
 from pydantic import ValidationError
 
 from src.app.config.enumeration import Status
@@ -8,20 +8,37 @@ from src.app.config.custome_error_code import *
 from src.app.dto.book import CreateBookDTO, UpdateBookDTO
 from src.app.model.responses import Response
 from src.app.services.book_service import BookService
+from src.app.services.catalog_snapshot import CatalogSnapshot
+from src.app.services.catalog_import import detect_format, text_stream
 from src.app.model.books import Books
 from src.app.config.config import *
+import src.app.config.config as config
 from src.app.utils.errors.error import *
 from src.app.utils.logger.logger import Logger
 from src.app.utils.logger.api_logger import api_logger
+from src.app.utils.pagination import parse_limit
 from src.app.utils.utils import Utils
 
 @dataclass
 class BookHandler:
     book_service: BookService
+    catalog_snapshot: CatalogSnapshot = None
     logger = Logger()
     @classmethod
-    def create(cls,book_service: BookService):
-        return cls(book_service)
+    def create(cls,book_service: BookService,catalog_snapshot: CatalogSnapshot = None):
+        return cls(book_service,catalog_snapshot)
+
+    def _is_default_catalog_request(self):
+        return (self.catalog_snapshot is not None
+                and request.args.get('cursor') is None
+                and request.args.get('limit') in (None, str(config.PAGE_SIZE_DEFAULT)))
+
+    def _catalog_snapshot_response(self):
+        body, etag, version = self.catalog_snapshot.get()
+        response = current_app.response_class(body, status=200, mimetype="application/json")
+        response.set_etag(etag)
+        response.headers["X-Catalog-Version"] = str(version)
+        return response.make_conditional(request)
 
     @Utils.admin
     @api_logger(logger)
@@ -96,14 +113,58 @@ class BookHandler:
             self.logger.error(str(e))
             return Response.response(str(e), Status.FAIL.value, UNEXPECTED_ERROR), 500
 
+    @Utils.admin
+    @api_logger(logger)
+    def import_books(self):
+        """
+        Bulk import from a multipart upload (`file`) or a raw CSV/JSONL body. The format
+        comes from `?format=`, the file name or the content type.
+        """
+        try:
+            upload = request.files.get('file')
+            fmt = request.args.get('format')
+            if upload is not None:
+                fmt = fmt or detect_format(upload.filename, upload.content_type)
+                stream = text_stream(upload.stream)
+            else:
+                fmt = fmt or detect_format(content_type=request.content_type)
+                stream = text_stream(request.stream)
+
+            def progress(report):
+                self.logger.info("Book import: %s rows read, %s batches written, %s errors",
+                                 report.rows_read, report.batches, report.error_count)
+
+            report = self.book_service.import_books(stream, fmt, progress)
+            self.logger.info(BOOKS_IMPORTED_SUCCESSFULLY)
+            return Response.response(BOOKS_IMPORTED_SUCCESSFULLY, Status.SUCCESS.value, data=report.to_dict()), 200
+
+        except (InvalidRequestBody, UnicodeDecodeError) as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, INVALID_REQUEST_BODY_FORMAT), 422
+
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, DB_ERROR), 500
+
     @api_logger(logger)
     def get_all_books(self):
         title = request.args.get('title')
         if title is None:
             try:
-                books = self.book_service.get_all_books()
+                if self._is_default_catalog_request():
+                    self.logger.info(BOOK_FETCH_SUCCESSFULLY)
+                    return self._catalog_snapshot_response()
+
+                limit = parse_limit(request.args.get('limit'))
+                page = self.book_service.get_all_books(limit, request.args.get('cursor'))
                 self.logger.info(BOOK_FETCH_SUCCESSFULLY)
-                return Response.response(BOOK_FETCH_SUCCESSFULLY, Status.SUCCESS.value,data=[book.__dict__ for book in books] if books else []), 200
+                return Response.response(BOOK_FETCH_SUCCESSFULLY, Status.SUCCESS.value,
+                                         data=[book.to_dict() for book in page.items] if page.items else [],
+                                         pagination=page.meta()), 200
+
+            except InvalidRequestBody as e:
+                self.logger.error(str(e))
+                return Response.response(str(e), Status.FAIL.value, VALIDATION_FAILURE), 422
 
             except Exception as e:
                 self.logger.error(str(e))
@@ -113,7 +174,7 @@ class BookHandler:
             try:
                 book = self.book_service.get_book_by_title(title)
                 self.logger.info(BOOK_FETCH_SUCCESSFULLY)
-                return Response.response(BOOK_FETCH_SUCCESSFULLY, Status.SUCCESS.value,data=book.__dict__ if book else {}), 200
+                return Response.response(BOOK_FETCH_SUCCESSFULLY, Status.SUCCESS.value,data=book.to_dict() if book else {}), 200
 
             except Exception as e:
                 self.logger.error(str(e))
@@ -1,14 +1,18 @@
 from flask import Blueprint
 
 from src.app.controller.book.handler import BookHandler
+from src.app.middleware.conditional_get import ConditionalGet
 from src.app.middleware.middleware import auth_middleware
 from src.app.services.book_service import BookService
+from src.app.services.catalog_snapshot import CatalogSnapshot
 
 
-def create_book_route(book_service:BookService):
+def create_book_route(book_service:BookService,catalog_snapshot:CatalogSnapshot=None,conditional_get:ConditionalGet=None):
     book_route_blueprint = Blueprint('book_route', __name__)
     book_route_blueprint.before_request(auth_middleware)
-    book_handler = BookHandler(book_service)
+    if conditional_get:
+        conditional_get.register(book_route_blueprint)
+    book_handler = BookHandler.create(book_service,catalog_snapshot)
 
     book_route_blueprint.add_url_rule(
         '/admin/book',
@@ -17,6 +21,13 @@ def create_book_route(book_service:BookService):
         methods=['POST']
     )
 
+    book_route_blueprint.add_url_rule(
+        '/admin/book/import',
+        "import-books",
+        book_handler.import_books,
+        methods=['POST']
+    )
+
     book_route_blueprint.add_url_rule(
         '/admin/book',
         "update-book",
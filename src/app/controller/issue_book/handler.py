@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 
-from flask import request, jsonify,g
+from flask import request, jsonify, g, current_app, stream_with_context
 from datetime import datetime
 
 from pydantic import ValidationError
 
 from src.app.config.custome_error_code import *
 from src.app.config.messages import *
-from src.app.dto.issue_book import IssueBookDTO
+from src.app.dto.issue_book import IssueBookDTO, BatchIssueBookDTO, BatchReturnBookDTO, IssuedBookExportDTO
+from src.app.model.batch_result import BatchItemResult
 from src.app.model.issued_books import IssuedBooks
 from src.app.model.responses import Response
 from src.app.utils.errors.error import *
+from src.app.services.circulation_export import EXPORT_MIMETYPES
 from src.app.services.issue_book_service import IssueBookService
 from src.app.utils.logger.api_logger import api_logger
 from src.app.utils.logger.logger import Logger
 from src.app.config.config import *
+from src.app.utils.pagination import parse_limit
 from src.app.utils.utils import Utils
 from src.app.config.enumeration import Role, Status
 
@@ -79,6 +82,94 @@ class IssueBookHandler:
             return Response.response(str(e),Status.FAIL.value,DB_ERROR),500
 
 
+    def _batch_response(self,results:list,success_message:str,all_or_nothing:bool):
+        data = [result.to_dict() for result in results]
+        if not any(result.status == BatchItemResult.FAILED for result in results):
+            self.logger.info(success_message)
+            return Response.response(success_message,Status.SUCCESS.value,data=data),200
+        if all_or_nothing:
+            self.logger.error(BATCH_NOT_APPLIED)
+            return Response.response(BATCH_NOT_APPLIED,Status.FAIL.value,BATCH_ITEMS_FAILED,data=data),409
+        if all(result.status == BatchItemResult.FAILED for result in results):
+            self.logger.error(BATCH_ALL_ITEMS_FAILED)
+            return Response.response(BATCH_ALL_ITEMS_FAILED,Status.FAIL.value,BATCH_ITEMS_FAILED,data=data),409
+        self.logger.info(BATCH_PARTIALLY_APPLIED)
+        return Response.response(BATCH_PARTIALLY_APPLIED,Status.SUCCESS.value,data=data),200
+
+    @Utils.user
+    @api_logger(logger)
+    def issue_books_by_user(self):
+        try:
+            user_id = g.get('user_id')
+            if not user_id:
+                self.logger.error(INVALID_TOKEN)
+                return Response.response(INVALID_TOKEN,Status.FAIL.value,INVALID_CREDENTIALS),401
+
+            try:
+                data = BatchIssueBookDTO(**(request.get_json(silent=True) or {}))
+            except ValidationError as e:
+                self.logger.error(f"Validation Error: {e.json()}")
+                return Response.response(INVALID_REQUEST_BODY,Status.FAIL.value,INVALID_REQUEST_BODY_FORMAT),422
+
+            borrow_date = datetime.now().date()
+            issued_books = [
+                IssuedBooks(user_id=user_id,book_id=item.book_id,borrow_date=borrow_date,return_date=item.return_date)
+                for item in data.items
+            ]
+            all_or_nothing = data.mode == "all_or_nothing"
+            results = self.issue_book_service.issue_books(issued_books,all_or_nothing)
+            return self._batch_response(results,BOOKS_ISSUED_SUCCESSFULLY,all_or_nothing)
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(SOMETHING_WENT_WRONG, Status.FAIL.value, UNEXPECTED_ERROR), 500
+
+    @Utils.user
+    @api_logger(logger)
+    def return_books_by_user(self):
+        try:
+            user_id = g.get('user_id')
+            if not user_id:
+                self.logger.error(INVALID_TOKEN)
+                return Response.response(INVALID_TOKEN, Status.FAIL.value, INVALID_CREDENTIALS), 401
+
+            try:
+                data = BatchReturnBookDTO(**(request.get_json(silent=True) or {}))
+            except ValidationError as e:
+                self.logger.error(f"Validation Error: {e.json()}")
+                return Response.response(INVALID_REQUEST_BODY,Status.FAIL.value,INVALID_REQUEST_BODY_FORMAT),422
+
+            all_or_nothing = data.mode == "all_or_nothing"
+            results = self.issue_book_service.return_issue_books(user_id,data.book_ids,all_or_nothing)
+            return self._batch_response(results,BOOKS_RETURNED_SUCCESSFULLY,all_or_nothing)
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e),Status.FAIL.value,DB_ERROR),500
+
+    @Utils.admin
+    @api_logger(logger)
+    def export_issued_books(self):
+        """
+        Stream the circulation history as NDJSON or CSV (`?format=`), optionally filtered by
+        `start_date`/`end_date` (borrow date, inclusive), `user_id` and `book_id`.
+        """
+        try:
+            try:
+                data = IssuedBookExportDTO(**request.args.to_dict())
+            except ValidationError as e:
+                self.logger.error(f"Validation Error: {e.json()}")
+                return Response.response(INVALID_REQUEST_BODY,Status.FAIL.value,VALIDATION_FAILURE),422
+
+            chunks = self.issue_book_service.export_issued_books(
+                data.format,data.start_date,data.end_date,data.user_id,data.book_id
+            )
+            response = current_app.response_class(stream_with_context(chunks),mimetype=EXPORT_MIMETYPES[data.format])
+            response.headers["Content-Disposition"] = f'attachment; filename="circulation.{data.format}"'
+            self.logger.info(ISSUE_BOOK_EXPORT_STARTED)
+            return response
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e),Status.FAIL.value,UNEXPECTED_ERROR),500
+
     @api_logger(logger)
     def get_issued_books(self):
         role = g.get('role')
@@ -94,7 +185,7 @@ class IssueBookHandler:
                 return Response.response(
                     ISSUE_BOOK_FETCH_SUCCESSFULLY,
                     Status.SUCCESS.value,
-                    data=[issued_book.__dict__ for issued_book in issued_books] if issued_books else []
+                    data=[issued_book.to_dict() for issued_book in issued_books] if issued_books else []
                 ),200
 
             except Exception as e:
@@ -110,7 +201,7 @@ class IssueBookHandler:
                     return Response.response(
                         ISSUE_BOOK_FETCH_SUCCESSFULLY,
                         Status.SUCCESS.value,
-                        data=[issued_book.__dict__ for issued_book in issued_books] if issued_books else []
+                        data=[issued_book.to_dict() for issued_book in issued_books] if issued_books else []
                     ), 200
                 except Exception as e:
                     self.logger.error(str(e))
@@ -118,13 +209,18 @@ class IssueBookHandler:
 
             else:
                 try:
-                    issued_books = self.issue_book_service.get_all_issued_books()
+                    limit = parse_limit(request.args.get('limit'))
+                    page = self.issue_book_service.get_all_issued_books(limit, request.args.get('cursor'))
                     self.logger.info(ISSUE_BOOK_FETCH_SUCCESSFULLY)
                     return Response.response(
                         ISSUE_BOOK_FETCH_SUCCESSFULLY,
                         Status.SUCCESS.value,
-                        data=[issued_book.__dict__ for issued_book in issued_books] if issued_books else []
+                        data=[issued_book.to_dict() for issued_book in page.items] if page.items else [],
+                        pagination=page.meta()
                     ), 200
+                except InvalidRequestBody as e:
+                    self.logger.error(str(e))
+                    return Response.response(str(e), Status.FAIL.value, VALIDATION_FAILURE), 422
                 except Exception as e:
                     self.logger.error(str(e))
                     return Response.response(str(e), Status.FAIL.value, UNEXPECTED_ERROR), 500
\ No newline at end of file
@@ -1,11 +1,14 @@
 from flask import Blueprint, request, jsonify
 from src.app.controller.issue_book.handler import IssueBookHandler
+from src.app.middleware.conditional_get import ConditionalGet
 from src.app.middleware.middleware import auth_middleware
 from src.app.services.issue_book_service import IssueBookService
 
-def create_issue_book_route(issue_book_service:IssueBookService) -> Blueprint:
+def create_issue_book_route(issue_book_service:IssueBookService,conditional_get:ConditionalGet=None) -> Blueprint:
     issue_book_routes_blueprint = Blueprint('issue_book_route', __name__)
     issue_book_routes_blueprint.before_request(auth_middleware)
+    if conditional_get:
+        conditional_get.register(issue_book_routes_blueprint)
     issue_book_handler = IssueBookHandler.create(issue_book_service)
 
     issue_book_routes_blueprint.add_url_rule(
@@ -15,6 +18,20 @@ def create_issue_book_route(issue_book_service:IssueBookService) -> Blueprint:
         methods=['POST']
     )
 
+    issue_book_routes_blueprint.add_url_rule(
+        '/issue-book/batch',
+        'issue-books',
+        issue_book_handler.issue_books_by_user,
+        methods=['POST']
+    )
+
+    issue_book_routes_blueprint.add_url_rule(
+        '/return-book/batch',
+        'return-books',
+        issue_book_handler.return_books_by_user,
+        methods=['PATCH']
+    )
+
     issue_book_routes_blueprint.add_url_rule(
         '/return-book/<book_id>',
         'return-book',
@@ -22,6 +39,13 @@ def create_issue_book_route(issue_book_service:IssueBookService) -> Blueprint:
         methods=['PATCH']
     )
 
+    issue_book_routes_blueprint.add_url_rule(
+        '/issue-book/export',
+        'export-issue-book',
+        issue_book_handler.export_issued_books,
+        methods=['GET']
+    )
+
     issue_book_routes_blueprint.add_url_rule(
         '/issue-book',
         'get-issue-book',
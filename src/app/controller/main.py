@@ -1,28 +1,101 @@
 from flask import Flask
 
+from src.app.controller.admin.route import create_admin_route
 from src.app.controller.book.route import create_book_route
 from src.app.controller.user.route import create_user_routes
 from src.app.controller.issue_book.route import create_issue_book_route
+from src.app.controller.search.route import create_search_route
+from src.app.middleware.conditional_get import ConditionalGet
+from src.app.middleware.metrics import RequestMetrics
+from src.app.middleware.middleware import verified_token_cache
+from src.app.middleware.request_id import assign_request_id, echo_request_id, release_request_id
 from src.app.repositories.user_repository import UserRepository
 from src.app.repositories.issued_book_repository import IssuedBookRepository
 from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.search_repository import SearchRepository
+from src.app.repositories.cached_books_repository import CachedBooksRepository
+from src.app.repositories.coalescing_books_repository import CoalescingBooksRepository
 from src.app.services.issue_book_service import IssueBookService
 from src.app.services.book_service import BookService
 from src.app.services.user_service import UserService
+from src.app.services.search_service import SearchService
+from src.app.services.catalog_snapshot import CatalogSnapshot
+from src.app.utils.cache.cache import LRUCache
 from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.db.query import GenericQueryBuilder
+from src.app.utils.db.slow_query_log import SlowQueryLog
+from src.app.utils.json_provider import install_json_provider
+from src.app.utils.logger.logger import Logger
+from src.app.utils.metrics.registry import MetricsRegistry
+from src.app.utils.password_hasher import PasswordHasher
+import src.app.config.config as config
+
+def report_db_settings(app: Flask, db: DB):
+    """Log the SQLite settings in effect and warn about any that SQLite ignored."""
+    logger = Logger()
+    with app.app_context():
+        report = db.check_pragmas()
+        for name, result in report.items():
+            if not result["applied"]:
+                logger.warning(f"PRAGMA {name}: requested {result['requested']}, effective {result['effective']}")
+        logger.info("SQLite settings in effect: " +
+                    ", ".join(f"{name}={result['effective']}" for name, result in report.items()))
+    return report
+
+# Monotonic LRUCache.stats() keys, exported as counters rather than gauges
+CACHE_COUNTERS = ("hits", "negative_hits", "misses", "evictions", "expirations", "invalidations")
+
 
 def create_app():
     app = Flask(__name__)
-
+    install_json_provider(app, config.JSON_PROVIDER)
     db = DB()
+    metrics = MetricsRegistry()
+    if config.METRICS_ENABLED:
+        request_metrics = RequestMetrics(metrics, db)
+        request_metrics.register(app)
+        app.register_blueprint(request_metrics.create_route(config.METRICS_REQUIRE_ADMIN))
+    app.before_request(assign_request_id)
+    app.after_request(echo_request_id)
+    app.teardown_request(release_request_id)
+
+    report_db_settings(app, db)
+    apply_migrations(db)
 
     user_repository = UserRepository(db)
     issue_book_repository = IssuedBookRepository(db)
     book_repository = BooksRepository(db)
+    search_repository = SearchRepository(db)
+    catalog_snapshot = CatalogSnapshot(book_repository) if config.CATALOG_SNAPSHOT_ENABLED else None
+    if config.BOOK_LOOKUP_COALESCING_ENABLED:
+        book_repository = CoalescingBooksRepository(book_repository)
+        metrics.register_stats("book_lookup_coalescing", book_repository.stats,
+                               counters=("calls", "executions", "collapsed"))
+    if config.CATALOG_CACHE_ENABLED:
+        book_repository = CachedBooksRepository(
+            book_repository,
+            LRUCache(config.CATALOG_CACHE_MAX_ENTRIES, config.CATALOG_CACHE_TTL),
+            config.CATALOG_CACHE_NEGATIVE_TTL
+        )
+        metrics.register_stats("catalog_cache", book_repository.stats, counters=CACHE_COUNTERS)
 
-    user_service = UserService(user_repository)
+    password_hasher = PasswordHasher(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_QUEUE_SIZE,
+                                     config.PASSWORD_HASH_ROUNDS)
+    metrics.register_stats("db_pool", db.stats,
+                           counters=("checkouts", "timeouts", "created", "recycled", "failed_health_checks"))
+    metrics.register_stats("query_builder", GenericQueryBuilder.stats, counters=("hits", "misses"))
+    metrics.register_stats("logger", Logger().stats, counters=("queued", "dropped", "batches", "written"))
+    metrics.register_stats("password_hasher", password_hasher.stats, counters=("completed", "rejected"))
+    if config.AUTH_TOKEN_CACHE_ENABLED:
+        metrics.register_stats("auth_token_cache", verified_token_cache.stats, counters=CACHE_COUNTERS)
+    user_service = UserService(user_repository,password_hasher)
     book_service = BookService(book_repository)
     issue_book_service = IssueBookService(issue_book_repository,book_repository)
+    search_service = SearchService(search_repository)
+
+    book_conditional_get = ConditionalGet(db,"book") if config.CONDITIONAL_GET_ENABLED else None
+    issue_book_conditional_get = ConditionalGet(db,"issuedBook") if config.CONDITIONAL_GET_ENABLED else None
 
     app.register_blueprint(
         create_user_routes(user_service),
@@ -30,14 +103,27 @@ def create_app():
     )
 
     app.register_blueprint(
-        create_issue_book_route(issue_book_service),
+        create_issue_book_route(issue_book_service,issue_book_conditional_get),
         url_prefix='/book'
     )
 
     app.register_blueprint(
-        create_book_route(book_service)
+        create_book_route(book_service,catalog_snapshot,book_conditional_get)
 
     )
+
+    app.register_blueprint(
+        create_search_route(search_service)
+    )
+
+    if config.SLOW_QUERY_LOG_ENABLED:
+        slow_query_log = SlowQueryLog(db, config.SLOW_QUERY_THRESHOLD_MS, config.SLOW_QUERY_BUFFER_SIZE,
+                                      config.SLOW_QUERY_EXPLAIN, log_file=config.SLOW_QUERY_LOG_FILE)
+        metrics.register_stats("slow_queries", slow_query_log.stats, counters=("recorded",))
+        app.register_blueprint(
+            create_admin_route(slow_query_log)
+        )
+
     @app.route('/')
     def index():
         return "Health Good"
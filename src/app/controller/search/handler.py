@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from flask import request
+
+from src.app.config.enumeration import Status
+from src.app.config.messages import *
+from src.app.config.custome_error_code import *
+from src.app.model.responses import Response
+from src.app.services.search_service import SearchService
+from src.app.utils.errors.error import *
+from src.app.utils.logger.logger import Logger
+from src.app.utils.logger.api_logger import api_logger
+from src.app.utils.pagination import parse_limit
+import src.app.config.config as config
+
+
+@dataclass
+class SearchHandler:
+    search_service: SearchService
+    logger = Logger()
+
+    @classmethod
+    def create(cls,search_service: SearchService):
+        return cls(search_service)
+
+    @api_logger(logger)
+    def search_books(self):
+        try:
+            text = request.args.get('q', '')
+            limit = parse_limit(request.args.get('limit', str(config.SEARCH_LIMIT_DEFAULT)))
+            prefix = request.args.get('prefix', 'false').lower() in ('1', 'true', 'yes')
+
+            results = self.search_service.search_books(text, limit, prefix)
+            self.logger.info(BOOK_SEARCH_SUCCESSFULLY)
+            return Response.response(BOOK_SEARCH_SUCCESSFULLY, Status.SUCCESS.value,
+                                     data=[result.to_dict() for result in results] if results else []), 200
+
+        except InvalidRequestBody as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, VALIDATION_FAILURE), 422
+
+        except Exception as e:
+            self.logger.error(str(e))
+            return Response.response(str(e), Status.FAIL.value, UNEXPECTED_ERROR), 500
@@ -0,0 +1,20 @@
+from flask import Blueprint
+
+from src.app.controller.search.handler import SearchHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.services.search_service import SearchService
+
+
+def create_search_route(search_service:SearchService) -> Blueprint:
+    search_route_blueprint = Blueprint('search_route', __name__)
+    search_route_blueprint.before_request(auth_middleware)
+    search_handler = SearchHandler.create(search_service)
+
+    search_route_blueprint.add_url_rule(
+        '/user/book/search',
+        "search-book",
+        search_handler.search_books,
+        methods=['GET']
+    )
+
+    return search_route_blueprint
@@ -4,10 +4,11 @@ from dataclasses import dataclass
 
 from src.app.config.enumeration import Status
 from src.app.config.messages import *
-from src.app.config.custome_error_code import VALIDATION_FAILURE, UNEXPECTED_ERROR
+from src.app.config.custome_error_code import VALIDATION_FAILURE, UNEXPECTED_ERROR, TOO_MANY_REQUESTS
 from src.app.model.responses import Response
 from src.app.model.user import User
 from src.app.services.user_service import UserService
+from src.app.utils.errors.error import HashingBusyError
 from src.app.utils.logger.api_logger import api_logger
 from src.app.utils.utils import Utils
 from src.app.utils.validators.validators import Validators
@@ -23,6 +24,11 @@ class UserHandler:
     def create(cls, user_service):
         return cls(user_service)
 
+    @staticmethod
+    def _busy_response(e: HashingBusyError):
+        return (Response.response(str(e), Status.FAIL.value, TOO_MANY_REQUESTS), 429,
+                {"Retry-After": str(e.retry_after)})
+
     @api_logger(logger)
     def login(self):
         request_body = request.get_json()
@@ -36,6 +42,8 @@ class UserHandler:
 
             token = Utils.create_jwt_token(user.id, user.role)
             return Response.response(TOKEN_GENERATE_SUCCESSFULLY,Status.SUCCESS.value,data={'token': token, 'role': user.role}),200
+        except HashingBusyError as e:
+            return self._busy_response(e)
         except Exception as e:
             return Response.response(str(e),Status.FAIL.value,UNEXPECTED_ERROR),400
 
@@ -69,6 +77,7 @@ class UserHandler:
             return Response.response(TOKEN_GENERATE_SUCCESSFULLY, Status.SUCCESS.value,
                                      data={'token': token, 'role': user.role}), 200
 
-
+        except HashingBusyError as e:
+            return self._busy_response(e)
         except Exception as e:
             return Response.response(str(e),Status.FAIL.value,UNEXPECTED_ERROR),400
\ No newline at end of file
@@ -1,6 +1,9 @@
 from datetime import date
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+import src.app.config.config as config
 
 
 class BaseRequestModel(BaseModel):
@@ -13,3 +16,32 @@ class BaseRequestModel(BaseModel):
 class IssueBookDTO(BaseRequestModel):
     book_id: str = Field(..., description="The ID of the book to be issued")
     return_date: date = Field(..., description="The date the book is to be returned (YYYY-MM-DD)")
+
+
+BATCH_MODES = Literal["all_or_nothing", "partial"]
+
+
+class BatchIssueBookDTO(BaseRequestModel):
+    items: List[IssueBookDTO] = Field(..., min_length=1, max_length=config.BATCH_MAX_ITEMS,
+                                      description="Books to issue")
+    mode: BATCH_MODES = Field("all_or_nothing", description="Write nothing if any item fails, or write what succeeds")
+
+
+class BatchReturnBookDTO(BaseRequestModel):
+    book_ids: List[str] = Field(..., min_length=1, max_length=config.BATCH_MAX_ITEMS,
+                                description="IDs of the books to return")
+    mode: BATCH_MODES = Field("all_or_nothing", description="Write nothing if any item fails, or write what succeeds")
+
+
+class IssuedBookExportDTO(BaseRequestModel):
+    format: Literal["ndjson", "csv"] = Field("ndjson", description="Output format")
+    start_date: Optional[date] = Field(None, description="Earliest borrow date to include (YYYY-MM-DD)")
+    end_date: Optional[date] = Field(None, description="Latest borrow date to include (YYYY-MM-DD)")
+    user_id: Optional[str] = Field(None, description="Only this user's issues")
+    book_id: Optional[str] = Field(None, description="Only issues of this book")
+
+    @model_validator(mode="after")
+    def check_date_range(self):
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        return self
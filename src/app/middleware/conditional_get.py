@@ -0,0 +1,73 @@
+import hashlib
+from datetime import datetime, timezone
+
+from flask import Blueprint, current_app, g, request
+
+from src.app.utils.db.db import DB
+
+
+class ConditionalGet:
+    """
+    Conditional GET for a blueprint whose GET responses depend only on `tables`.
+
+    The validator is built from the tables' change counters in the database
+    (the table_version rows its triggers keep, so writes by other workers,
+    scripts or manual edits move it too) plus what the response depends on
+    (path, query string, user and role). Deciding on a 304 costs one
+    primary-key read and a short hash instead of running the handler.
+    Register it after auth_middleware so the user is known.
+    """
+
+    def __init__(self, db: DB, *tables: str):
+        self.db = db
+        self.tables = tables
+
+    def register(self, blueprint: Blueprint):
+        blueprint.before_request(self.before_request)
+        blueprint.after_request(self.after_request)
+
+    def _validators(self):
+        versions = self.db.table_versions(*self.tables).values()
+        request_key = "|".join((
+            request.path,
+            request.query_string.decode("latin-1"),
+            str(g.get("user_id")),
+            str(g.get("role")),
+        ))
+        digest = hashlib.blake2b(request_key.encode("utf-8"), digest_size=8).hexdigest()
+        # The change time (ms) alongside each counter keeps ETags apart if a database is restored or recreated
+        etag = "-".join([*(f"{version}.{int(modified_at * 1000)}" for version, modified_at in versions), digest])
+        last_modified = datetime.fromtimestamp(max(modified_at for _, modified_at in versions), tz=timezone.utc)
+        return etag, last_modified
+
+    @staticmethod
+    def _not_modified(etag) -> bool:
+        # Only the ETag decides: Last-Modified has whole-second resolution, so an
+        # If-Modified-Since 304 could hide a write made later in the same second
+        return bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+
+    def before_request(self):
+        if request.method != "GET":
+            return None
+        etag, last_modified = self._validators()
+        g.conditional_get_validators = (etag, last_modified)
+        if self._not_modified(etag):
+            response = current_app.response_class(status=304)
+            self._set_headers(response, etag, last_modified)
+            return response
+        return None
+
+    def after_request(self, response):
+        validators = g.get("conditional_get_validators")
+        # Responses that already carry their own validator (e.g. the catalog snapshot) keep it
+        if validators and response.status_code == 200 and "ETag" not in response.headers:
+            self._set_headers(response, *validators)
+        return response
+
+    @staticmethod
+    def _set_headers(response, etag, last_modified):
+        response.set_etag(etag, weak=True)
+        response.last_modified = last_modified
+        # Responses are per user, and clients must revalidate before reusing them
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.vary.add("Authorization")
@@ -0,0 +1,91 @@
+import time
+
+from flask import Blueprint, Flask, current_app, g, has_request_context, request
+
+from src.app.middleware.middleware import auth_middleware
+from src.app.utils.db.db import DB
+from src.app.utils.metrics.registry import MetricsRegistry
+from src.app.utils.utils import Utils
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Statements per request
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _endpoint() -> str:
+    return request.endpoint or "unmatched"
+
+
+class RequestMetrics:
+    """
+    App-wide request instrumentation: latency by endpoint, SQL statements and the
+    time spent in them by endpoint (fed by the DB's query listeners), and error
+    responses by their custome_error_code. Register it before the other hooks so
+    the latency covers them.
+    """
+
+    def __init__(self, registry: MetricsRegistry, db: DB):
+        self.registry = registry
+        self.requests = registry.counter("http_requests_total", "Requests by endpoint, method and status.",
+                                         ("endpoint", "method", "status"))
+        self.latency = registry.histogram("http_request_duration_seconds",
+                                          "Time to produce a response, by endpoint.", ("endpoint", "method"))
+        self.queries = registry.counter("db_queries_total", "SQL statements run, by endpoint.", ("endpoint",))
+        self.query_seconds = registry.counter("db_query_seconds_total",
+                                              "Time spent executing SQL statements, by endpoint.", ("endpoint",))
+        self.queries_per_request = registry.histogram("db_queries_per_request", "SQL statements run per request.",
+                                                      ("endpoint",), QUERY_COUNT_BUCKETS)
+        self.errors = registry.counter("errors_total", "Error responses by error code and endpoint.",
+                                       ("error_code", "endpoint"))
+        db.add_query_listener(self.query_executed)
+
+    def register(self, app: Flask):
+        app.before_request(self.before_request)
+        app.after_request(self.after_request)
+
+    def before_request(self):
+        g.metrics_started = time.perf_counter()
+        g.metrics_queries = 0
+
+    def query_executed(self, sql, parameters, seconds):
+        # Statements outside a request (startup, CLI scripts) are counted under "none"
+        endpoint = "none"
+        if has_request_context():
+            endpoint = _endpoint()
+            g.metrics_queries = g.get("metrics_queries", 0) + 1
+        self.queries.inc(endpoint=endpoint)
+        self.query_seconds.inc(seconds, endpoint=endpoint)
+
+    def after_request(self, response):
+        started = g.pop("metrics_started", None)
+        if started is None:
+            return response
+        endpoint = _endpoint()
+        status = response.status_code
+        self.requests.inc(endpoint=endpoint, method=request.method, status=status)
+        # Streamed bodies (the circulation export) are timed up to the first byte
+        self.latency.observe(time.perf_counter() - started, endpoint=endpoint, method=request.method)
+        self.queries_per_request.observe(g.get("metrics_queries", 0), endpoint=endpoint)
+        if status >= 400:
+            self.errors.inc(error_code=self._error_code(response), endpoint=endpoint)
+        return response
+
+    @staticmethod
+    def _error_code(response) -> str:
+        body = response.get_json(silent=True) if response.is_json and not response.is_streamed else None
+        code = body.get("error_code") if isinstance(body, dict) else None
+        return str(code) if code is not None else "none"
+
+    def metrics_view(self):
+        return current_app.response_class(self.registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+    def create_route(self, require_admin: bool = True) -> Blueprint:
+        """/metrics, behind the same bearer token and admin role as /admin/* unless `require_admin` is off."""
+        blueprint = Blueprint("metrics", __name__)
+        view = self.metrics_view
+        if require_admin:
+            blueprint.before_request(auth_middleware)
+            view = Utils.admin(view)
+        blueprint.add_url_rule("/metrics", "metrics", view, methods=["GET"])
+        return blueprint
@@ -6,6 +6,10 @@ from src.app.model.responses import Response
 from src.app.utils.utils import Utils
 from src.app.config.messages import *
 from src.app.config.custome_error_code import *
+from src.app.middleware.token_cache import VerifiedTokenCache
+import src.app.config.config as config
+
+verified_token_cache = VerifiedTokenCache(config.AUTH_TOKEN_CACHE_MAX_ENTRIES)
 
 
 def auth_middleware():
@@ -18,7 +22,10 @@ def auth_middleware():
 
     token = auth_token.split(' ')[1]
     try:
-        decoded_token = Utils.decode_jwt_token(token)
+        if config.AUTH_TOKEN_CACHE_ENABLED:
+            decoded_token = verified_token_cache.decode(token)
+        else:
+            decoded_token = Utils.decode_jwt_token(token)
 
         user_id = decoded_token.get("user_id")
         role = decoded_token.get("role")
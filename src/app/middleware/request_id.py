@@ -0,0 +1,21 @@
+from flask import g
+
+from src.app.utils.logger.request_id import REQUEST_ID_HEADER, new_request_id, request_id_var
+
+
+def assign_request_id():
+    g.request_id = new_request_id()
+    g.request_id_token = request_id_var.set(g.request_id)
+
+
+def echo_request_id(response):
+    request_id = g.get("request_id")
+    if request_id:
+        response.headers[REQUEST_ID_HEADER] = request_id
+    return response
+
+
+def release_request_id(exception=None):
+    token = g.pop("request_id_token", None)
+    if token is not None:
+        request_id_var.reset(token)
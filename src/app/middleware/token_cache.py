@@ -0,0 +1,43 @@
+import hashlib
+import time
+
+from src.app.utils.cache.cache import LRUCache, MISSING
+from src.app.utils.utils import Utils
+
+
+class VerifiedTokenCache:
+    """
+    Claims of JWTs that already passed signature verification, keyed by a digest
+    of the token so raw tokens are never kept in memory.
+
+    An entry lives until the token's `exp` and is re-checked against the clock
+    on every hit, so an expired token is always sent back through
+    `Utils.decode_jwt_token` and rejected there. Tokens without `exp` are
+    never cached.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.cache = LRUCache(max_entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def decode(self, token: str) -> dict:
+        key = self._key(token)
+        claims = self.cache.get(key)
+        if claims is not MISSING and time.time() < claims["exp"]:
+            return dict(claims)
+
+        claims = Utils.decode_jwt_token(token)
+        exp = claims.get("exp")
+        now = time.time()
+        if isinstance(exp, (int, float)) and exp > now:
+            self.cache.set(key, dict(claims), exp - now)
+        return claims
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
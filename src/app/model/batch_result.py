@@ -0,0 +1,18 @@
+class BatchItemResult:
+    """Outcome of one item of a batch issue/return request."""
+
+    ISSUED = "issued"
+    RETURNED = "returned"
+    FAILED = "failed"
+    ABORTED = "aborted"  # would have succeeded, but another item failed in all-or-nothing mode
+
+    __slots__ = ("book_id","status","error","issue_id")
+
+    def __init__(self,book_id,status,error=None,issue_id=None):
+        self.book_id = book_id
+        self.status = status
+        self.error = error
+        self.issue_id = issue_id
+
+    def to_dict(self) -> dict:
+        return {"book_id":self.book_id,"status":self.status,"error":self.error,"issue_id":self.issue_id}
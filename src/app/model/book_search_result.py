@@ -0,0 +1,17 @@
+class BookSearchResult:
+    __slots__ = ("id","title","author","no_of_copies","no_of_available","title_snippet","author_snippet","rank")
+
+    def __init__(self,id,title,author,no_of_copies,no_of_available,title_snippet,author_snippet,rank):
+        self.id = id
+        self.title = title
+        self.author = author
+        self.no_of_copies = no_of_copies
+        self.no_of_available = no_of_available
+        self.title_snippet = title_snippet
+        self.author_snippet = author_snippet
+        self.rank = rank
+
+    def to_dict(self) -> dict:
+        return {"id":self.id,"title":self.title,"author":self.author,"no_of_copies":self.no_of_copies,
+                "no_of_available":self.no_of_available,"title_snippet":self.title_snippet,
+                "author_snippet":self.author_snippet,"rank":self.rank}
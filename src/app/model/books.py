@@ -2,9 +2,23 @@ import uuid
 
 
 class Books:
+    # Slotted: no per-instance __dict__, which matters when a page or export holds many books
+    __slots__ = ("id","title","author","no_of_copies","no_of_available")
+
     def __init__(self,title,author,no_of_copies=1,no_of_available=1,id=None):
         self.id = id if id else str(uuid.uuid4())
         self.title = title
         self.author = author
         self.no_of_copies = no_of_copies
-        self.no_of_available = no_of_available
\ No newline at end of file
+        self.no_of_available = no_of_available
+
+    @classmethod
+    def from_row(cls,row):
+        """Build from an (id, title, author, copies, available) row; skips __init__ and the uuid default."""
+        book = cls.__new__(cls)
+        book.id, book.title, book.author, book.no_of_copies, book.no_of_available = row
+        return book
+
+    def to_dict(self) -> dict:
+        return {"id":self.id,"title":self.title,"author":self.author,
+                "no_of_copies":self.no_of_copies,"no_of_available":self.no_of_available}
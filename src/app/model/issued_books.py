@@ -2,9 +2,22 @@ import uuid
 
 
 class IssuedBooks:
+    __slots__ = ("id","user_id","book_id","borrow_date","return_date")
+
     def __init__(self,user_id,book_id,borrow_date,return_date,id=None):
         self.id = id if id else str(uuid.uuid4())
         self.user_id = user_id
         self.book_id = book_id
         self.borrow_date = borrow_date
         self.return_date = return_date
+
+    @classmethod
+    def from_row(cls,row):
+        """Build from an (id, user_id, book_id, borrow_date, return_date) row; skips __init__ and the uuid default."""
+        issued_book = cls.__new__(cls)
+        issued_book.id, issued_book.user_id, issued_book.book_id, issued_book.borrow_date, issued_book.return_date = row
+        return issued_book
+
+    def to_dict(self) -> dict:
+        return {"id":self.id,"user_id":self.user_id,"book_id":self.book_id,
+                "borrow_date":self.borrow_date,"return_date":self.return_date}
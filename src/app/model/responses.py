@@ -1,9 +1,11 @@
 class Response:
     @staticmethod
-    def response(message:str,status:str,error_code:str=None,data:any=None):
+    def response(message:str,status:str,error_code:str=None,data:any=None,pagination:dict=None):
         response = {"status":status,"message":message}
         if error_code:
             response.update({"error_code":error_code})
         if data:
             response.update({"data":data})
+        if pagination:
+            response.update({"pagination":pagination})
         return response
\ No newline at end of file
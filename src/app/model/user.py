@@ -3,6 +3,8 @@ from src.app.config.enumeration import Role
 
 
 class User:
+    __slots__ = ("id","name","role","year","branch","email","password")
+
     def __init__(self,name,year,branch,email,password,id=None,role=None):
         self.id = id if id is not None else str(uuid.uuid4())
         self.name = name
@@ -12,3 +14,13 @@ class User:
         self.email = email
         self.password = password
 
+    @classmethod
+    def from_row(cls,row):
+        """Build from an (id, name, role, year, branch, email, password) row; skips __init__ and the uuid default."""
+        user = cls.__new__(cls)
+        user.id, user.name, user.role, user.year, user.branch, user.email, user.password = row
+        return user
+
+    def to_dict(self) -> dict:
+        return {"id":self.id,"name":self.name,"role":self.role,"year":self.year,
+                "branch":self.branch,"email":self.email,"password":self.password}
@@ -6,6 +6,9 @@ class BooksRepository:
     def __init__(self,db:DB) -> None:
         self.db = db
 
+    def transaction(self):
+        return self.db.transaction()
+
     def add_book(self,book:Books):
         try:
             conn = self.db.get_connection()
@@ -18,6 +21,7 @@ class BooksRepository:
                     "number_of_available_books":book.no_of_available
                 })
                 conn.execute(query,value)
+            self.db.notify_change("book",book.id)
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -31,6 +35,7 @@ class BooksRepository:
                     "author":book.author,
                 },{"id":book.id})
                 cursor.execute(query,value)
+            self.db.notify_change("book",book.id)
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -40,10 +45,12 @@ class BooksRepository:
             with conn:
                 query,value = GenericQueryBuilder.delete("book",{"id":book_id})
                 conn.execute(query,value)
+            self.db.notify_change("book",book_id)
         except Exception as e:
             raise DatabaseError(str(e))
 
-    def get_books(self,limit:int=100):
+    def get_books(self,limit:int=100,after_title:str=None):
+        """Catalog page ordered by title; pass the last title seen to get the next page."""
         try:
             conn = self.db.get_connection()
             with conn:
@@ -54,18 +61,13 @@ class BooksRepository:
                     "author",
                     "number_of_copies",
                     "number_of_available_books",
-                ],limit=limit)
+                ],order_by="title",limit=limit,after={"title":after_title} if after_title is not None else None)
                 if value:
                     cursor.execute(query,value)
                 else:
                     cursor.execute(query)
                 results = cursor.fetchall()
-                return [Books(id=row[0],
-                              title=row[1],
-                              author=row[2],
-                              no_of_copies=row[3],
-                              no_of_available=row[4]
-                              ) for row in results] if results else []
+                return [Books.from_row(row) for row in results] if results else []
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -84,7 +86,7 @@ class BooksRepository:
                 cursor.execute(query,value)
                 result = cursor.fetchone()
                 if result:
-                    return Books(id=result[0],title=result[1],author=result[2],no_of_copies=result[3],no_of_available=result[4])
+                    return Books.from_row(result)
                 else:
                     return None
         except Exception as e:
@@ -99,6 +101,103 @@ class BooksRepository:
                     "number_of_available_books":book.no_of_available,
                 },{"title":book.title})
                 conn.execute(query,value)
+            self.db.notify_change("book",book.id)
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def decrement_available_copies(self,book_id:str) -> bool:
+        """Take one copy off the shelf. Returns False if the book is missing or none are available."""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE book SET number_of_available_books = number_of_available_books - 1 "
+                    "WHERE id = ? AND number_of_available_books > 0",
+                    (book_id,)
+                )
+                changed = cursor.rowcount == 1
+            if changed:
+                self.db.notify_change("book",book_id)
+            return changed
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def increment_available_copies(self,book_id:str,count:int=1) -> bool:
+        """Put copies back on the shelf. Returns False if the book is missing."""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE book SET number_of_available_books = number_of_available_books + ? WHERE id = ?",
+                    (count,book_id)
+                )
+                changed = cursor.rowcount == 1
+            if changed:
+                self.db.notify_change("book",book_id)
+            return changed
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def get_available_copies(self,book_ids:list) -> dict:
+        """{book_id: available copies} for the given ids; missing books are left out."""
+        if not book_ids:
+            return {}
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                placeholders = ", ".join("?" for _ in book_ids)
+                rows = conn.execute(
+                    f"SELECT id, number_of_available_books FROM book WHERE id IN ({placeholders})",
+                    tuple(book_ids)
+                ).fetchall()
+                return {row[0]:row[1] for row in rows}
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def adjust_available_copies(self,deltas:dict) -> int:
+        """
+        Add `delta` to the available copies of each book in one UPDATE (negative to take copies
+        off the shelf). Books that would go below zero are left untouched; returns rows updated.
+        """
+        if not deltas:
+            return 0
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                # One statement for the whole set; a CASE keeps rowcount usable (sqlite3 reports -1 for WITH ... UPDATE)
+                delta = "CASE id " + " ".join("WHEN ? THEN ?" for _ in deltas) + " END"
+                delta_params = tuple(value for item in deltas.items() for value in item)
+                placeholders = ", ".join("?" for _ in deltas)
+                cursor = conn.execute(
+                    f"UPDATE book SET number_of_available_books = number_of_available_books + {delta} "
+                    f"WHERE id IN ({placeholders}) AND number_of_available_books + {delta} >= 0",
+                    (*delta_params,*deltas,*delta_params)
+                )
+                updated = cursor.rowcount
+            for book_id in deltas:
+                self.db.notify_change("book",book_id)
+            return updated
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def upsert_books(self,books:list) -> int:
+        """
+        Add books in one transaction: new titles are inserted, existing titles get the
+        copies added to their totals (what add_book does one at a time). Returns rows written.
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO book (id, title, author, number_of_copies, number_of_available_books) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(title) DO UPDATE SET "
+                    "number_of_copies = number_of_copies + excluded.number_of_copies, "
+                    "number_of_available_books = number_of_available_books + excluded.number_of_available_books",
+                    [(book.id,book.title,book.author,book.no_of_copies,book.no_of_available) for book in books]
+                )
+                # One change for the whole batch; listeners treat a missing id as "anything may have changed"
+                self.db.notify_change("book")
+            return len(books)
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -117,7 +216,7 @@ class BooksRepository:
                 cursor.execute(query,value)
                 result = cursor.fetchone()
                 if result:
-                    return Books(id=result[0],title=result[1],author=result[2],no_of_copies=result[3],no_of_available=result[4])
+                    return Books.from_row(result)
                 else:
                     return None
         except Exception as e:
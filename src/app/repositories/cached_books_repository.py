@@ -0,0 +1,140 @@
+import copy
+import threading
+from typing import Optional
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.utils.cache.cache import Cache, MISSING
+
+
+class CachedBooksRepository:
+    """
+    Read-through cache in front of BooksRepository with the same interface.
+
+    Single books are cached by id and by title, including negative entries for
+    lookups that found nothing. A book found by title is cached under its id as
+    well, so invalidating the id finds the title entry to drop, even after a rename. Catalog pages are keyed by a generation number
+    that every write bumps, so stale pages are never served and simply age out.
+    Invalidation runs after the write commits, and reads made inside an open
+    transaction bypass the cache so uncommitted rows are never cached.
+    """
+
+    def __init__(self,book_repository:BooksRepository,cache:Cache,negative_ttl:Optional[float]=None):
+        self.book_repository = book_repository
+        self.db = book_repository.db
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def __getattr__(self,name):
+        # Anything not cached here (e.g. transaction) goes straight to the repository
+        return getattr(self.book_repository,name)
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+    def _cacheable(self) -> bool:
+        return not self.db.in_transaction()
+
+    def _store(self,generation:int,key,value,ttl:Optional[float]=None):
+        # A write that committed while we were loading bumps the generation; caching
+        # what we loaded could then resurrect the row it just invalidated
+        with self._lock:
+            if generation != self._generation:
+                return
+            self.cache.set(key,value,ttl)
+            if key[0] == "title" and value is not None:
+                self.cache.set(("id",value.id),copy.copy(value),ttl)
+
+    def _lookup(self,key,load):
+        if not self._cacheable():
+            return load()
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return copy.copy(cached)
+        generation = self._generation
+        book = load()
+        if book is None:
+            self._store(generation,key,None,self.negative_ttl)
+        else:
+            self._store(generation,key,copy.copy(book))
+        return book
+
+    def get_book_by_id(self,id:str,limit:int=100):
+        return self._lookup(("id",id),lambda: self.book_repository.get_book_by_id(id,limit))
+
+    def get_book_by_title(self,title:str):
+        return self._lookup(("title",title),lambda: self.book_repository.get_book_by_title(title))
+
+    def get_books(self,limit:int=100,after_title:str=None):
+        if not self._cacheable():
+            return self.book_repository.get_books(limit,after_title)
+        generation = self._generation
+        key = ("page",generation,limit,after_title)
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return list(cached)
+        books = self.book_repository.get_books(limit,after_title)
+        self._store(generation,key,list(books))
+        return books
+
+    def invalidate(self,book_id:str=None,*titles:str):
+        """Drop everything cached about a book once the current write commits."""
+        def drop():
+            with self._lock:
+                self._generation += 1
+                # The cached book under its id carries the title it was cached under
+                cached = self.cache.delete(("id",book_id)) if book_id else MISSING
+                known_title = cached.title if cached not in (MISSING,None) else None
+                for title in {known_title,*titles}:
+                    if title:
+                        self.cache.delete(("title",title))
+        self.db.after_commit(drop)
+
+    def invalidate_all(self):
+        """Drop every cached book and page once the current write commits."""
+        def drop():
+            with self._lock:
+                self._generation += 1
+                self.cache.clear()
+        self.db.after_commit(drop)
+
+    def adjust_available_copies(self,deltas:dict) -> int:
+        updated = self.book_repository.adjust_available_copies(deltas)
+        for book_id in deltas:
+            self.invalidate(book_id)
+        return updated
+
+    def upsert_books(self,books:list) -> int:
+        written = self.book_repository.upsert_books(books)
+        self.invalidate_all()
+        return written
+
+    def add_book(self,book:Books):
+        self.book_repository.add_book(book)
+        self.invalidate(book.id,book.title)
+
+    def update_book(self,book:Books):
+        self.book_repository.update_book(book)
+        self.invalidate(book.id,book.title)
+
+    def delete_book(self,book_id:str):
+        self.book_repository.delete_book(book_id)
+        self.invalidate(book_id)
+
+    def update_book_availability(self,book:Books):
+        self.book_repository.update_book_availability(book)
+        self.invalidate(book.id,book.title)
+
+    def decrement_available_copies(self,book_id:str) -> bool:
+        changed = self.book_repository.decrement_available_copies(book_id)
+        if changed:
+            self.invalidate(book_id)
+        return changed
+
+    def increment_available_copies(self,book_id:str,count:int=1) -> bool:
+        changed = self.book_repository.increment_available_copies(book_id,count)
+        if changed:
+            self.invalidate(book_id)
+        return changed
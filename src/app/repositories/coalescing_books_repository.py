@@ -0,0 +1,51 @@
+import copy
+import threading
+
+from src.app.repositories.books_repository import BooksRepository
+from src.app.utils.cache.single_flight import SingleFlight
+
+
+class CoalescingBooksRepository:
+    """
+    Single-flight layer in front of BooksRepository's lookups by id and title.
+
+    Concurrent request threads asking for the same book share one SELECT;
+    each waiting caller gets its own copy of the book. Reads made inside an
+    open transaction are never coalesced, since they may need to see that
+    transaction's own writes. Each flight is tagged with the number of book
+    writes committed when it started: a caller arriving after a write starts
+    a new flight rather than joining one that may have read the old row.
+    """
+
+    def __init__(self,book_repository:BooksRepository,single_flight:SingleFlight=None):
+        self.book_repository = book_repository
+        self.db = book_repository.db
+        self.single_flight = single_flight or SingleFlight()
+        self._lock = threading.Lock()
+        self._generation = 0
+        # BooksRepository reports a write before a cache in front of us queues its invalidation,
+        # so on commit the generation moves on before that cache accepts a new load
+        self.db.subscribe("book",self._book_changed)
+
+    def __getattr__(self,name):
+        # Writes and everything else go straight to the repository
+        return getattr(self.book_repository,name)
+
+    def stats(self) -> dict:
+        return self.single_flight.stats()
+
+    def _book_changed(self,table:str,row_id:str):
+        with self._lock:
+            self._generation += 1
+
+    def _coalesce(self,key,load):
+        if self.db.in_transaction():
+            return load()
+        book, shared = self.single_flight.do((self._generation,*key),load)
+        return copy.copy(book) if shared else book
+
+    def get_book_by_id(self,id:str,limit:int=100):
+        return self._coalesce(("id",id,limit),lambda: self.book_repository.get_book_by_id(id,limit))
+
+    def get_book_by_title(self,title:str):
+        return self._coalesce(("title",title),lambda: self.book_repository.get_book_by_title(title))
@@ -6,6 +6,9 @@ class IssuedBookRepository:
     def __init__(self,db:DB):
         self.db = db
 
+    def transaction(self):
+        return self.db.transaction()
+
     def save_issue_book(self,issue_book:IssuedBooks):
         try:
             conn = self.db.get_connection()
@@ -18,10 +21,63 @@ class IssuedBookRepository:
                     "return_date":issue_book.return_date,
                 })
                 conn.execute(query,value)
+            self.db.notify_change("issuedBook",issue_book.id)
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def save_issue_books(self,issue_books:list):
+        """Insert several issue records with one executemany."""
+        if not issue_books:
+            return
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO issuedBook (id, user_id, book_id, borrow_date, return_date) VALUES (?, ?, ?, ?, ?)",
+                    [(issue_book.id,issue_book.user_id,issue_book.book_id,issue_book.borrow_date,issue_book.return_date)
+                     for issue_book in issue_books]
+                )
+            self.db.notify_change("issuedBook")
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def count_issued_books(self,user_id:str,book_ids:list) -> dict:
+        """{book_id: number of copies the user holds} for the given books; books not held are left out."""
+        if not book_ids:
+            return {}
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                placeholders = ", ".join("?" for _ in book_ids)
+                rows = conn.execute(
+                    f"SELECT book_id, COUNT(*) FROM issuedBook WHERE user_id = ? AND book_id IN ({placeholders}) "
+                    "GROUP BY book_id",
+                    (user_id,*book_ids)
+                ).fetchall()
+                return {row[0]:row[1] for row in rows}
         except Exception as e:
             raise DatabaseError(str(e))
 
-    def remove_issue_book(self,user_id:str,book_id:str):
+    def remove_issue_books(self,user_id:str,book_ids:list) -> int:
+        """Delete the user's issue records for all the given books in one statement."""
+        if not book_ids:
+            return 0
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                placeholders = ", ".join("?" for _ in book_ids)
+                removed = conn.execute(
+                    f"DELETE FROM issuedBook WHERE user_id = ? AND book_id IN ({placeholders})",
+                    (user_id,*book_ids)
+                ).rowcount
+            if removed:
+                self.db.notify_change("issuedBook")
+            return removed
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def remove_issue_book(self,user_id:str,book_id:str) -> int:
+        """Delete the user's issue records for the book and return how many were removed."""
         try:
             conn = self.db.get_connection()
             with conn:
@@ -29,11 +85,45 @@ class IssuedBookRepository:
                     "user_id":user_id,
                     "book_id":book_id,
                 })
-                conn.execute(query,value)
+                removed = conn.execute(query,value).rowcount
+            if removed:
+                self.db.notify_change("issuedBook")
+            return removed
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def iter_issue_book_rows(self,start_date:str=None,end_date:str=None,user_id:str=None,book_id:str=None,
+                             chunk_size:int=1000):
+        """
+        Yield issue records matching the filters as lists of at most `chunk_size` rows
+        (id, user_id, book_id, borrow_date, return_date), read with fetchmany in borrow_date
+        order. Dates bound borrow_date inclusively. The connection stays checked out until
+        the generator is exhausted or closed.
+        """
+        conditions, values = [], []
+        for column, operator, value in (("borrow_date",">=",start_date),("borrow_date","<=",end_date),
+                                        ("user_id","=",user_id),("book_id","=",book_id)):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                values.append(value)
+        query = "SELECT id, user_id, book_id, borrow_date, return_date FROM issuedBook"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY borrow_date, id"
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.execute(query,tuple(values))
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        return
+                    yield rows
         except Exception as e:
             raise DatabaseError(str(e))
 
-    def get_issue_books(self,limit:int=100):
+    def get_issue_books(self,limit:int=100,after_id:str=None):
+        """Issued books page ordered by id; pass the last id seen to get the next page."""
         try:
             conn = self.db.get_connection()
             with conn:
@@ -44,13 +134,10 @@ class IssuedBookRepository:
                     "book_id",
                     "borrow_date",
                     "return_date",
-                ],limit=limit)
+                ],order_by="id",limit=limit,after={"id":after_id} if after_id is not None else None)
                 cursor.execute(query,value)
                 results = cursor.fetchall()
-                return [
-                    IssuedBooks(id=row[0],user_id=row[1],book_id=row[2],borrow_date=row[3],return_date=row[4])
-                    for row in results
-                ] if results else []
+                return [IssuedBooks.from_row(row) for row in results] if results else []
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -68,10 +155,7 @@ class IssuedBookRepository:
                 ],{"user_id":user_id})
                 cursor.execute(query,value)
                 results = cursor.fetchall()
-                return [
-                    IssuedBooks(id=row[0],user_id=row[1],book_id=row[2],borrow_date=row[3],return_date=row[4])
-                    for row in results
-                ] if results else []
+                return [IssuedBooks.from_row(row) for row in results] if results else []
         except Exception as e:
             raise DatabaseError(str(e))
 
@@ -0,0 +1,59 @@
+import re
+from typing import List
+
+from src.app.model.book_search_result import BookSearchResult
+from src.app.utils.db.db import DB
+from src.app.utils.errors.error import DatabaseError
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Title matches count for more than author matches
+_SEARCH_QUERY = (
+    "SELECT b.id, b.title, b.author, b.number_of_copies, b.number_of_available_books, "
+    "snippet(book_fts, 0, ?, ?, '…', 16), snippet(book_fts, 1, ?, ?, '…', 16), "
+    "bm25(book_fts, 4.0, 1.0) AS rank "
+    "FROM book_fts JOIN book b ON b.rowid = book_fts.rowid "
+    "WHERE book_fts MATCH ? ORDER BY rank LIMIT ?"
+)
+
+
+def build_match_expression(text: str, prefix: bool = False) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression. Every word becomes a quoted
+    term (so user input can't inject FTS operators) and all terms must match.
+    With `prefix`, the last word also matches longer words, for type-ahead.
+    """
+    terms = [f'"{token}"' for token in _TOKEN.findall(text)]
+    if not terms:
+        return ""
+    if prefix:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SearchRepository:
+    def __init__(self,db:DB):
+        self.db = db
+
+    def search_books(self,text:str,limit:int=20,prefix:bool=False,
+                     highlight_start:str="<mark>",highlight_end:str="</mark>") -> List[BookSearchResult]:
+        match = build_match_expression(text,prefix)
+        if not match:
+            return []
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute(_SEARCH_QUERY,(highlight_start,highlight_end,highlight_start,highlight_end,match,limit))
+                return [BookSearchResult(*row) for row in cursor.fetchall()]
+        except Exception as e:
+            raise DatabaseError(str(e))
+
+    def rebuild_index(self):
+        """Re-index every book, e.g. after a VACUUM renumbered the book rowids."""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                conn.execute("INSERT INTO book_fts (book_fts) VALUES ('rebuild')")
+        except Exception as e:
+            raise DatabaseError(str(e))
@@ -39,15 +39,7 @@ class UserRepository:
                 result = cursor.fetchone()
 
             if result:
-                return User(
-                    id=result[0],
-                    name=result[1],
-                    role=result[2],
-                    year=result[3],
-                    branch=result[4],
-                    email=result[5],
-                    password=result[6],
-                )
+                return User.from_row(result)
             return None
         except Exception as e:
             raise DatabaseError(str(e))
@@ -0,0 +1,43 @@
+import argparse
+import sys
+from datetime import date
+
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.issued_book_repository import IssuedBookRepository
+from src.app.services.circulation_export import EXPORT_FORMATS
+from src.app.services.issue_book_service import IssueBookService
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+import src.app.config.config as config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the circulation history (issued books) as NDJSON or CSV.")
+    parser.add_argument("path", nargs="?", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--start-date", type=date.fromisoformat, help="earliest borrow date, YYYY-MM-DD")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="latest borrow date, YYYY-MM-DD")
+    parser.add_argument("--user-id")
+    parser.add_argument("--book-id")
+    parser.add_argument("--chunk-size", type=int, default=config.EXPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    db = DB()
+    apply_migrations(db)
+    issue_book_service = IssueBookService(IssuedBookRepository(db), BooksRepository(db))
+    chunks = issue_book_service.export_issued_books(args.format, args.start_date, args.end_date,
+                                                    args.user_id, args.book_id, args.chunk_size)
+    try:
+        if args.path == "-":
+            sys.stdout.writelines(chunks)
+        else:
+            with open(args.path, "w", encoding="utf-8", newline="") as out:
+                out.writelines(chunks)
+    finally:
+        chunks.close()
+        db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
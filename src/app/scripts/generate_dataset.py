@@ -0,0 +1,248 @@
+import argparse
+import itertools
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from src.app.config.enumeration import Branch, Role
+from src.app.repositories.search_repository import SearchRepository
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.utils import Utils
+import src.app.config.config as config
+
+# User i's password is PASSWORD_PREFIX + str(i % hash pool size), so any generated account can log in
+PASSWORD_PREFIX = "Password@"
+LOAN_DAYS = 14
+BRANCHES = [branch.value for branch in Branch]
+_WORDS = ("river", "shadow", "empire", "garden", "winter", "silver", "machine", "ocean", "forest", "night",
+          "stone", "glass", "harbor", "signal", "orchard", "desert", "lantern", "echo", "summit", "atlas",
+          "crown", "meadow", "thunder", "paper", "compass", "ember", "willow", "canyon", "mirror", "voyage")
+_FIRST_NAMES = ("Asha", "Bruno", "Chen", "Dara", "Elif", "Farid", "Grace", "Hiro", "Ines", "Jonas", "Kavya",
+                "Liam", "Maya", "Nikhil", "Olga", "Priya", "Quinn", "Rahul", "Sara", "Tomas")
+_LAST_NAMES = ("Sharma", "Okafor", "Lindqvist", "Tanaka", "Moreau", "Iyer", "Novak", "Reyes", "Kowalski",
+               "Haddad", "Fischer", "Mensah", "Costa", "Park", "Jain", "Walsh")
+
+
+@dataclass
+class GenerationReport:
+    users: int = 0
+    books: int = 0
+    issues: int = 0
+    seconds: dict = field(default_factory=dict)  # phase -> seconds
+
+
+# UUID variant bits (10xx) for the character after the third hyphen
+_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def _ids(rng: random.Random, count: int) -> list:
+    # Version-4 UUID strings from the seeded generator, so a seed always produces the same ids.
+    # Formatted from one hex string: about twice as fast as building uuid.UUID objects
+    digits = rng.randbytes(16 * count).hex()
+    return [f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-4{digits[i + 13:i + 16]}-"
+            f"{_VARIANT[digits[i + 16]]}{digits[i + 17:i + 20]}-{digits[i + 20:i + 32]}"
+            for i in range(0, 32 * count, 32)]
+
+
+@contextmanager
+def _deferred_indexes(conn, table: str):
+    """
+    Drop `table`'s secondary indexes and triggers for the duration of a bulk load and
+    recreate them from their saved SQL afterwards: building an index once from sorted
+    data is several times faster than updating it row by row. Runs inside the caller's
+    transaction, so a failed load leaves the schema as it was.
+    """
+    saved = conn.execute("SELECT type, name, sql FROM sqlite_master WHERE tbl_name = ? "
+                         "AND type IN ('index', 'trigger') AND sql IS NOT NULL", (table,)).fetchall()
+    for kind, name, _ in saved:
+        conn.execute(f"DROP {kind.upper()} {name}")
+    yield
+    for _, _, sql in saved:
+        conn.execute(sql)
+    # The table_version triggers were among those dropped; count the load as one change
+    conn.execute("UPDATE table_version SET version = version + 1, "
+                 "modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = ?", (table,))
+
+
+def _batches(rows, batch_size: int):
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def _copies(rng: random.Random, book_ids: list, loans: list):
+    # Every loaned copy exists, plus up to three on the shelf; unborrowed titles keep at least one
+    for book_id, loaned in zip(book_ids, loans):
+        total = max(loaned + rng.randint(0, 3), 1)
+        yield total, total - loaned, book_id
+
+
+def hash_pool(size: int, rounds: int, workers: int = 4) -> list:
+    """bcrypt hashes of PASSWORD_PREFIX + "0".."size-1"; bcrypt releases the GIL, so they're made in parallel."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda i: Utils.hash_password(f"{PASSWORD_PREFIX}{i}", rounds), range(size)))
+
+
+def zipf_cum_weights(count: int, exponent: float) -> list:
+    """Cumulative weights for random.choices: rank r is picked with probability proportional to 1 / r**exponent."""
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def day_cum_weights(days: int, growth: float = 1.0, weekend_factor: float = 0.5, end: date = None) -> list:
+    """
+    Cumulative weights over the `days` days ending at `end`: borrowing grows linearly
+    by `growth` (1.0 = twice as many loans on the last day as on the first) and
+    weekends see `weekend_factor` of a weekday's loans.
+    """
+    start = (end or date.today()) - timedelta(days=days - 1)
+    weights = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        weight = 1 + growth * offset / max(days - 1, 1)
+        weights.append(weight * (weekend_factor if day.weekday() >= 5 else 1))
+    return list(itertools.accumulate(weights))
+
+
+def generate_dataset(db: DB, users: int, books: int, issues: int, seed: int = 1, zipf_exponent: float = 1.1,
+                     days: int = 365, end_date: date = None, password_pool: list = None,
+                     batch_size: int = 50000, progress=None) -> GenerationReport:
+    """
+    Fill an empty schema with `users` members (plus one admin), `books` titles and
+    `issues` current loans. Books are borrowed with Zipf popularity, borrowers are
+    uniform, borrow dates follow day_cum_weights. Each book gets at least as many
+    copies as it has loans, with the difference available. Everything is written
+    with executemany in one transaction per table, with that table's indexes built
+    after the load.
+    """
+    rng = random.Random(seed)
+    report = GenerationReport()
+    end_date = end_date or date.today()
+    password_pool = password_pool or hash_pool(1, config.PASSWORD_HASH_ROUNDS)
+
+    started = time.perf_counter()
+    user_ids = _ids(rng, users)
+    admin = (_ids(rng, 1)[0], "Admin", Role.ADMIN.value, "4", BRANCHES[0], "admin@jecrc.ac.in",
+             password_pool[0])
+    user_rows = ((user_id, f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}", Role.USER.value,
+                  str(rng.randint(1, 4)), rng.choice(BRANCHES), f"user{i}@jecrc.ac.in",
+                  password_pool[i % len(password_pool)]) for i, user_id in enumerate(user_ids))
+    with db.transaction() as conn:
+        for batch in _batches(itertools.chain([admin], user_rows), batch_size):
+            conn.executemany("INSERT INTO user (id, name, role, year, branch, email, password) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+            report.users += len(batch)
+    report.seconds["users"] = time.perf_counter() - started
+
+    # Copies are filled in once the loans are known
+    started = time.perf_counter()
+    book_ids = _ids(rng, books)
+    book_rows = ((book_id, f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS)} {rng.choice(_WORDS)} {i}",
+                  f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}") for i, book_id in enumerate(book_ids))
+    with db.transaction() as conn:
+        # The full-text triggers are deferred too; the index is rebuilt once at the end
+        with _deferred_indexes(conn, "book"):
+            for batch in _batches(book_rows, batch_size):
+                conn.executemany("INSERT INTO book (id, title, author, number_of_copies, "
+                                 "number_of_available_books) VALUES (?, ?, ?, 0, 0)", sorted(batch))
+                report.books += len(batch)
+        SearchRepository(db).rebuild_index()
+    report.seconds["books"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    # Zipf rank r goes to a random book, so popularity isn't tied to insertion order
+    popularity = list(range(books))
+    rng.shuffle(popularity)
+    book_weights = zipf_cum_weights(books, zipf_exponent) if books else []
+    day_weights = day_cum_weights(days, end=end_date)
+    first_day = end_date - timedelta(days=days - 1)
+    borrow_dates = [(first_day + timedelta(days=offset)).isoformat() for offset in range(days)]
+    due_dates = [(first_day + timedelta(days=offset + LOAN_DAYS)).isoformat() for offset in range(days)]
+    loans = [0] * books
+    day_offsets = range(days)
+    with db.transaction() as conn, _deferred_indexes(conn, "issuedBook"):
+        remaining = issues if users and books else 0
+        while remaining:
+            count = min(batch_size, remaining)
+            ranks = rng.choices(popularity, cum_weights=book_weights, k=count)
+            offsets = rng.choices(day_offsets, cum_weights=day_weights, k=count)
+            borrowers = rng.choices(user_ids, k=count)
+            for index in ranks:
+                loans[index] += 1
+            # Sorted by id, the primary key index is appended to in order within a batch
+            conn.executemany(
+                "INSERT INTO issuedBook (id, user_id, book_id, borrow_date, return_date) VALUES (?, ?, ?, ?, ?)",
+                sorted(zip(_ids(rng, count), borrowers, [book_ids[index] for index in ranks],
+                           [borrow_dates[offset] for offset in offsets], [due_dates[offset] for offset in offsets]))
+            )
+            remaining -= count
+            report.issues += count
+            if progress:
+                progress(report)
+    report.seconds["issues"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with db.transaction() as conn:
+        for batch in _batches(_copies(rng, book_ids, loans), batch_size):
+            conn.executemany("UPDATE book SET number_of_copies = ?, number_of_available_books = ? WHERE id = ?",
+                             batch)
+    report.seconds["copies"] = time.perf_counter() - started
+    return report
+
+
+def _is_empty(db: DB) -> bool:
+    with db.get_connection() as conn:
+        return not any(conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+                       for table in ("user", "book", "issuedBook"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill an empty library database with synthetic users, books "
+                                                 "and loans for scale testing.")
+    parser.add_argument("path", nargs="?", help="SQLite file (default: config.DB_ADDR)")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--books", type=int, default=100000)
+    parser.add_argument("--issues", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of book popularity")
+    parser.add_argument("--days", type=int, default=365, help="borrow dates span this many days up to today")
+    parser.add_argument("--hash-pool", type=int, default=16, help="distinct bcrypt hashes shared by the users")
+    parser.add_argument("--hash-rounds", type=int, default=config.PASSWORD_HASH_ROUNDS)
+    parser.add_argument("--batch-size", type=int, default=50000)
+    args = parser.parse_args(argv)
+    if min(args.users, args.books, args.issues) < 0 or args.days < 1 or args.hash_pool < 1 or args.batch_size < 1:
+        parser.error("counts must not be negative; --days, --hash-pool and --batch-size must be at least 1")
+
+    db = DB(args.path, pragma_profile="throughput")
+    try:
+        apply_migrations(db)
+        if not _is_empty(db):
+            print("Database already has users, books or loans; generate into an empty database", file=sys.stderr)
+            return 1
+
+        started = time.perf_counter()
+        pool = hash_pool(args.hash_pool, args.hash_rounds)
+        print(f"{len(pool)} bcrypt hashes at cost {args.hash_rounds} in {time.perf_counter() - started:.1f}s",
+              file=sys.stderr)
+
+        def progress(report):
+            print(f"{report.issues}/{args.issues} loans written", file=sys.stderr)
+
+        report = generate_dataset(db, args.users, args.books, args.issues, args.seed, args.zipf, args.days,
+                                  password_pool=pool, batch_size=args.batch_size, progress=progress)
+    finally:
+        db.close()
+
+    for phase, seconds in report.seconds.items():
+        print(f"{phase}: {seconds:.2f}s")
+    print(f"Generated {report.users} users, {report.books} books and {report.issues} loans "
+          f"in {sum(report.seconds.values()):.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
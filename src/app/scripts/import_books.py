@@ -0,0 +1,48 @@
+import argparse
+import sys
+
+from src.app.repositories.books_repository import BooksRepository
+from src.app.services.book_service import BookService
+from src.app.services.catalog_import import IMPORT_FORMATS, detect_format
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+import src.app.config.config as config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import books from a CSV or JSONL file "
+                                                 "(columns/keys: title, author, copies).")
+    parser.add_argument("path", help="file to import, or - for stdin")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=config.IMPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or detect_format(args.path)
+    db = DB()
+    apply_migrations(db)
+    book_service = BookService(BooksRepository(db))
+
+    def progress(report):
+        print(f"{report.rows_read} rows read, {report.books_written} books written "
+              f"in {report.batches} batches, {report.error_count} errors", file=sys.stderr)
+
+    try:
+        if args.path == "-":
+            report = book_service.import_books(sys.stdin, fmt, progress, args.batch_size)
+        else:
+            with open(args.path, encoding="utf-8", newline="") as stream:
+                report = book_service.import_books(stream, fmt, progress, args.batch_size)
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"line {error.line}: {error.message}", file=sys.stderr)
+    if report.error_count > len(report.errors):
+        print(f"... {report.error_count - len(report.errors)} more errors not shown", file=sys.stderr)
+    print(f"Imported {report.rows_imported} of {report.rows_read} rows "
+          f"({report.duplicates_merged} merged duplicates) in {report.elapsed_seconds:.2f}s")
+    return 1 if report.error_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
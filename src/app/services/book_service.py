@@ -1,7 +1,10 @@
 from src.app.config.messages import BOOK_NOT_EXIST
 from src.app.repositories.books_repository import BooksRepository
 from src.app.model.books import Books
+from src.app.services.catalog_import import CatalogImporter, ImportReport, read_rows
 from src.app.utils.errors.error import *
+from src.app.utils.pagination import Page, decode_cursor
+import src.app.config.config as config
 
 
 class BookService:
@@ -13,13 +16,16 @@ class BookService:
         pass
 
     def add_book(self,new_book:Books):
-        book = self.book_repository.get_book_by_title(new_book.title)
-        if book is None:
-            self.book_repository.add_book(new_book)
-        else:
-            book.no_of_available=book.no_of_available + 1
-            book.no_of_copies= book.no_of_copies + 1
-            self.book_repository.update_book_availability(book)
+        # Read and write in one transaction: the read skips the cache and sees the
+        # current row, and the write lock keeps other writers out until the update lands
+        with self.book_repository.transaction():
+            book = self.book_repository.get_book_by_title(new_book.title)
+            if book is None:
+                self.book_repository.add_book(new_book)
+            else:
+                book.no_of_available=book.no_of_available + 1
+                book.no_of_copies= book.no_of_copies + 1
+                self.book_repository.update_book_availability(book)
 
     def update_book_by_id(self,updated_book:Books,book_id:str):
         if self.book_repository.get_book_by_id(book_id) is None:
@@ -35,19 +41,25 @@ class BookService:
         self.book_repository.delete_book(book_id)
 
     def remove_book_by_id(self,book_id:str):
-        book = self.book_repository.get_book_by_id(book_id)
-        if book is None:
-            raise NotExistsError(BOOK_NOT_EXIST)
+        with self.book_repository.transaction():
+            book = self.book_repository.get_book_by_id(book_id)
+            if book is None:
+                raise NotExistsError(BOOK_NOT_EXIST)
+
+            book.no_of_available-=1
+            book.no_of_copies-=1
+            self.book_repository.update_book_availability(book)
 
-        book.no_of_available-=1
-        book.no_of_copies-=1
-        self.book_repository.update_book_availability(book)
 
+    def get_all_books(self,limit:int=config.PAGE_SIZE_DEFAULT,cursor:str=None) -> Page:
+        after_title = decode_cursor("book",cursor,"title")["title"] if cursor else None
+        books = self.book_repository.get_books(limit + 1,after_title)
+        return Page.from_rows(books,limit,"book",lambda book: {"title":book.title})
 
-    def get_all_books(self):
-        books = self.book_repository.get_books()
-        return books
 
+    def import_books(self,stream,fmt:str,progress=None,batch_size:int=config.IMPORT_BATCH_SIZE) -> ImportReport:
+        """Stream CSV/JSONL rows from a text stream into the catalog; see CatalogImporter."""
+        return CatalogImporter(self.book_repository,batch_size).run(read_rows(stream,fmt),progress)
 
     def get_book_by_title(self,title:str):
         book = self.book_repository.get_book_by_title(title)
@@ -0,0 +1,174 @@
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.utils.errors.error import InvalidRequestBody
+import src.app.config.config as config
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+# A parsed input row: (line number, fields) or (line number, error message)
+Row = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detect_format(filename: str = None, content_type: str = None) -> str:
+    """Pick "csv" or "jsonl" from a file name or content type."""
+    name = (filename or "").lower()
+    mime = (content_type or "").split(";")[0].strip().lower()
+    if name.endswith(".csv") or mime in ("text/csv", "application/csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")) or mime in ("application/x-ndjson", "application/jsonl",
+                                                         "application/x-jsonlines"):
+        return "jsonl"
+    raise InvalidRequestBody(f"unsupported import format, expected one of {', '.join(IMPORT_FORMATS)}")
+
+
+def read_rows(stream: Iterable[str], fmt: str) -> Iterator[Row]:
+    """Parse a text stream line by line; bad lines are reported instead of raised."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record, None
+    elif fmt == "jsonl":
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, None, f"invalid JSON: {e}"
+                continue
+            if isinstance(record, dict):
+                yield line_no, record, None
+            else:
+                yield line_no, None, "expected a JSON object"
+    else:
+        raise InvalidRequestBody(f"unsupported import format, expected one of {', '.join(IMPORT_FORMATS)}")
+
+
+def text_stream(binary, encoding: str = "utf-8") -> io.TextIOWrapper:
+    """Wrap a binary stream (request body, uploaded or opened file) for read_rows."""
+    return io.TextIOWrapper(binary, encoding=encoding, newline="")
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    rows_imported: int = 0
+    duplicates_merged: int = 0
+    books_written: int = 0
+    batches: int = 0
+    error_count: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "rows_read": self.rows_read,
+            "rows_imported": self.rows_imported,
+            "duplicates_merged": self.duplicates_merged,
+            "books_written": self.books_written,
+            "batches": self.batches,
+            "error_count": self.error_count,
+            "errors": [{"line": error.line, "message": error.message} for error in self.errors],
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+        }
+
+
+class CatalogImporter:
+    """
+    Streams rows into the catalog in batches.
+
+    Each row needs a title and an author and may give a number of copies
+    (default 1). Rows are validated one at a time, rows with the same title
+    inside a batch are merged into one, and every batch is written with a
+    single executemany upsert in its own transaction. Importing a title that
+    already exists adds copies to it, as POST /admin/book does. Only the
+    current batch is held in memory.
+    """
+
+    def __init__(self,book_repository:BooksRepository,batch_size:int=config.IMPORT_BATCH_SIZE,
+                 max_errors:int=config.IMPORT_MAX_REPORTED_ERRORS):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.book_repository = book_repository
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    @staticmethod
+    def _parse(record:dict) -> Books:
+        title = record.get("title")
+        author = record.get("author")
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError("title is required")
+        if not isinstance(author, str) or not author.strip():
+            raise ValueError("author is required")
+        copies = record.get("copies")
+        if copies is None or copies == "":
+            copies = 1
+        elif isinstance(copies, bool) or not isinstance(copies, (int, str)):
+            raise ValueError("copies must be a positive whole number")
+        try:
+            copies = int(copies)
+        except ValueError:
+            raise ValueError("copies must be a positive whole number")
+        if copies < 1:
+            raise ValueError("copies must be a positive whole number")
+        return Books(title=title.strip(),author=author.strip(),no_of_copies=copies,no_of_available=copies)
+
+    def _error(self,report:ImportReport,line:int,message:str):
+        report.error_count += 1
+        if len(report.errors) < self.max_errors:
+            report.errors.append(RowError(line,message))
+
+    def _flush(self,report:ImportReport,batch:dict,progress:Callable):
+        if not batch:
+            return
+        report.books_written += self.book_repository.upsert_books(list(batch.values()))
+        report.batches += 1
+        batch.clear()
+        if progress:
+            progress(report)
+
+    def run(self,rows:Iterable[Row],progress:Callable[[ImportReport],None]=None) -> ImportReport:
+        report = ImportReport()
+        started = time.perf_counter()
+        batch = {}  # title -> Books
+        pending_rows = 0
+        for line, record, error in rows:
+            report.rows_read += 1
+            if error is None:
+                try:
+                    book = self._parse(record)
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                self._error(report,line,error)
+                continue
+
+            report.rows_imported += 1
+            pending_rows += 1
+            existing = batch.get(book.title)
+            if existing is None:
+                batch[book.title] = book
+            else:
+                existing.no_of_copies += book.no_of_copies
+                existing.no_of_available += book.no_of_available
+                report.duplicates_merged += 1
+            if pending_rows >= self.batch_size:
+                self._flush(report,batch,progress)
+                pending_rows = 0
+        self._flush(report,batch,progress)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
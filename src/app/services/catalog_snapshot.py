@@ -0,0 +1,136 @@
+import hashlib
+import json
+import threading
+from typing import Tuple
+
+from src.app.config.enumeration import Status
+from src.app.config.messages import BOOK_FETCH_SUCCESSFULLY
+from src.app.model.responses import Response
+from src.app.repositories.books_repository import BooksRepository
+from src.app.utils.pagination import Page
+import src.app.config.config as config
+
+_PLACEHOLDER = "__catalog_books__"
+
+
+def _encode(value) -> str:
+    # Same key order and UTF-8 output as the app's JSON providers, so both paths produce the same body
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+class CatalogSnapshot:
+    """
+    Pre-encoded body of the default `GET /user/book` response (first page, default limit).
+
+    Each book is encoded once and kept as a fragment; the body is the fragments
+    joined inside the response envelope, and its hash is a strong ETag. When a
+    book changes only its fragment is re-encoded, unless the change moves books
+    in or out of the page, in which case the page is reloaded.
+
+    Every `get` also reads the book table's change counter (migration 5). If it
+    moved by more than the changes reported in this process, something else wrote
+    to the table (another worker, a script, a manual edit), and the page is reloaded.
+    """
+
+    def __init__(self,book_repository:BooksRepository,limit:int=config.PAGE_SIZE_DEFAULT):
+        self.book_repository = book_repository
+        self.db = book_repository.db
+        self.limit = limit
+        self.version = 0
+        self._lock = threading.Lock()
+        self._built = False
+        self._full_rebuild = True
+        self._pending = set()
+        self._db_version = None  # book table counter when the snapshot was last refreshed
+        self._reported = 0  # book changes reported in this process since then
+        self._order = []  # book ids in page order
+        self._has_more = False
+        self._titles = {}
+        self._fragments = {}
+        self._envelope = ("", "")
+        self._empty_body = ""
+        self._body = b""
+        self._etag = ""
+        self.full_rebuilds = 0
+        self.incremental_rebuilds = 0
+        self.db.subscribe("book",self.book_changed)
+
+    def book_changed(self,table:str,book_id:str):
+        with self._lock:
+            if book_id is None:
+                # A bulk change without ids: reload the whole page
+                self._full_rebuild = True
+            else:
+                self._pending.add(book_id)
+                self._reported += 1
+            self.version += 1
+
+    def get(self) -> Tuple[bytes,str,int]:
+        """Return (body, etag, version), rebuilding first if books changed since the last call."""
+        with self._lock:
+            db_version = self.db.table_versions("book")["book"][0]
+            if self._built and db_version != self._db_version + self._reported:
+                # Written outside this process: nothing says which books changed
+                self._full_rebuild = True
+                self.version += 1
+            if not self._built or self._full_rebuild or self._pending:
+                self._refresh()
+            self._db_version, self._reported = db_version, 0
+            return self._body,self._etag,self.version
+
+    def _refresh(self):
+        pending, self._pending = self._pending, set()
+        if self._built and not self._full_rebuild:
+            self._apply(pending)
+        if not self._built or self._full_rebuild:
+            self._load_page()
+            self.full_rebuilds += 1
+        else:
+            self.incremental_rebuilds += 1
+        self._join()
+
+    def _apply(self,pending):
+        last_title = self._titles[self._order[-1]] if self._order else None
+        for book_id in pending:
+            book = self.book_repository.get_book_by_id(book_id)
+            if book_id in self._fragments:
+                if book is None or book.title != self._titles[book_id]:
+                    # Deleted or renamed: page membership and order may change
+                    self._full_rebuild = True
+                    return
+                self._fragments[book_id] = _encode(book.to_dict())
+            elif book is None:
+                # A book past the page was deleted; has_more may flip
+                if self._has_more:
+                    self._full_rebuild = True
+                    return
+            elif not self._has_more or book.title < last_title:
+                # A book that sorts into the page, or the first one after it
+                self._full_rebuild = True
+                return
+
+    def _load_page(self):
+        books = self.book_repository.get_books(self.limit + 1)
+        page = Page.from_rows(books,self.limit,"book",lambda book: {"title":book.title})
+        self._order = [book.id for book in page.items]
+        self._titles = {book.id:book.title for book in page.items}
+        self._has_more = page.has_more
+        self._fragments = {book.id:_encode(book.to_dict()) for book in page.items}
+        envelope = _encode(Response.response(BOOK_FETCH_SUCCESSFULLY,Status.SUCCESS.value,
+                                             data=[_PLACEHOLDER],pagination=page.meta()))
+        prefix, suffix = envelope.split(_encode(_PLACEHOLDER))
+        self._envelope = (prefix,suffix)
+        self._empty_body = _encode(Response.response(BOOK_FETCH_SUCCESSFULLY,Status.SUCCESS.value,
+                                                     pagination=page.meta()))
+        self._built = True
+        self._full_rebuild = False
+
+    def _join(self):
+        if self._order:
+            prefix, suffix = self._envelope
+            body = prefix + ",".join(self._fragments[book_id] for book_id in self._order) + suffix
+        else:
+            body = self._empty_body
+        # Flask's JSON responses end with a newline; so does the snapshot, byte for byte
+        self._body = (body + "\n").encode("utf-8")
+        self._etag = hashlib.blake2b(self._body,digest_size=16).hexdigest()
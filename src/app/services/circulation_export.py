@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+from src.app.utils.errors.error import InvalidRequestBody
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_COLUMNS = ("id", "user_id", "book_id", "borrow_date", "return_date")
+EXPORT_MIMETYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _ndjson(chunks: Iterable[list]) -> Iterator[str]:
+    for rows in chunks:
+        yield "".join(json.dumps(dict(zip(EXPORT_COLUMNS, row)), separators=(",", ":")) + "\n" for row in rows)
+
+
+def _csv(chunks: Iterable[list]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # No rows at all: still send the header
+        yield buffer.getvalue()
+
+
+def encode_chunks(chunks: Iterable[list], fmt: str) -> Iterator[str]:
+    """
+    Encode chunks of issue rows (see IssuedBookRepository.iter_issue_book_rows) as
+    NDJSON or CSV text, one string per chunk, so only one chunk is in memory at a time.
+    The format is checked here rather than on first iteration.
+    """
+    if fmt == "ndjson":
+        return _ndjson(chunks)
+    if fmt == "csv":
+        return _csv(chunks)
+    raise InvalidRequestBody(f"unsupported export format, expected one of {', '.join(EXPORT_FORMATS)}")
@@ -1,38 +1,111 @@
 from src.app.repositories.issued_book_repository import IssuedBookRepository
 from src.app.repositories.books_repository import BooksRepository
 from src.app.model.issued_books import IssuedBooks
+from src.app.model.batch_result import BatchItemResult
+from src.app.services.circulation_export import encode_chunks
 from src.app.utils.errors.error import *
+from src.app.utils.pagination import Page, decode_cursor
+import src.app.config.config as config
 
 class IssueBookService:
     def __init__(self,issued_book_repository:IssuedBookRepository,book_repository:BooksRepository):
         self.issued_book_repository = issued_book_repository
         self.book_repository = book_repository
 
-    def get_all_issued_books(self):
-        issued_books = self.issued_book_repository.get_issue_books()
-        return issued_books
+    def get_all_issued_books(self,limit:int=config.PAGE_SIZE_DEFAULT,cursor:str=None) -> Page:
+        after_id = decode_cursor("issuedBook",cursor,"id")["id"] if cursor else None
+        issued_books = self.issued_book_repository.get_issue_books(limit + 1,after_id)
+        return Page.from_rows(issued_books,limit,"issuedBook",lambda issued_book: {"id":issued_book.id})
 
+    def export_issued_books(self,fmt:str,start_date=None,end_date=None,user_id:str=None,book_id:str=None,
+                            chunk_size:int=config.EXPORT_CHUNK_SIZE):
+        """Circulation history matching the filters as NDJSON/CSV text chunks, read lazily from the DB."""
+        rows = self.issued_book_repository.iter_issue_book_rows(
+            start_date.isoformat() if start_date else None,
+            end_date.isoformat() if end_date else None,
+            user_id,book_id,chunk_size
+        )
+        return encode_chunks(rows,fmt)
 
     def issue_book(self,issued_book:IssuedBooks,book_id:str):
-        book = self.book_repository.get_book_by_id(book_id)
-        if book is None:
-            raise NotExistsError("book doesn't exist")
-        if book.no_of_available <= 0:
-            raise InvalidOperationError("book doesn't available")
-        issued_book.book_id = book.id
-        self.issued_book_repository.save_issue_book(issued_book)
-        book.no_of_available -= 1
-        self.book_repository.update_book_availability(book)
+        with self.book_repository.transaction():
+            # The conditional decrement is the availability check, so two borrowers can't take the last copy
+            if not self.book_repository.decrement_available_copies(book_id):
+                if self.book_repository.get_book_by_id(book_id) is None:
+                    raise NotExistsError("book doesn't exist")
+                raise InvalidOperationError("book doesn't available")
+            issued_book.book_id = book_id
+            self.issued_book_repository.save_issue_book(issued_book)
 
 
     def return_issue_book(self,user_id:str,book_id:str):
-        book = self.book_repository.get_book_by_id(book_id)
-        if book is None:
-            raise NotExistsError("book doesn't exist")
+        with self.book_repository.transaction():
+            returned = self.issued_book_repository.remove_issue_book(user_id,book_id)
+            if not returned:
+                raise NotExistsError("issued book doesn't exist")
+            if not self.book_repository.increment_available_copies(book_id,returned):
+                raise NotExistsError("book doesn't exist")
+
+    @staticmethod
+    def _finish_batch(results:list,all_or_nothing:bool,ok_status:str) -> bool:
+        """In all-or-nothing mode a single failure aborts the rest. Returns whether to write."""
+        failed = any(result.status == BatchItemResult.FAILED for result in results)
+        if failed and all_or_nothing:
+            for result in results:
+                if result.status == ok_status:
+                    result.status = BatchItemResult.ABORTED
+                    result.issue_id = None
+            return False
+        return any(result.status == ok_status for result in results)
+
+    def issue_books(self,issued_books:list,all_or_nothing:bool=True) -> list:
+        """
+        Issue several books in one transaction. Availability is read for all books with one
+        query and copies are handed out in request order, so a batch asking for more copies
+        than are available gets the first ones. Returns one BatchItemResult per item.
+        """
+        with self.book_repository.transaction():
+            book_ids = list(dict.fromkeys(issued_book.book_id for issued_book in issued_books))
+            available = self.book_repository.get_available_copies(book_ids)
+            results, deltas, to_save = [], {}, []
+            for issued_book in issued_books:
+                book_id = issued_book.book_id
+                if book_id not in available:
+                    results.append(BatchItemResult(book_id,BatchItemResult.FAILED,"book doesn't exist"))
+                elif available[book_id] + deltas.get(book_id,0) <= 0:
+                    results.append(BatchItemResult(book_id,BatchItemResult.FAILED,"book doesn't available"))
+                else:
+                    deltas[book_id] = deltas.get(book_id,0) - 1
+                    to_save.append(issued_book)
+                    results.append(BatchItemResult(book_id,BatchItemResult.ISSUED,issue_id=issued_book.id))
+
+            if self._finish_batch(results,all_or_nothing,BatchItemResult.ISSUED):
+                if self.book_repository.adjust_available_copies(deltas) != len(deltas):
+                    # Can't happen while we hold the write lock; don't commit a half-applied batch
+                    raise InvalidOperationError("book availability changed during the batch")
+                self.issued_book_repository.save_issue_books(to_save)
+        return results
+
+    def return_issue_books(self,user_id:str,book_ids:list,all_or_nothing:bool=True) -> list:
+        """
+        Return several books in one transaction: every copy of each book the user holds is
+        returned, like return_issue_book. Returns one BatchItemResult per distinct book.
+        """
+        with self.book_repository.transaction():
+            book_ids = list(dict.fromkeys(book_ids))
+            held = self.issued_book_repository.count_issued_books(user_id,book_ids)
+            results = [
+                BatchItemResult(book_id,BatchItemResult.RETURNED) if book_id in held
+                else BatchItemResult(book_id,BatchItemResult.FAILED,"issued book doesn't exist")
+                for book_id in book_ids
+            ]
 
-        book.no_of_available +=1
-        self.book_repository.update_book_availability(book)
-        self.issued_book_repository.remove_issue_book(user_id,book_id)
+            if self._finish_batch(results,all_or_nothing,BatchItemResult.RETURNED):
+                returned = [book_id for book_id in book_ids if book_id in held]
+                self.issued_book_repository.remove_issue_books(user_id,returned)
+                if self.book_repository.adjust_available_copies({book_id:held[book_id] for book_id in returned}) != len(returned):
+                    raise NotExistsError("book doesn't exist")
+        return results
 
     def get_issue_book_by_user_id(self,user_id:str):
         issued_books = self.issued_book_repository.get_issue_book_by_user_id(user_id)
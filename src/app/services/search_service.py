@@ -0,0 +1,14 @@
+from src.app.config.messages import SEARCH_QUERY_REQUIRED
+from src.app.repositories.search_repository import SearchRepository, build_match_expression
+from src.app.utils.errors.error import InvalidRequestBody
+import src.app.config.config as config
+
+
+class SearchService:
+    def __init__(self,search_repository:SearchRepository):
+        self.search_repository = search_repository
+
+    def search_books(self,text:str,limit:int=config.SEARCH_LIMIT_DEFAULT,prefix:bool=False):
+        if not text or not build_match_expression(text):
+            raise InvalidRequestBody(SEARCH_QUERY_REQUIRED)
+        return self.search_repository.search_books(text,min(limit,config.SEARCH_LIMIT_MAX),prefix)
@@ -2,20 +2,32 @@ from src.app.config.messages import INCORRECT_EMAIL_PASSWORD
 from src.app.model.user import User
 from src.app.repositories.user_repository import UserRepository
 from src.app.utils.errors.error import UserExistsError, InvalidCredentialsError
+from src.app.utils.password_hasher import PasswordHasher
 from src.app.utils.utils import Utils
 
 
 class UserService:
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher = None):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
+
+    def _hash_password(self, password: str) -> str:
+        if self.password_hasher is None:
+            return Utils.hash_password(password)
+        return self.password_hasher.hash(password)
+
+    def _check_password(self, password: str, hashed_password: str) -> bool:
+        if self.password_hasher is None:
+            return Utils.check_password(password, hashed_password)
+        return self.password_hasher.verify(password, hashed_password)
 
     def signup_user(self, user: User) -> User:
         if self.user_repository.fetch_user_by_email(user.email) is not None:
             raise UserExistsError(user.email)
 
         # hash the password
-        user.password = Utils.hash_password(user.password)
+        user.password = self._hash_password(user.password)
 
         # Save to database
         self.user_repository.save_user(user)
@@ -23,6 +35,6 @@ class UserService:
 
     def login_user(self, email: str, password: str) -> User:
         user = self.user_repository.fetch_user_by_email(email)
-        if user is None or not Utils.check_password(password, user.password):
+        if user is None or not self._check_password(password, user.password):
             raise InvalidCredentialsError(INCORRECT_EMAIL_PASSWORD)
         return user
\ No newline at end of file
@@ -0,0 +1,107 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+# Returned by `get` on a miss, so a cached None (a negative entry) can be told apart
+MISSING = object()
+
+
+class Cache(ABC):
+    """Interface the cached repositories talk to; swap in another backend by subclassing."""
+
+    @abstractmethod
+    def get(self, key: Hashable):
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable):
+        """Remove `key`; returns the value it held, or MISSING."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class LRUCache(Cache):
+    """
+    Thread-safe in-process cache. Entries expire after their TTL and the least
+    recently used entry is evicted once `max_entries` is reached.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if value is None:
+                self._negative_hits += 1
+            return value
+
+    def set(self, key: Hashable, value, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return MISSING
+            self._invalidations += 1
+            expires_at, value = entry
+            return value if expires_at > time.monotonic() else MISSING
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
@@ -0,0 +1,69 @@
+import threading
+from typing import Callable, Hashable
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one.
+
+    The first caller for a key runs the function; callers that arrive while it
+    is running wait for it and get the same result (or the same exception).
+    Nothing is remembered once the call finishes, so this is not a cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._calls = 0
+        self._executions = 0
+        self._collapsed = 0
+
+    def do(self, key: Hashable, func: Callable):
+        """Return (result, shared); `shared` is True when the result came from another caller's call."""
+        with self._lock:
+            self._calls += 1
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self._collapsed += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = func()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "executions": self._executions,
+                "collapsed": self._collapsed,
+                "in_flight": len(self._flights),
+            }
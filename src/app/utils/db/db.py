@@ -1,9 +1,117 @@
 import sqlite3
+from collections import defaultdict
+from contextlib import contextmanager
+
 import src.app.config.config as config
+from src.app.utils.db.instrumentation import InstrumentedConnection
+from src.app.utils.db.pool import ConnectionPool, PooledConnection
+from src.app.utils.db.pragmas import resolve_profile, apply_pragmas, check_pragmas
 
 class DB:
-    @staticmethod
-    def get_connection():
-        conn = sqlite3.connect(config.DB_ADDR)
+    """
+    Entry point to the database for the repositories.
+
+    One `DB` owns one connection pool; create a single instance at startup and
+    hand it to every repository so they all share the same connections.
+    """
+
+    def __init__(self, db_addr: str = None, pool_size: int = None, pragma_profile: str = None,
+                 pragma_overrides: dict = None):
+        self.db_addr = db_addr or config.DB_ADDR
+        self.pragmas = resolve_profile(
+            pragma_profile or config.DB_PRAGMA_PROFILE,
+            config.DB_PRAGMA_OVERRIDES if pragma_overrides is None else pragma_overrides,
+        )
+        self._listeners = defaultdict(list)
+        self._query_listeners = []
+        self.pool = ConnectionPool(
+            self._connect,
+            max_size=pool_size or config.DB_POOL_SIZE,
+            timeout=config.DB_POOL_TIMEOUT,
+            max_lifetime=config.DB_POOL_MAX_LIFETIME,
+            max_idle=config.DB_POOL_MAX_IDLE,
+            health_check_interval=config.DB_POOL_HEALTH_CHECK_INTERVAL,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Pooled connections move between threads, but only one thread uses a connection at a time
+        conn = sqlite3.connect(self.db_addr, check_same_thread=False, factory=InstrumentedConnection)
         conn.row_factory = sqlite3.Row
-        return conn
\ No newline at end of file
+        apply_pragmas(conn, self.pragmas)
+        # Attached after connection setup, so listeners only see the app's own statements
+        conn.query_listeners = self._query_listeners
+        return conn
+
+    def get_connection(self) -> PooledConnection:
+        return PooledConnection(self.pool)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Unit of work: every repository call made on this thread inside the block
+        runs on the same connection and is committed (or rolled back) once.
+
+        BEGIN IMMEDIATE takes the write lock up front so two concurrent units of
+        work can't both read a row and then race to update it. A nested call
+        joins the enclosing transaction.
+        """
+        with self.get_connection() as conn:
+            if not conn.connection.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+    def in_transaction(self) -> bool:
+        """True while the calling thread has uncommitted work on its pooled connection."""
+        conn = self.pool.current_connection()
+        return conn is not None and conn.in_transaction
+
+    def after_commit(self, callback):
+        """
+        Run `callback` once the calling thread's pending work is committed, or
+        right away if there is none. Dropped if the work is rolled back.
+        """
+        if not self.pool.defer_until_commit(callback):
+            callback()
+
+    def subscribe(self, table: str, listener):
+        """Call `listener(table, row_id)` after every committed change a repository reports for `table`."""
+        self._listeners[table].append(listener)
+
+    def add_query_listener(self, listener):
+        """Call `listener(sql, parameters, seconds)` after every statement run on a pooled connection."""
+        self._query_listeners.append(listener)
+
+    def notify_change(self, table: str, row_id: str = None):
+        """Called by repositories after a write; listeners only see it once it commits."""
+        self.after_commit(lambda: self._committed_change(table, row_id))
+
+    def _committed_change(self, table: str, row_id: str):
+        for listener in self._listeners.get(table, ()):
+            listener(table, row_id)
+
+    def table_versions(self, *tables: str) -> dict:
+        """
+        {table: (change counter, unix time of the last committed change)}, read from the
+        table_version rows that triggers keep (migration 5), so writes made by other
+        processes or outside the app count too. Untracked tables read as (0, 0.0).
+        """
+        placeholders = ", ".join(["?"] * len(tables))
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT name, version, modified_at FROM table_version "
+                                f"WHERE name IN ({placeholders})", tables).fetchall()
+        versions = {name: (version, modified_at) for name, version, modified_at in rows}
+        return {table: versions.get(table, (0, 0.0)) for table in tables}
+
+    def check_pragmas(self) -> dict:
+        """Report which of the configured PRAGMA settings actually took effect."""
+        conn = self.pool.acquire()
+        try:
+            return check_pragmas(conn, self.pragmas)
+        finally:
+            self.pool.release()
+
+    def stats(self) -> dict:
+        return self.pool.stats()
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,47 @@
+import sqlite3
+import time
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports each statement and how long `execute`/`executemany` took."""
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.report_query(sql, parameters, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            # The parameter sequence may be a consumed generator, so it isn't passed on
+            self.connection.report_query(sql, None, time.perf_counter() - started)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """
+    Connection whose statements all go through InstrumentedCursor, including the
+    `execute` shortcuts (sqlite3's own shortcuts bypass a cursor subclass).
+
+    `query_listeners` is shared with the owning DB; each is called as
+    `listener(sql, parameters, seconds)` on the executing thread. For a SELECT
+    the time covers preparing the statement and producing the first row.
+    """
+
+    query_listeners = ()
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def report_query(self, sql, parameters, seconds):
+        for listener in self.query_listeners:
+            listener(sql, parameters, seconds)
@@ -0,0 +1,176 @@
+from typing import List, Tuple
+
+from src.app.utils.db.db import DB
+
+# Append-only: never edit a migration once it has shipped, add a new one instead.
+# The applied version is stored in SQLite's header via PRAGMA user_version, so
+# checking it at startup costs a single page read.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "create base tables", [
+        '''
+        CREATE TABLE IF NOT EXISTS user (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            role TEXT NOT NULL CHECK(role IN ('admin', 'user')),
+            year TEXT NOT NULL,
+            branch TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS book (
+            id TEXT PRIMARY KEY,
+            title TEXT UNIQUE NOT NULL,
+            author TEXT NOT NULL,
+            number_of_copies INTEGER NOT NULL,
+            number_of_available_books INTEGER NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS issuedBook (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            book_id TEXT NOT NULL,
+            borrow_date DATE NOT NULL,
+            return_date DATE,
+            FOREIGN KEY (user_id) REFERENCES user (id) ON DELETE CASCADE,
+            FOREIGN KEY (book_id) REFERENCES book (id) ON DELETE CASCADE
+        )
+        ''',
+    ]),
+    # book.id and book.title are already indexed by their PRIMARY KEY / UNIQUE
+    # constraints. issuedBook had nothing but the primary key, so listing a
+    # user's books and returning a book scanned the whole circulation history.
+    (2, "index issuedBook lookups", [
+        # Covers get_issue_book_by_user_id and the (user_id, book_id) delete on return
+        '''
+        CREATE INDEX IF NOT EXISTS idx_issuedBook_user_id
+        ON issuedBook (user_id, book_id, borrow_date, return_date, id)
+        ''',
+        # Per-book lookups and the ON DELETE CASCADE from book
+        '''
+        CREATE INDEX IF NOT EXISTS idx_issuedBook_book_id
+        ON issuedBook (book_id)
+        ''',
+    ]),
+    # Full-text search over the catalog. book_fts is an external-content FTS5
+    # table: it stores only the index and reads title/author back from book by
+    # rowid. Triggers keep it in sync; availability updates don't touch it.
+    # book has no INTEGER PRIMARY KEY, so VACUUM may renumber its rowids -
+    # run SearchRepository.rebuild_index() after a VACUUM.
+    (3, "full-text search over book titles and authors", [
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS book_fts USING fts5(
+            title, author,
+            content='book', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_fts_insert AFTER INSERT ON book BEGIN
+            INSERT INTO book_fts (rowid, title, author) VALUES (new.rowid, new.title, new.author);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_fts_delete AFTER DELETE ON book BEGIN
+            INSERT INTO book_fts (book_fts, rowid, title, author) VALUES ('delete', old.rowid, old.title, old.author);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_fts_update AFTER UPDATE OF title, author ON book BEGIN
+            INSERT INTO book_fts (book_fts, rowid, title, author) VALUES ('delete', old.rowid, old.title, old.author);
+            INSERT INTO book_fts (rowid, title, author) VALUES (new.rowid, new.title, new.author);
+        END
+        ''',
+        "INSERT INTO book_fts (book_fts) VALUES ('rebuild')",
+    ]),
+    # The circulation export walks issuedBook in (borrow_date, id) order and
+    # filters on a borrow_date range; without this it sorts the whole table.
+    (4, "index issuedBook by borrow date", [
+        '''
+        CREATE INDEX IF NOT EXISTS idx_issuedBook_borrow_date
+        ON issuedBook (borrow_date, id)
+        ''',
+    ]),
+    # Change counters for the conditional GET validators, kept by triggers so
+    # every write counts: other workers, the import/generator scripts and
+    # manual edits included, not only the repositories of this process.
+    (5, "track table versions in the database", [
+        '''
+        CREATE TABLE IF NOT EXISTS table_version (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            modified_at REAL NOT NULL
+        )
+        ''',
+        "INSERT OR IGNORE INTO table_version (name, version, modified_at) "
+        "VALUES ('book', 0, (julianday('now') - 2440587.5) * 86400.0)",
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_version_insert AFTER INSERT ON book BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'book';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_version_update AFTER UPDATE ON book BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'book';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS book_version_delete AFTER DELETE ON book BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'book';
+        END
+        ''',
+        "INSERT OR IGNORE INTO table_version (name, version, modified_at) "
+        "VALUES ('issuedBook', 0, (julianday('now') - 2440587.5) * 86400.0)",
+        '''
+        CREATE TRIGGER IF NOT EXISTS issuedBook_version_insert AFTER INSERT ON issuedBook BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'issuedBook';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS issuedBook_version_update AFTER UPDATE ON issuedBook BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'issuedBook';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS issuedBook_version_delete AFTER DELETE ON issuedBook BEGIN
+            UPDATE table_version SET version = version + 1,
+                modified_at = (julianday('now') - 2440587.5) * 86400.0 WHERE name = 'issuedBook';
+        END
+        ''',
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(db: DB) -> int:
+    with db.get_connection() as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(db: DB) -> int:
+    """
+    Bring the schema up to LATEST_VERSION and return the version now in place.
+    Safe to run at every startup and from several processes at once.
+    """
+    if get_schema_version(db) >= LATEST_VERSION:
+        return LATEST_VERSION
+
+    for version, _description, statements in MIGRATIONS:
+        with db.transaction() as conn:
+            # Re-read under the write lock in case another process migrated first
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+
+    return get_schema_version(db)
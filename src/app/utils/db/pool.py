@@ -0,0 +1,279 @@
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from src.app.utils.errors.error import DatabaseError, PoolExhaustedError
+
+
+class _PoolEntry:
+    """A physical connection plus the bookkeeping the pool needs to recycle it."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class _Lease:
+    """Per-thread checkout. Nested `with` blocks on the same thread share it."""
+
+    def __init__(self, entry: _PoolEntry):
+        self.entry = entry
+        self.depth = 0
+        self.after_commit = []
+
+
+class ConnectionPool:
+    """
+    Bounded pool of SQLite connections with per-thread checkout.
+
+    A thread that already holds a connection gets the same one back, so nested
+    repository calls made inside one request reuse a single connection.
+    Connections older than `max_lifetime` or idle for longer than `max_idle`
+    are closed instead of being handed out again, and connections that have
+    been idle for `health_check_interval` seconds are pinged before reuse.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], max_size: int = 8, timeout: float = 5.0,
+                 max_lifetime: float = 3600, max_idle: float = 300, health_check_interval: float = 30):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+
+        self._idle = deque()
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+        self._local = threading.local()
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._failed_health_checks = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the calling thread (re-entrant)."""
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            lease = _Lease(self._checkout())
+            self._local.lease = lease
+        lease.depth += 1
+        return lease.entry.conn
+
+    def release(self) -> None:
+        """Release one level of the calling thread's checkout."""
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            return
+        lease.depth -= 1
+        if lease.depth > 0:
+            return
+        self._local.lease = None
+        self._checkin(lease.entry)
+
+    def held_by_current_thread(self) -> bool:
+        return getattr(self._local, "lease", None) is not None
+
+    def current_connection(self) -> Optional[sqlite3.Connection]:
+        lease = getattr(self._local, "lease", None)
+        return lease.entry.conn if lease else None
+
+    def defer_until_commit(self, callback: Callable[[], None]) -> bool:
+        """
+        Queue a callback to run once the calling thread's outermost block commits.
+        Returns False when the thread holds no connection, i.e. nothing is pending.
+        """
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            return False
+        lease.after_commit.append(callback)
+        return True
+
+    def take_after_commit(self) -> list:
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            return []
+        callbacks, lease.after_commit = lease.after_commit, []
+        return callbacks
+
+    def _checkout(self) -> _PoolEntry:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseError("connection pool is closed")
+
+                while self._idle:
+                    entry = self._idle.pop()
+                    if self._usable(entry):
+                        return self._record_checkout(entry, started)
+                    self._discard(entry)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolExhaustedError(
+                        f"no database connection available after {self.timeout}s "
+                        f"(pool size {self.max_size})"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        # Open the new connection outside the lock so slow opens don't stall checkins
+        try:
+            entry = _PoolEntry(self._factory())
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created += 1
+            return self._record_checkout(entry, started)
+
+    def _record_checkout(self, entry: _PoolEntry, started: float) -> _PoolEntry:
+        waited = time.monotonic() - started
+        self._checkouts += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        return entry
+
+    def _usable(self, entry: _PoolEntry) -> bool:
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime or now - entry.last_used > self.max_idle:
+            self._recycled += 1
+            return False
+        if now - entry.last_used > self.health_check_interval:
+            try:
+                entry.conn.execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                self._failed_health_checks += 1
+                return False
+        return True
+
+    def _discard(self, entry: _PoolEntry) -> None:
+        self._size -= 1
+        try:
+            entry.conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _checkin(self, entry: _PoolEntry) -> None:
+        try:
+            if entry.conn.in_transaction:
+                entry.conn.rollback()
+            healthy = True
+        except sqlite3.Error:
+            healthy = False
+
+        with self._cond:
+            entry.last_used = time.monotonic()
+            if self._closed or not healthy:
+                self._discard(entry)
+            else:
+                self._idle.append(entry)
+            self._cond.notify()
+
+    def stats(self) -> dict:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": idle,
+                "in_use": self._size - idle,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "recycled": self._recycled,
+                "failed_health_checks": self._failed_health_checks,
+                "avg_wait_ms": (self._total_wait / self._checkouts * 1000) if self._checkouts else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+            }
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._cond.notify_all()
+
+
+class PooledConnection:
+    """
+    Handle returned by `DB.get_connection()`.
+
+    Used the same way as a `sqlite3.Connection` in a `with` block: entering the
+    block checks a connection out of the pool, and leaving the outermost block
+    commits (or rolls back on error) and hands the connection back.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self._pool = pool
+        self._conn: Optional[sqlite3.Connection] = None
+        self._outermost = False
+
+    def __enter__(self):
+        self._outermost = not self._pool.held_by_current_thread()
+        self._conn = self._pool.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        conn = self._conn
+        callbacks = []
+        try:
+            if self._outermost:
+                callbacks = self._pool.take_after_commit()
+                if exc_type is None:
+                    conn.commit()
+                else:
+                    conn.rollback()
+                    callbacks = []
+        finally:
+            self._conn = None
+            self._pool.release()
+        for callback in callbacks:
+            callback()
+        return False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise DatabaseError("connection used outside of a 'with' block")
+        return self._conn
+
+    def execute(self, sql: str, parameters=()):
+        return self.connection.execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters):
+        return self.connection.executemany(sql, seq_of_parameters)
+
+    def cursor(self):
+        return self.connection.cursor()
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.connection.rollback()
@@ -0,0 +1,91 @@
+import sqlite3
+from typing import Dict, Optional
+
+# Order matters: busy_timeout first so the journal_mode switch can wait out a
+# concurrent writer, and journal_mode before synchronous since the safe
+# synchronous level depends on the journal mode.
+PRAGMA_ORDER = ("busy_timeout", "journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+
+PRAGMA_PROFILES: Dict[str, Dict[str, object]] = {
+    # Every commit is fsynced; survives power loss at the cost of write latency
+    "durable": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,  # negative values are KiB, i.e. 16 MB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    # WAL + NORMAL is safe against application crashes; the last commits may be lost on power loss
+    "balanced": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # Large cache and mmap for read-heavy peaks and bulk loads
+    "throughput": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -128000,
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+_SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+_TEMP_STORE = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def resolve_profile(profile: str = "balanced", overrides: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    """Return the settings for a named profile with any overrides applied on top."""
+    if profile not in PRAGMA_PROFILES:
+        raise ValueError(f"Unknown PRAGMA profile '{profile}', expected one of {sorted(PRAGMA_PROFILES)}")
+    settings = dict(PRAGMA_PROFILES[profile])
+    for name, value in (overrides or {}).items():
+        if name not in PRAGMA_ORDER:
+            raise ValueError(f"Unsupported PRAGMA '{name}'")
+        settings[name] = value
+    return settings
+
+
+def apply_pragmas(conn: sqlite3.Connection, settings: Dict[str, object]) -> None:
+    """Apply the settings to a freshly opened connection."""
+    for name in PRAGMA_ORDER:
+        if name in settings:
+            conn.execute(f"PRAGMA {name} = {settings[name]}").fetchall()
+
+
+def _normalize(name: str, value):
+    if name == "journal_mode":
+        return str(value).lower()
+    if name == "synchronous" and isinstance(value, str):
+        return _SYNCHRONOUS[value.upper()]
+    if name == "temp_store" and isinstance(value, str):
+        return _TEMP_STORE[value.upper()]
+    return int(value)
+
+
+def check_pragmas(conn: sqlite3.Connection, settings: Dict[str, object]) -> Dict[str, dict]:
+    """
+    Read every requested PRAGMA back from SQLite and report whether it took effect.
+    SQLite silently ignores some settings, e.g. WAL on an in-memory database or
+    mmap_size above the compile-time limit.
+    """
+    report = {}
+    for name in PRAGMA_ORDER:
+        if name not in settings:
+            continue
+        requested = settings[name]
+        row = conn.execute(f"PRAGMA {name}").fetchone()
+        # Some PRAGMAs (e.g. mmap_size on an in-memory database) return no row at all
+        effective = row[0] if row else None
+        report[name] = {
+            "requested": requested,
+            "effective": effective,
+            "applied": effective is not None and _normalize(name, requested) == _normalize(name, effective),
+        }
+    return report
@@ -1,57 +1,120 @@
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+# Distinct statement shapes kept compiled; the repositories use a few dozen
+QUERY_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compile_insert(table: str, columns: Tuple[str, ...]) -> str:
+    placeholders = ", ".join(["?"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compile_update(table: str, columns: Tuple[str, ...], where_keys: Tuple[str, ...]) -> str:
+    set_clause = ", ".join([f"{key} = ?" for key in columns])
+    query = f"UPDATE {table} SET {set_clause}"
+    if where_keys:
+        query += f" WHERE {' AND '.join([f'{key} = ?' for key in where_keys])}"
+    return query
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compile_delete(table: str, where_keys: Tuple[str, ...]) -> str:
+    query = f"DELETE FROM {table}"
+    if where_keys:
+        query += f" WHERE {' AND '.join([f'{key} = ?' for key in where_keys])}"
+    return query
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compile_select(table: str, columns: Optional[Tuple[str, ...]], where_keys: Tuple[str, ...],
+                    order_by: Optional[str], limit: Optional[int], after_keys: Tuple[str, ...]) -> str:
+    columns_clause = ", ".join(columns) if columns else "*"
+    query = f"SELECT {columns_clause} FROM {table}"
+
+    conditions = [f"{key} = ?" for key in where_keys]
+    if after_keys:
+        if len(after_keys) == 1:
+            conditions.append(f"{after_keys[0]} > ?")
+        else:
+            placeholders = ", ".join(["?"] * len(after_keys))
+            conditions.append(f"({', '.join(after_keys)}) > ({placeholders})")
+
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+
+    if order_by:
+        query += f" ORDER BY {order_by}"
+
+    if limit:
+        query += f" LIMIT {limit}"
+
+    return query
+
+
+_COMPILERS = (_compile_insert, _compile_update, _compile_delete, _compile_select)
+
 
 class GenericQueryBuilder:
+    """
+    Builds (query, values) pairs. The SQL for a shape - table, columns, WHERE keys,
+    order and limit - is compiled once and memoized, so a repository method asking for
+    the same statement again only collects its values.
+    """
 
     @staticmethod
     def insert(table: str, data: Dict[str, any]):
 
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?"] * len(data))
-        values = list(data.values())
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-        return query, values
+        query = _compile_insert(table, tuple(data))
+        return query, list(data.values())
 
     @staticmethod
     def update(table: str, data: Dict[str, any], where: Optional[Dict[str, any]] = None):
 
-        set_clause = ", ".join([f"{key} = ?" for key in data.keys()])
-        query = f"UPDATE {table} SET {set_clause}"
+        query = _compile_update(table, tuple(data), tuple(where) if where else ())
+        values = list(data.values())
         if where:
-            where_clause = ", ".join([f"{key} = ?" for key in where.keys()])
-            query += f" WHERE {where_clause}"
-        values = list(data.values()) + list(where.values())
+            values += list(where.values())
         return query, values
 
     @staticmethod
     def delete(table: str, where: Optional[Dict[str, any]] = None):
 
-        query = f"DELETE FROM {table}"
-        values = []
-
-        if where:
-            where_clause = " AND ".join([f"{key} = ?" for key in where.keys()])
-            query += f" WHERE {where_clause}"
-            values = list(where.values())
-
-        return query, values
+        query = _compile_delete(table, tuple(where) if where else ())
+        return query, list(where.values()) if where else []
 
     @staticmethod
     def select(table: str, columns: Optional[List[str]] = None, where: Optional[Dict[str, any]] = None,
-               order_by: Optional[str] = None, limit: Optional[int] = None):
+               order_by: Optional[str] = None, limit: Optional[int] = None, after: Optional[Dict[str, any]] = None):
+        """
+        `after` turns the query into a keyset page: only rows whose key columns sort
+        after the given values are returned, so order_by should list the same columns.
+        """
 
-        columns_clause = ", ".join(columns) if columns else "*"
-        query = f"SELECT {columns_clause} FROM {table}"
+        query = _compile_select(table, tuple(columns) if columns else None, tuple(where) if where else (),
+                                order_by, limit or None, tuple(after) if after else ())
 
         values = []
         if where:
-            where_clause = " AND ".join([f"{key} = ?" for key in where.keys()])
-            query += f" WHERE {where_clause}"
-            values = list(where.values())
+            values += list(where.values())
+        if after:
+            values += list(after.values())
 
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        return query, values
 
-        if limit:
-            query += f" LIMIT {limit}"
+    @staticmethod
+    def stats() -> dict:
+        """Compiled-statement cache counters across all four builders."""
+        infos = [compiler.cache_info() for compiler in _COMPILERS]
+        return {
+            "hits": sum(info.hits for info in infos),
+            "misses": sum(info.misses for info in infos),
+            "size": sum(info.currsize for info in infos),
+        }
 
-        return query, values
+    @staticmethod
+    def clear_cache():
+        for compiler in _COMPILERS:
+            compiler.cache_clear()
@@ -0,0 +1,151 @@
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from logging.handlers import RotatingFileHandler
+from typing import List, Optional
+
+from flask import g, has_request_context, request
+
+from src.app.utils.cache.cache import LRUCache, MISSING
+from src.app.utils.db.db import DB
+
+# Statements worth asking SQLite for a plan
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|REPLACE|WITH)\b", re.IGNORECASE)
+# A plan step that reads a whole table rather than searching an index
+_TABLE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+
+_REPOSITORY_MODULES = "src.app.repositories."
+
+
+@dataclass
+class SlowQuery:
+    sql: str
+    duration_ms: float
+    repository: Optional[str]
+    method: Optional[str]
+    parameter_types: Optional[list]
+    plan: List[str] = field(default_factory=list)
+    table_scans: List[str] = field(default_factory=list)
+    endpoint: Optional[str] = None
+    request_id: Optional[str] = None
+    recorded_at: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _caller():
+    """(repository, method) of the innermost repository frame on the stack, if any."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(_REPOSITORY_MODULES):
+            owner = frame.f_locals.get("self")
+            return (type(owner).__name__ if owner is not None else frame.f_globals["__name__"]), frame.f_code.co_name
+        frame = frame.f_back
+    return None, None
+
+
+def _parameter_types(parameters) -> Optional[list]:
+    # Only the shapes: values may be emails or password hashes
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return [f"{name}:{type(value).__name__}" for name, value in parameters.items()]
+    return [type(value).__name__ for value in parameters]
+
+
+def _file_logger(path: str) -> logging.Logger:
+    logger = logging.getLogger("SlowQueryLogger")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not any(getattr(handler, "slow_query_path", None) == path for handler in logger.handlers):
+        handler = RotatingFileHandler(path, maxBytes=5 * 1024 * 1024, backupCount=3, delay=True)
+        handler.slow_query_path = path
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+class SlowQueryLog:
+    """
+    Records statements that take longer than `threshold_ms`, listening on the DB's
+    query hook: the SQL, timing, the repository method that issued it, the
+    parameter types and SQLite's EXPLAIN QUERY PLAN (cached per SQL string).
+    The newest `capacity` entries are kept in memory; each entry is also written
+    as a JSON line to `log_file`. Statements under the threshold cost one comparison.
+    """
+
+    def __init__(self, db: DB, threshold_ms: float = 100, capacity: int = 200, explain: bool = True,
+                 plan_cache_size: int = 500, log_file: str = None):
+        self.db = db
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self._entries = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._plans = LRUCache(plan_cache_size, ttl=3600)
+        self.recorded = 0
+        self.file_logger = _file_logger(log_file) if log_file else None
+        db.add_query_listener(self.query_executed)
+
+    def query_executed(self, sql, parameters, seconds):
+        if seconds < self.threshold:
+            return
+        repository, method = _caller()
+        plan = self._plan(sql, parameters) if self.explain else []
+        entry = SlowQuery(
+            sql=sql,
+            duration_ms=round(seconds * 1000, 3),
+            repository=repository,
+            method=method,
+            parameter_types=_parameter_types(parameters),
+            plan=plan,
+            table_scans=[match.group(1) for match in map(_TABLE_SCAN.match, plan) if match],
+            endpoint=request.endpoint if has_request_context() else None,
+            request_id=g.get("request_id") if has_request_context() else None,
+            recorded_at=time.time(),
+        )
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+        if self.file_logger is not None:
+            self.file_logger.warning(json.dumps(entry.to_dict(), default=str, separators=(",", ":")))
+
+    def _plan(self, sql: str, parameters) -> List[str]:
+        plan = self._plans.get(sql)
+        if plan is not MISSING:
+            return plan
+        conn = self.db.pool.current_connection()
+        if conn is None or not _EXPLAINABLE.match(sql):
+            return []
+        if parameters is None:
+            # executemany: the values don't change the plan, only their number matters
+            parameters = (None,) * sql.count("?")
+        try:
+            # sqlite3's own execute, so the EXPLAIN isn't reported to the query listeners
+            rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+            plan = [row[3] for row in rows]
+        except sqlite3.Error as e:
+            plan = [f"EXPLAIN failed: {e}"]
+        self._plans.set(sql, plan)
+        return plan
+
+    def entries(self, limit: int = None) -> List[SlowQuery]:
+        """Recorded slow statements, newest first."""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"recorded": self.recorded, "buffered": len(self._entries),
+                    "threshold_ms": self.threshold * 1000}
@@ -51,3 +51,25 @@ class InvalidRequestBody(Exception):
         super().__init__(message)
 
 
+
+
+class PoolExhaustedError(DatabaseError):
+    """Raised when no pooled connection becomes free within the checkout timeout"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class InvalidCursorError(InvalidRequestBody):
+    """Raised when a pagination continuation token can't be decoded"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class HashingBusyError(Exception):
+    """Raised when the password hashing pool is saturated and the request should be retried later"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
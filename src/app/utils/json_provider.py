@@ -0,0 +1,81 @@
+from datetime import date
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib provider is used instead
+    orjson = None
+
+JSON_PROVIDERS = ("auto", "orjson", "stdlib")
+
+
+def _default(o):
+    # ISO 8601 for dates (IssuedBooks.borrow_date/return_date), matching what orjson writes natively,
+    # instead of Flask's RFC 822 HTTP dates
+    if isinstance(o, date):
+        return o.isoformat()
+    return DefaultJSONProvider.default(o)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """
+    Flask's stdlib provider, but writing what orjson writes: ISO 8601 dates and
+    UTF-8 text instead of \\u escapes.
+    """
+
+    default = staticmethod(_default)
+    ensure_ascii = False
+
+
+class OrjsonJSONProvider(StdlibJSONProvider):
+    """
+    Encodes responses with orjson straight to bytes: sorted keys and compact output,
+    like the stdlib provider out of debug mode. Pretty output (debug mode), calls with
+    json.dumps keyword arguments and values orjson rejects (e.g. ints over 64 bits)
+    go through the stdlib encoder.
+    """
+
+    def _option(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def _pretty(self) -> bool:
+        return (self.compact is None and self._app.debug) or self.compact is False
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._option()).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self._pretty():
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._option() | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def install_json_provider(app: Flask, name: str = "auto") -> DefaultJSONProvider:
+    """Set `app.json` to the named provider; "auto" picks orjson when it is installed."""
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"unknown JSON provider {name!r}, expected one of {', '.join(JSON_PROVIDERS)}")
+    if name == "orjson" and orjson is None:
+        raise RuntimeError("JSON provider 'orjson' requested but orjson is not installed")
+    provider_class = OrjsonJSONProvider if name != "stdlib" and orjson is not None else StdlibJSONProvider
+    app.json = provider_class(app)
+    return app.json
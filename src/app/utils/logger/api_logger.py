@@ -1,52 +1,80 @@
 import functools
+import logging
+import time
 from flask import request, g
 from src.app.utils.logger.logger import Logger
 
 
+class _RequestDetails:
+    """
+    Request description passed to the logger as a %-argument, so headers and
+    body are only read and formatted if a handler actually emits the record.
+    """
+
+    __slots__ = ("logger", "handler", "include_headers")
+
+    def __init__(self, logger: Logger, handler: str = None, include_headers: bool = True):
+        self.logger = logger
+        self.handler = handler
+        self.include_headers = include_headers
+
+    def __str__(self):
+        lines = [
+            "User Context:",
+            f"  - user_id: {getattr(g, 'user_id', 'Unknown')}",
+            f"  - role: {getattr(g, 'role', 'Unknown')}",
+            "Request Context:",
+            f"  - method: {request.method}",
+            f"  - path: {request.path}",
+            f"  - client_ip: {request.remote_addr}",
+        ]
+        if self.include_headers:
+            lines.append(f"  - headers: {dict(request.headers)}")
+        lines.append(f"  - body: {self.logger._sanitize_body(request.get_json(silent=True) or {})}")
+        if self.handler:
+            lines += ["Function Context:", f"  - handler: {self.handler}\n"]
+        return "\n".join(lines)
+
+
+def _status_of(result) -> int:
+    """Status code of a handler's return value: a `(body, status)` tuple or a response object."""
+    if isinstance(result, tuple) and len(result) > 1 and isinstance(result[1], int):
+        return result[1]
+    return getattr(result, "status_code", 200)
+
+
 def api_logger(logger: Logger):
     def logger_wrapper(func):
 
         @functools.wraps(func)
         def wrapped_func(*args, **kwargs):
+            logger.bind_request_context()
+            debug = logger.is_enabled_for(logging.DEBUG)
+            started = time.perf_counter()
             try:
-                sanitized_body = logger._sanitize_body(request.get_json(silent=True) or {})
-                user_id = getattr(g, 'user_id', 'Unknown')
-                role = getattr(g, 'role', 'Unknown')
-
-                logger.debug(
-                    f"Entering {func.__name__}\n"
-                    f"User Context:\n"
-                    f"  - user_id: {user_id}\n"
-                    f"  - role: {role}\n"
-                    f"Request Context:\n"
-                    f"  - method: {request.method}\n"
-                    f"  - path: {request.path}\n"
-                    f"  - client_ip: {request.remote_addr}\n"
-                    f"  - headers: {dict(request.headers)}\n"
-                    f"  - body: {sanitized_body}\n"
-                    f"Function Context:\n"
-                    f"  - handler: {type(args[0]).__name__ if args else 'Unknown'}\n"
-                )
+                if debug:
+                    handler = type(args[0]).__name__ if args else 'Unknown'
+                    logger.debug("Entering %s\n%s", func.__name__, _RequestDetails(logger, handler))
 
                 result = func(*args, **kwargs)
 
-                logger.info(f"{func.__name__} executed successfully.")
+                status = _status_of(result)
+                duration_ms = round((time.perf_counter() - started) * 1000, 3)
+                if status < 400:
+                    logger.info("%s executed successfully.", func.__name__, status=status, duration_ms=duration_ms)
+                else:
+                    # Failed requests are logged even when the request was not sampled
+                    logger.warning("%s returned status %s.", func.__name__, status,
+                                   status=status, duration_ms=duration_ms)
                 return result
             except Exception as e:
-                logger.error(
-                    f"Error occurred in {func.__name__}: {str(e)}\n"
-                    f"User Context:\n"
-                    f"  - user_id: {user_id}\n"
-                    f"  - role: {role}\n"
-                    f"Request Context:\n"
-                    f"  - method: {request.method}\n"
-                    f"  - path: {request.path}\n"
-                    f"  - client_ip: {request.remote_addr}\n"
-                    f"  - body: {sanitized_body}"
-                )
+                logger.error("Error occurred in %s: %s\n%s", func.__name__, e,
+                             _RequestDetails(logger, include_headers=False),
+                             status=500, duration_ms=round((time.perf_counter() - started) * 1000, 3))
                 raise
             finally:
-                logger.debug(f"Exiting {func.__name__}")
+                if debug:
+                    logger.debug("Exiting %s", func.__name__)
 
         return wrapped_func
 
@@ -0,0 +1,177 @@
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
+from typing import Callable, List, Optional, Union
+
+from src.app.config.enumeration import LogOverflowPolicy
+
+_STOP = object()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Puts records on a bounded queue instead of writing them from the calling thread.
+
+    The message is merged with its arguments before queuing (the arguments may
+    reference the request), everything else is left to the listener. When the
+    queue is full the overflow policy decides what happens:
+
+    - drop-oldest: discard the oldest queued record to make room
+    - drop-debug: discard the new record if it is DEBUG or lower, otherwise wait for room
+    - block: wait for room
+
+    Once the listener is stopping, `fall_back_to` makes records skip the queue and
+    go to the given callable on the calling thread instead.
+    """
+
+    def __init__(self, max_size: int = 10000, policy: Union[LogOverflowPolicy, str] = LogOverflowPolicy.DROP_DEBUG):
+        super().__init__(queue.Queue(max_size))
+        self.policy = LogOverflowPolicy(policy)
+        self._counter_lock = threading.Lock()
+        self.queued = 0
+        self.dropped = 0
+        self.fallback: Optional[Callable[[logging.LogRecord], None]] = None
+
+    def fall_back_to(self, handle: Callable[[logging.LogRecord], None]):
+        """Stop queuing: from now on every record is passed to `handle` synchronously."""
+        self.fallback = handle
+
+    def emit(self, record: logging.LogRecord):
+        fallback = self.fallback
+        if fallback is not None:
+            fallback(record)
+            return
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.policy is LogOverflowPolicy.DROP_OLDEST:
+            while True:
+                try:
+                    self.queue.put_nowait(record)
+                    break
+                except queue.Full:
+                    try:
+                        oldest = self.queue.get_nowait()
+                    except queue.Empty:
+                        continue
+                    if oldest is _STOP:
+                        # Never discard the listener's stop sentinel; drop the new record instead
+                        self.queue.put(_STOP)
+                        self._count_drop()
+                        return
+                    self._count_drop()
+        elif self.policy is LogOverflowPolicy.DROP_DEBUG and record.levelno <= logging.DEBUG:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._count_drop()
+                return
+        else:
+            self.queue.put(record)
+        with self._counter_lock:
+            self.queued += 1
+
+    def _count_drop(self):
+        with self._counter_lock:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        with self._counter_lock:
+            return {
+                "policy": self.policy.value,
+                "max_size": self.queue.maxsize,
+                "depth": self.queue.qsize(),
+                "queued": self.queued,
+                "dropped": self.dropped,
+            }
+
+
+class BatchingQueueListener:
+    """
+    Background thread that drains a BoundedQueueHandler's queue in batches.
+
+    It waits for the first record, then takes whatever else is already queued
+    (up to `batch_size`), hands the batch to the handlers and flushes each
+    handler once per batch rather than once per record. A handler that raises
+    is reported through its handleError, so the thread never dies on a bad
+    record or a full disk.
+    """
+
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler], batch_size: int = 256):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.batches = 0
+        self.written = 0
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write out everything queued so far, then stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        # Records that raced in behind the sentinel are written here rather than left queued
+        leftovers = [record for record in self._take(self.queue.qsize()) if record is not _STOP]
+        if leftovers:
+            self._write(leftovers)
+
+    def handle(self, record: logging.LogRecord):
+        """Write one record straight to the handlers, on the calling thread."""
+        self._write([record])
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get(), *self._take(self.batch_size - 1)]
+            stopping = any(record is _STOP for record in batch)
+            records = [record for record in batch if record is not _STOP]
+            if records:
+                self._write(records)
+            if stopping:
+                return
+
+    def _take(self, limit: int) -> list:
+        # Whatever is already queued, up to `limit`, without waiting
+        taken = []
+        while len(taken) < limit:
+            try:
+                taken.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return taken
+
+    def _write(self, records: List[logging.LogRecord]):
+        for record in records:
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                handler.handleError(records[-1])
+        self.batches += 1
+        self.written += len(records)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that writes without flushing; the listener flushes once per batch."""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
@@ -1,7 +1,14 @@
+import atexit
 import logging
+import random
 from logging.handlers import RotatingFileHandler
 from threading import Lock
-from flask import g
+from flask import g, has_request_context, request
+
+import src.app.config.config as config
+from src.app.utils.logger.async_logging import BatchingQueueListener, BoundedQueueHandler, BufferedRotatingFileHandler
+from src.app.utils.logger.formatters import JsonFormatter
+from src.app.utils.logger.request_id import current_request_id
 
 
 class Logger:
@@ -17,20 +24,39 @@ class Logger:
 
     def _initialize_logger(self):
         self.logger = logging.getLogger("ThreadSafeLogger")
-        self.logger.setLevel(logging.DEBUG)  # Set to the lowest level to capture all logs
+        self.logger.setLevel(config.LOG_LEVEL)
 
         # Rotating File Handler (Thread-Safe)
-        file_handler = RotatingFileHandler("app.log", maxBytes=5 * 1024 * 1024, backupCount=3)
+        handler_class = BufferedRotatingFileHandler if config.LOG_ASYNC_ENABLED else RotatingFileHandler
+        file_handler = handler_class("app.log", maxBytes=5 * 1024 * 1024, backupCount=3)
         file_handler.setLevel(logging.DEBUG)
 
         # Custom Formatter with extra fields
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s - %(context)s"
-        )
+        if config.LOG_FORMAT == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(message)s - %(context)s"
+            )
         file_handler.setFormatter(formatter)
 
-        # Adding Handler
-        self.logger.addHandler(file_handler)
+        self.queue_handler = None
+        self.listener = None
+        if config.LOG_ASYNC_ENABLED:
+            # Request threads only enqueue; a background thread writes the file in batches
+            self.queue_handler = BoundedQueueHandler(config.LOG_QUEUE_SIZE, config.LOG_OVERFLOW_POLICY)
+            self.listener = BatchingQueueListener(self.queue_handler.queue, [file_handler], config.LOG_BATCH_SIZE)
+            self.listener.start()
+            atexit.register(self._stop_listener)
+            self.logger.addHandler(self.queue_handler)
+        else:
+            # Adding Handler
+            self.logger.addHandler(file_handler)
+
+    def _stop_listener(self):
+        # Anything logged from here on (by later atexit hooks, say) is written on the calling thread
+        self.queue_handler.fall_back_to(self.listener.handle)
+        self.listener.stop()
 
     def _sanitize_body(self, body):
         """
@@ -46,21 +72,66 @@ class Logger:
                 redacted_body[key] = "***"  # Mask the sensitive value
         return redacted_body
 
-    def _get_context(self):
-        """Retrieve user_id and role from Flask's `g`."""
-        user_id = getattr(g, "user_id", "unknown")
-        role = getattr(g, "role", "unknown")
-        return f"for user_id={user_id} | role={role}"
+    def stats(self) -> dict:
+        """Queue depth and queued/dropped counters when logging asynchronously."""
+        if self.queue_handler is None:
+            return {"async": False}
+        return {
+            "async": True,
+            **self.queue_handler.stats(),
+            "batches": self.listener.batches,
+            "written": self.listener.written,
+        }
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def bind_request_context(self):
+        """
+        Capture the request's log fields once; every later log line in the request reuses them.
+        This is also where the request is sampled: for a request that is not sampled, DEBUG and
+        INFO lines are skipped, while warnings and errors are always logged.
+        """
+        fields = self._build_context()
+        g.log_fields = fields
+        g.log_context = f"for user_id={fields['user_id']} | role={fields['role']}"
+        rate = config.LOG_SAMPLE_RATES.get(fields["route"], config.LOG_SAMPLE_RATE)
+        g.log_sampled = rate >= 1 or random.random() < rate
+
+    def _build_context(self) -> dict:
+        return {
+            "request_id": current_request_id(),
+            "user_id": getattr(g, "user_id", "unknown"),
+            "role": getattr(g, "role", "unknown"),
+            "method": request.method,
+            "route": request.url_rule.rule if request.url_rule else request.path,
+        }
+
+    def _log(self, level: int, message: str, args, fields=None):
+        # Nothing (not even the context) is built for a level that would be dropped;
+        # `args` are %-formatted by logging only when a handler emits the record
+        if not self.logger.isEnabledFor(level):
+            return
+        if not has_request_context():
+            self.logger.log(level, message, *args, extra={"context": "no request context", "fields": fields})
+            return
+        if level < logging.WARNING and not g.get("log_sampled", True):
+            return
+        if "log_fields" not in g:
+            self.bind_request_context()
+        if fields:
+            fields = {**g.log_fields, **fields}
+        self.logger.log(level, message, *args, extra={"context": g.log_context, "fields": fields or g.log_fields})
 
     # Convenience methods for logging
-    def info(self, message: str):
-        self.logger.info(message, extra={"context": self._get_context()})
+    def info(self, message: str, *args, **fields):
+        self._log(logging.INFO, message, args, fields)
 
-    def error(self, message: str):
-        self.logger.error(message, extra={"context": self._get_context()})
+    def error(self, message: str, *args, **fields):
+        self._log(logging.ERROR, message, args, fields)
 
-    def warning(self, message: str):
-        self.logger.warning(message, extra={"context": self._get_context()})
+    def warning(self, message: str, *args, **fields):
+        self._log(logging.WARNING, message, args, fields)
 
-    def debug(self, message: str):
-        self.logger.debug(message, extra={"context": self._get_context()})
+    def debug(self, message: str, *args, **fields):
+        self._log(logging.DEBUG, message, args, fields)
@@ -0,0 +1,30 @@
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from flask import g, request
+
+# Incoming IDs are reused only if they are short and safe to write into logs and headers
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# The current request's id, bound by the request-id middleware for the length of the request
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def new_request_id() -> str:
+    incoming = request.headers.get(REQUEST_ID_HEADER)
+    if incoming and _VALID_REQUEST_ID.match(incoming):
+        return incoming
+    return uuid.uuid4().hex
+
+
+def current_request_id() -> str:
+    """The id bound by the middleware or, for a request that skipped it, one made now and kept on g."""
+    request_id = request_id_var.get()
+    if request_id is None:
+        if "request_id" not in g:
+            g.request_id = new_request_id()
+        request_id = g.request_id
+    return request_id
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from src.app.config.messages import INVALID_CURSOR, INVALID_PAGE_LIMIT
+from src.app.utils.errors.error import InvalidCursorError, InvalidRequestBody
+import src.app.config.config as config
+
+
+def encode_cursor(scope: str, key: Dict[str, any]) -> str:
+    """Opaque continuation token holding the sort key of the last row on a page."""
+    payload = json.dumps({"s": scope, "k": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(scope: str, token: str, *keys: str) -> Dict[str, any]:
+    """Decode a token produced by `encode_cursor` for the same listing and check it carries `keys`."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise InvalidCursorError(INVALID_CURSOR)
+    if not isinstance(payload, dict) or payload.get("s") != scope or not isinstance(payload.get("k"), dict) \
+            or any(key not in payload["k"] for key in keys):
+        raise InvalidCursorError(INVALID_CURSOR)
+    return payload["k"]
+
+
+def parse_limit(raw: Optional[str]) -> int:
+    """Page size from a query string value, clamped to PAGE_SIZE_MAX."""
+    if raw is None:
+        return config.PAGE_SIZE_DEFAULT
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise InvalidRequestBody(INVALID_PAGE_LIMIT)
+    if limit < 1:
+        raise InvalidRequestBody(INVALID_PAGE_LIMIT)
+    return min(limit, config.PAGE_SIZE_MAX)
+
+
+@dataclass
+class Page:
+    items: List[any]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+    @classmethod
+    def from_rows(cls, rows: List[any], limit: int, scope: str, key: Callable[[any], Dict[str, any]]):
+        """
+        Build a page from up to `limit + 1` rows. The extra row only tells us
+        whether another page exists; it is not returned.
+        """
+        has_more = len(rows) > limit
+        items = rows[:limit]
+        next_cursor = encode_cursor(scope, key(items[-1])) if has_more else None
+        return cls(items=items, next_cursor=next_cursor, has_more=has_more)
+
+    def meta(self) -> Dict[str, any]:
+        return {"next_cursor": self.next_cursor, "has_more": self.has_more}
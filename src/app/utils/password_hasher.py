@@ -0,0 +1,106 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app.config.messages import SERVER_BUSY_TRY_AGAIN
+from src.app.utils.errors.error import HashingBusyError
+from src.app.utils.utils import Utils
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool.
+
+    bcrypt releases the GIL, so at most `workers` hashes burn CPU at once no
+    matter how many request threads are logging in. Up to `queue_size` more
+    calls may wait for a worker; beyond that `hash`/`verify` fail fast with
+    HashingBusyError, which carries a Retry-After estimate based on recent
+    hash times.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 32, rounds: int = 12):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._pending = 0  # admitted, not finished
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._hash_times = deque(maxlen=256)  # seconds spent in bcrypt
+        self._latencies = deque(maxlen=256)  # seconds from submit to result
+
+    def hash(self, password: str) -> str:
+        return self._run(Utils.hash_password, password, self.rounds)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(Utils.check_password, password, hashed_password)
+
+    def _run(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingBusyError(SERVER_BUSY_TRY_AGAIN, self.retry_after())
+        submitted = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+        try:
+            return self._executor.submit(self._timed, func, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                self._latencies.append(time.perf_counter() - submitted)
+            self._slots.release()
+
+    def _timed(self, func, *args):
+        with self._lock:
+            self._running += 1
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._hash_times.append(time.perf_counter() - started)
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog should have drained, at least 1."""
+        with self._lock:
+            average = sum(self._hash_times) / len(self._hash_times) if self._hash_times else 0.25
+            backlog = self._pending + 1
+        return max(1, math.ceil(average * backlog / self.workers))
+
+    @staticmethod
+    def _percentile(samples, fraction: float) -> float:
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def stats(self) -> dict:
+        with self._lock:
+            hash_times = list(self._hash_times)
+            latencies = list(self._latencies)
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "rounds": self.rounds,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "hash_ms_avg": sum(hash_times) / len(hash_times) * 1000 if hash_times else 0.0,
+                "latency_ms_p50": self._percentile(latencies, 0.50) * 1000,
+                "latency_ms_p95": self._percentile(latencies, 0.95) * 1000,
+                "latency_ms_max": max(latencies) * 1000 if latencies else 0.0,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
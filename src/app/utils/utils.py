@@ -11,11 +11,11 @@ class Utils:
     SECRET_KEY = "SECRET"
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    def hash_password(password: str, rounds: int = 12) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using bcrypt with the given cost factor.
         """
-        return hashpw(password.encode('utf-8'), gensalt()).decode('utf-8')
+        return hashpw(password.encode('utf-8'), gensalt(rounds)).decode('utf-8')
 
     @staticmethod
     def check_password(password: str, hashed_password: str) -> bool:
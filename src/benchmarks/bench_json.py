@@ -0,0 +1,72 @@
+"""
+JSON encoding of handler responses: the stdlib provider vs the orjson provider.
+
+Encodes a catalog page and an issued-book page in the `Response.response`
+envelope through `app.json.response`, which is what Flask calls for the
+`(dict, status)` tuples the handlers return. Issued books carry `date`
+values, as they do when they come from a request rather than the DB.
+
+    python -m src.benchmarks.bench_json [--rows N] [--iterations N]
+"""
+import argparse
+import time
+from datetime import date, timedelta
+
+from flask import Flask
+
+from src.app.config.enumeration import Status
+from src.app.model.books import Books
+from src.app.model.issued_books import IssuedBooks
+from src.app.model.responses import Response
+from src.app.utils.json_provider import install_json_provider, orjson
+
+
+def _payloads(rows: int) -> dict:
+    books = [Books(title=f"Title {i}", author=f"Author {i % 97}", no_of_copies=3, no_of_available=2, id=f"book-{i}")
+             for i in range(rows)]
+    issued = [IssuedBooks(user_id=f"user-{i % 50}", book_id=f"book-{i}", borrow_date=date(2024, 1, 1),
+                          return_date=date(2024, 1, 1) + timedelta(days=i % 30), id=f"issue-{i}")
+              for i in range(rows)]
+    pagination = {"next_cursor": "eyJzIjoiYm9vayIsImsiOnsidGl0bGUiOiJUaXRsZSA5OSJ9fQ", "has_more": True}
+    return {
+        "catalog": Response.response("Book fetched successfully", Status.SUCCESS.value,
+                                     data=[book.to_dict() for book in books], pagination=pagination),
+        "issued": Response.response("Issue book fetched successfully", Status.SUCCESS.value,
+                                    data=[issued_book.to_dict() for issued_book in issued], pagination=pagination),
+    }
+
+
+def _time_per_call(app: Flask, payload: dict, iterations: int) -> float:
+    with app.app_context():
+        for _ in range(min(10, iterations)):
+            app.json.response(payload)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            app.json.response(payload)
+        return (time.perf_counter() - started) / iterations
+
+
+def run(rows: int, iterations: int) -> dict:
+    app = Flask(__name__)
+    providers = ["stdlib"] + (["orjson"] if orjson is not None else [])
+    results = {}
+    for name, payload in _payloads(rows).items():
+        for provider in providers:
+            install_json_provider(app, provider)
+            results[f"{name}_{provider}_ms"] = _time_per_call(app, payload, iterations) * 1e3
+        if orjson is not None:
+            results[f"{name}_speedup"] = results[f"{name}_stdlib_ms"] / results[f"{name}_orjson_ms"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    for name, value in run(args.rows, args.iterations).items():
+        print(f"{name:>20}: {value:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Materializing and serializing book rows: the old dict-backed model vs the slotted one.
+
+Rows are fetched once from an in-memory SQLite table with the same row factory
+the pool uses (sqlite3.Row). Each model then builds N objects from those rows,
+the way the repositories do, and turns them into dicts, the way the handlers
+do. Memory is what the list of objects keeps alive, measured with tracemalloc.
+
+    python -m src.benchmarks.bench_models [--rows N]
+"""
+import argparse
+import gc
+import sqlite3
+import time
+import tracemalloc
+import uuid
+
+from src.app.model.books import Books
+
+
+class _DictBooks:
+    """The model as it was before __slots__: kwargs construction and a per-instance __dict__."""
+
+    def __init__(self, title, author, no_of_copies=1, no_of_available=1, id=None):
+        self.id = id if id else str(uuid.uuid4())
+        self.title = title
+        self.author = author
+        self.no_of_copies = no_of_copies
+        self.no_of_available = no_of_available
+
+
+def _legacy_build(row):
+    return _DictBooks(id=row[0], title=row[1], author=row[2], no_of_copies=row[3], no_of_available=row[4])
+
+
+def _fetch_rows(count: int) -> list:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE book (id TEXT PRIMARY KEY, title TEXT, author TEXT, "
+                 "number_of_copies INTEGER, number_of_available_books INTEGER)")
+    conn.executemany("INSERT INTO book VALUES (?, ?, ?, ?, ?)",
+                     ((str(uuid.uuid4()), f"Title {i}", f"Author {i % 997}", 3, 2) for i in range(count)))
+    rows = conn.execute("SELECT id, title, author, number_of_copies, number_of_available_books FROM book").fetchall()
+    conn.close()
+    return rows
+
+
+def _best_of(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _retained_bytes(build, rows) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(row) for row in rows]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return retained
+
+
+def run(count: int) -> dict:
+    rows = _fetch_rows(count)
+    results = {}
+    for name, build, to_dict in (
+        ("dict", _legacy_build, lambda book: dict(book.__dict__)),
+        ("slots", Books.from_row, Books.to_dict),
+    ):
+        objects = [build(row) for row in rows]
+        results[f"{name}_build_rows_per_s"] = count / _best_of(lambda: [build(row) for row in rows])
+        results[f"{name}_to_dict_rows_per_s"] = count / _best_of(lambda: [to_dict(book) for book in objects])
+        results[f"{name}_retained_mib"] = _retained_bytes(build, rows) / 2 ** 20
+        del objects
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    for name, value in run(args.rows).items():
+        print(f"{name:>26}: {value:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
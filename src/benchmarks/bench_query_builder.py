@@ -0,0 +1,106 @@
+"""
+GenericQueryBuilder: building the repositories' statements with and without the compiled-statement cache.
+
+Each case is a statement shape a repository asks for on a hot path. "compiled" goes
+through GenericQueryBuilder as the repositories do (after the first call, a cache
+hit plus collecting the values); "uncached" runs the same SQL construction every
+call, the way the builder worked before. The last case executes the statement on
+an in-memory SQLite table, to put the builder's share of a lookup in perspective.
+
+    python -m src.benchmarks.bench_query_builder [--calls N]
+"""
+import argparse
+import sqlite3
+import time
+
+from src.app.utils.db import query as query_module
+from src.app.utils.db.query import GenericQueryBuilder
+
+BOOK_COLUMNS = ["id", "title", "author", "number_of_copies", "number_of_available_books"]
+
+
+def _uncached_select(table, columns=None, where=None, order_by=None, limit=None, after=None):
+    sql = query_module._compile_select.__wrapped__(table, tuple(columns) if columns else None,
+                                                   tuple(where) if where else (), order_by, limit or None,
+                                                   tuple(after) if after else ())
+    return sql, list(where.values()) if where else []
+
+
+def _uncached_insert(table, data):
+    return query_module._compile_insert.__wrapped__(table, tuple(data)), list(data.values())
+
+
+def _uncached_update(table, data, where):
+    return query_module._compile_update.__wrapped__(table, tuple(data), tuple(where)), \
+        list(data.values()) + list(where.values())
+
+
+CASES = {
+    "select_by_title": (
+        lambda: GenericQueryBuilder.select("book", BOOK_COLUMNS, {"title": "Dune"}),
+        lambda: _uncached_select("book", BOOK_COLUMNS, {"title": "Dune"}),
+    ),
+    "select_page": (
+        lambda: GenericQueryBuilder.select("book", BOOK_COLUMNS, order_by="title", limit=100,
+                                           after={"title": "Dune"}),
+        lambda: _uncached_select("book", BOOK_COLUMNS, order_by="title", limit=100, after={"title": "Dune"}),
+    ),
+    "insert_issue": (
+        lambda: GenericQueryBuilder.insert("issuedBook", {"id": "i", "user_id": "u", "book_id": "b",
+                                                          "borrow_date": "2024-01-01", "return_date": "2024-01-15"}),
+        lambda: _uncached_insert("issuedBook", {"id": "i", "user_id": "u", "book_id": "b",
+                                                "borrow_date": "2024-01-01", "return_date": "2024-01-15"}),
+    ),
+    "update_book": (
+        lambda: GenericQueryBuilder.update("book", {"title": "Dune", "author": "Frank Herbert"}, {"id": "b"}),
+        lambda: _uncached_update("book", {"title": "Dune", "author": "Frank Herbert"}, {"id": "b"}),
+    ),
+}
+
+
+def _per_call_ns(func, calls: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e9
+
+
+def _lookup_ns(calls: int) -> float:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE book (id TEXT PRIMARY KEY, title TEXT UNIQUE, author TEXT, "
+                 "number_of_copies INTEGER, number_of_available_books INTEGER)")
+    conn.executemany("INSERT INTO book VALUES (?, ?, ?, 3, 2)", ((str(i), f"Title {i}", "A") for i in range(1000)))
+
+    def lookup():
+        sql, values = GenericQueryBuilder.select("book", BOOK_COLUMNS, {"title": "Title 500"})
+        conn.execute(sql, values).fetchall()
+
+    try:
+        return _per_call_ns(lookup, calls)
+    finally:
+        conn.close()
+
+
+def run(calls: int) -> dict:
+    GenericQueryBuilder.clear_cache()
+    results = {}
+    for name, (compiled, uncached) in CASES.items():
+        results[f"{name}_uncached_ns"] = _per_call_ns(uncached, calls)
+        results[f"{name}_compiled_ns"] = _per_call_ns(compiled, calls)
+    results["select_by_title_executed_ns"] = _lookup_ns(calls)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+    for name, value in run(args.calls).items():
+        print(f"{name:>30}: {value:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""
+Load test for the API: latency percentiles and throughput per route.
+
+A library is seeded into a fresh SQLite file (src/benchmarks/seed.py) and the real
+create_app() serves it. Worker threads then run a fixed, seeded mix of user and
+admin scenarios - catalog pages, title lookups, search, loan lists, logins and
+issue-then-return - through one or both drivers:
+
+    client  Flask's test client, in process: the app's own cost, no sockets
+    http    a threaded local HTTP server, with one keep-alive connection per worker
+
+Each route gets its count, statuses, requests per second and p50/p95/p99 latency,
+written as JSON so two commits can be diffed. A route that never answered with a
+2xx/3xx status fails the run with exit status 1: its latencies would only time the
+rejection. With --baseline, a route whose p95 or p99 grew (or whose throughput
+fell) by more than --max-regression against the baseline report fails it too.
+
+    python -m src.benchmarks.load_test [--driver client|http|both] [--scenarios N] [--concurrency N]
+        [--users N] [--books N] [--issues N] [--seed N] [--output report.json]
+        [--baseline report.json] [--max-regression 0.25]
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Callable, List, Optional
+from urllib.parse import urlencode
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+import src.app.config.config as config
+from src.app.config.enumeration import Role
+from src.app.utils.db.db import DB
+from src.app.utils.utils import Utils
+from src.benchmarks.seed import SeededLibrary, seed_library
+
+DRIVERS = ("client", "http")
+# Latency growth below this many milliseconds is treated as noise by the gate
+MIN_DELTA_MS = 1.0
+
+
+class ClientDriver:
+    """Requests go straight into the WSGI app through Flask's test client."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def session(self) -> Callable:
+        client = self.app.test_client()
+
+        def send(method: str, path: str, headers: dict, body) -> int:
+            response = client.open(path, method=method, headers=headers, json=body)
+            status = response.status_code
+            response.close()
+            return status
+        return send
+
+    def close(self):
+        pass
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class HTTPDriver:
+    """Requests go over loopback HTTP to a threaded werkzeug server running the app."""
+
+    def __init__(self, app):
+        self.server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=_QuietRequestHandler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def session(self) -> Callable:
+        host, port = self.server.server_address[:2]
+        state = {"conn": None}
+
+        def send(method: str, path: str, headers: dict, body) -> int:
+            payload = json.dumps(body) if body is not None else None
+            headers = {**headers, "Content-Type": "application/json"} if payload is not None else headers
+            for attempt in range(2):
+                if state["conn"] is None:
+                    state["conn"] = http.client.HTTPConnection(host, port, timeout=30)
+                try:
+                    state["conn"].request(method, path, body=payload, headers=headers)
+                    response = state["conn"].getresponse()
+                    response.read()
+                    if response.will_close:
+                        state["conn"].close()
+                        state["conn"] = None
+                    return response.status
+                except (http.client.HTTPException, ConnectionError):
+                    # The server dropped the keep-alive connection; reconnect once
+                    state["conn"].close()
+                    state["conn"] = None
+                    if attempt:
+                        raise
+        return send
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Session:
+    """One worker: its user, its random stream, and the samples it recorded."""
+
+    def __init__(self, send: Callable, library: SeededLibrary, index: int, seed: int):
+        self._send = send
+        self.library = library
+        self.rng = random.Random(seed * 1000 + index)
+        self.user_index = index % len(library.user_ids)
+        self.user_id = library.user_ids[self.user_index]
+        self.user_headers = {"Authorization": "Bearer " + Utils.create_jwt_token(self.user_id, Role.USER.value)}
+        self.admin_headers = {"Authorization": "Bearer " + Utils.create_jwt_token(library.admin_id,
+                                                                                 Role.ADMIN.value)}
+        self.samples = []  # (route, status, seconds)
+
+    def send(self, route: str, method: str, path: str, headers: dict = None, body=None) -> int:
+        started = time.perf_counter()
+        try:
+            status = self._send(method, path, headers or {}, body)
+        except Exception:
+            status = 0  # transport failure, counted as an error
+        self.samples.append((route, status, time.perf_counter() - started))
+        return status
+
+
+def _list_books(session: Session):
+    session.send("list_books", "GET", "/user/book?limit=50", session.user_headers)
+
+
+def _catalog_snapshot(session: Session):
+    session.send("catalog_snapshot", "GET", "/user/book", session.user_headers)
+
+
+def _book_by_title(session: Session):
+    title = session.rng.choice(session.library.titles)
+    session.send("book_by_title", "GET", "/user/book?" + urlencode({"title": title}), session.user_headers)
+
+
+def _search(session: Session):
+    term = session.rng.choice(session.library.search_terms)
+    session.send("search_books", "GET", "/user/book/search?" + urlencode({"q": term[:4], "prefix": "true"}),
+                 session.user_headers)
+
+
+def _my_loans(session: Session):
+    session.send("my_loans", "GET", "/book/issue-book", session.user_headers)
+
+
+def _admin_loans(session: Session):
+    session.send("admin_loans", "GET", "/book/issue-book?limit=50", session.admin_headers)
+
+
+def _login(session: Session):
+    email = session.library.user_emails[session.user_index]
+    session.send("login", "POST", "/user/login", body={"email": email, "password": session.library.password})
+
+
+def _issue_and_return(session: Session):
+    # Two workers can still race for a last copy; the loser's refusal shows up under the issue_book statuses
+    book_id = session.rng.choice(session.library.available_book_ids)
+    due = (date.today() + timedelta(days=14)).isoformat()
+    status = session.send("issue_book", "POST", "/book/issue-book", session.user_headers,
+                          {"book_id": book_id, "return_date": due})
+    if status == 200:
+        session.send("return_book", "PATCH", f"/book/return-book/{book_id}", session.user_headers)
+
+
+# (scenario, weight): mostly catalog reads, as in a library's day
+SCENARIOS = (
+    (_list_books, 20),
+    (_catalog_snapshot, 10),
+    (_book_by_title, 15),
+    (_search, 20),
+    (_my_loans, 10),
+    (_admin_loans, 5),
+    (_login, 5),
+    (_issue_and_return, 15),
+)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    # Nearest rank; no samples reads as 0
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _summary(samples: list, wall: float) -> dict:
+    latencies = sorted(seconds * 1000 for _, _, seconds in samples)
+    statuses = Counter(status for _, status, _ in samples)
+    return {
+        "count": len(samples),
+        "errors": sum(count for status, count in statuses.items() if status == 0 or status >= 500),
+        "client_errors": sum(count for status, count in statuses.items() if 400 <= status < 500),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": round(len(samples) / wall, 2) if wall else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(_percentile(latencies, 0.50), 3),
+        "p95_ms": round(_percentile(latencies, 0.95), 3),
+        "p99_ms": round(_percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+def _run_workers(driver, library: SeededLibrary, scenario_count: int, concurrency: int, seed: int):
+    """Run `scenario_count` scenarios split across `concurrency` threads; returns (samples, wall seconds)."""
+    scenarios = [scenario for scenario, _ in SCENARIOS]
+    weights = [weight for _, weight in SCENARIOS]
+    sessions = [Session(driver.session(), library, index, seed) for index in range(concurrency)]
+    start = threading.Barrier(concurrency + 1)
+
+    def work(session: Session, count: int):
+        plan = session.rng.choices(scenarios, weights, k=count)
+        start.wait()
+        for scenario in plan:
+            scenario(session)
+
+    shares = [scenario_count // concurrency + (index < scenario_count % concurrency)
+              for index in range(concurrency)]
+    threads = [threading.Thread(target=work, args=(session, share)) for session, share in zip(sessions, shares)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    return [sample for session in sessions for sample in session.samples], wall
+
+
+def run_driver(driver, library: SeededLibrary, scenario_count: int, concurrency: int, seed: int,
+               warmup: int = 0) -> dict:
+    if warmup:
+        _run_workers(driver, library, warmup, concurrency, seed + 1)
+    samples, wall = _run_workers(driver, library, scenario_count, concurrency, seed)
+    by_route = defaultdict(list)
+    for sample in samples:
+        by_route[sample[0]].append(sample)
+    return {
+        "wall_seconds": round(wall, 3),
+        "total": _summary(samples, wall),
+        "routes": {route: _summary(route_samples, wall) for route, route_samples in sorted(by_route.items())},
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(drivers=DRIVERS, scenario_count: int = 2000, concurrency: int = 8, users: int = 200, books: int = 2000,
+        issues: int = 1000, seed: int = 42, warmup: int = 200) -> dict:
+    workdir = tempfile.mkdtemp(prefix="library-load-")
+    overrides = {"DB_ADDR": os.path.join(workdir, "library.db"), "SLOW_QUERY_LOG_FILE": None}
+    saved = {name: getattr(config, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        db = DB()
+        library = seed_library(db, users, books, issues, seed)
+        db.close()
+
+        # Imported here so the app module reads the overridden config
+        from src.app.controller.main import create_app
+        app = create_app()
+
+        report = {
+            "meta": {
+                "commit": _commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "scenarios": scenario_count,
+                "concurrency": concurrency,
+                "warmup": warmup,
+                "seed": seed,
+                "dataset": library.sizes(),
+            },
+            "drivers": {},
+        }
+        for name in drivers:
+            driver = ClientDriver(app) if name == "client" else HTTPDriver(app)
+            try:
+                report["drivers"][name] = run_driver(driver, library, scenario_count, concurrency, seed, warmup)
+            finally:
+                driver.close()
+        return report
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def find_regressions(report: dict, baseline: dict, max_regression: float = 0.25,
+                     min_delta_ms: float = MIN_DELTA_MS) -> List[str]:
+    """Routes present in both reports whose tail latency or throughput got worse than allowed."""
+    regressions = []
+    for driver, base_driver in baseline.get("drivers", {}).items():
+        current_routes = report.get("drivers", {}).get(driver, {}).get("routes", {})
+        for route, base in base_driver.get("routes", {}).items():
+            current = current_routes.get(route)
+            if current is None:
+                continue
+            for metric in ("p95_ms", "p99_ms"):
+                if (current[metric] > base[metric] * (1 + max_regression)
+                        and current[metric] - base[metric] > min_delta_ms):
+                    regressions.append(f"{driver} {route}: {metric} {base[metric]} -> {current[metric]}")
+            if current["rps"] < base["rps"] * (1 - max_regression):
+                regressions.append(f"{driver} {route}: rps {base['rps']} -> {current['rps']}")
+    return regressions
+
+
+def find_failing_routes(report: dict) -> List[str]:
+    """Routes that never got a 2xx/3xx response: every sample was a rejection or an error."""
+    failing = []
+    for driver, result in report.get("drivers", {}).items():
+        for route, stats in result.get("routes", {}).items():
+            if not any(200 <= int(status) < 400 for status in stats["statuses"]):
+                failing.append(f"{driver} {route}: statuses {stats['statuses']}")
+    return failing
+
+
+def _print_report(report: dict):
+    for driver, result in report["drivers"].items():
+        print(f"[{driver}] {result['total']['count']} requests in {result['wall_seconds']}s, "
+              f"{result['total']['rps']} req/s")
+        print(f"{'route':>18} {'count':>7} {'errors':>6} {'4xx':>6} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} "
+              f"{'p99 ms':>9}")
+        for route, stats in result["routes"].items():
+            print(f"{route:>18} {stats['count']:>7} {stats['errors']:>6} {stats['client_errors']:>6} "
+                  f"{stats['rps']:>9.1f} "
+                  f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--driver", choices=(*DRIVERS, "both"), default="both")
+    parser.add_argument("--scenarios", type=int, default=2000,
+                        help="scenarios to run per driver; issue-then-return sends two requests")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--books", type=int, default=2000)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="allowed fractional growth of p95/p99 (and drop of rps) per route")
+    args = parser.parse_args(argv)
+
+    drivers = DRIVERS if args.driver == "both" else (args.driver,)
+    report = run(drivers, args.scenarios, args.concurrency, args.users, args.books, args.issues, args.seed,
+                 args.warmup)
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    failing = find_failing_routes(report)
+    for route in failing:
+        print(f"FAILING {route}")
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(report, json.load(f), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+    if failing or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
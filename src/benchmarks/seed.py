@@ -0,0 +1,128 @@
+"""
+Seeds a SQLite library for the load tests: users, books and the current loans.
+
+Everything is built from the app's models and written through its repositories,
+so the rows look exactly like the ones the API creates. The same seed gives the
+same ids, titles and loans, which keeps runs comparable between commits. Every
+user shares one bcrypt hash of PASSWORD, made at a low cost so seeding doesn't
+spend minutes in bcrypt (logins verify at the cost stored in the hash).
+
+    python -m src.benchmarks.seed library.db [--users N] [--books N] [--issues N] [--seed N]
+"""
+import argparse
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List
+
+from src.app.config.enumeration import Branch, Role
+from src.app.model.books import Books
+from src.app.model.issued_books import IssuedBooks
+from src.app.model.user import User
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.issued_book_repository import IssuedBookRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.utils import Utils
+
+PASSWORD = "Password@123"
+BRANCHES = tuple(branch.value for branch in Branch)
+# Loans are dated relative to this day rather than today, so a seed always produces the same rows
+SEED_DATE = date(2024, 1, 1)
+_WORDS = ("river", "shadow", "empire", "garden", "winter", "silver", "machine", "ocean", "forest", "night",
+          "stone", "glass", "harbor", "signal", "orchard", "desert", "lantern", "echo", "summit", "atlas")
+_NAMES = ("Asha", "Bruno", "Chen", "Dara", "Elif", "Farid", "Grace", "Hiro", "Ines", "Jonas", "Kavya", "Liam")
+
+
+@dataclass
+class SeededLibrary:
+    """What the load scenarios need to know about the seeded data."""
+    admin_id: str
+    user_ids: List[str] = field(default_factory=list)
+    user_emails: List[str] = field(default_factory=list)
+    book_ids: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    # Books with a copy left after the seeded loans, for scenarios that borrow
+    available_book_ids: List[str] = field(default_factory=list)
+    search_terms: List[str] = field(default_factory=list)
+    password: str = PASSWORD
+    # Loans actually written; fewer than asked for when a draw repeats a loan or hits an exhausted title
+    issues: int = 0
+
+    def sizes(self) -> dict:
+        return {"users": len(self.user_ids), "books": len(self.book_ids), "issues": self.issues}
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def seed_library(db: DB, users: int = 200, books: int = 2000, issues: int = 1000, seed: int = 42,
+                 rounds: int = 4) -> SeededLibrary:
+    apply_migrations(db)
+    rng = random.Random(seed)
+    hashed = Utils.hash_password(PASSWORD, rounds)
+
+    admin = User(name="Admin", year="4", branch=BRANCHES[0], email="admin@jecrc.ac.in", password=hashed,
+                 id=_uuid(rng), role=Role.ADMIN.value)
+    members = [User(name=rng.choice(_NAMES), year=str(rng.randint(1, 4)), branch=rng.choice(BRANCHES),
+                    email=f"user{i}@jecrc.ac.in", password=hashed, id=_uuid(rng)) for i in range(users)]
+    catalog = []
+    for i in range(books):
+        copies = rng.randint(1, 5)
+        title = f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS)} {i}"
+        catalog.append(Books(title=title, author=f"{rng.choice(_NAMES)} {rng.choice(_WORDS).title()}",
+                             no_of_copies=copies, no_of_available=copies, id=_uuid(rng)))
+
+    # Current loans: a user holds at most one copy of a title, and never more copies than exist
+    loans, taken = [], set()
+    for _ in range(issues if members and catalog else 0):
+        user, book = rng.choice(members), rng.choice(catalog)
+        if (user.id, book.id) in taken or book.no_of_available == 0:
+            continue
+        taken.add((user.id, book.id))
+        book.no_of_available -= 1
+        borrowed = SEED_DATE - timedelta(days=rng.randint(0, 30))
+        loans.append(IssuedBooks(user_id=user.id, book_id=book.id, borrow_date=borrowed.isoformat(),
+                                 return_date=(borrowed + timedelta(days=14)).isoformat(), id=_uuid(rng)))
+
+    user_repository = UserRepository(db)
+    with db.transaction():
+        for user in [admin, *members]:
+            user_repository.save_user(user)
+        BooksRepository(db).upsert_books(catalog)
+        IssuedBookRepository(db).save_issue_books(loans)
+
+    return SeededLibrary(
+        admin_id=admin.id,
+        user_ids=[user.id for user in members],
+        user_emails=[user.email for user in members],
+        book_ids=[book.id for book in catalog],
+        titles=[book.title for book in catalog],
+        available_book_ids=[book.id for book in catalog if book.no_of_available > 0],
+        search_terms=list(_WORDS),
+        issues=len(loans),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("db_path")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--books", type=int, default=2000)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    db = DB(args.db_path)
+    started = time.perf_counter()
+    library = seed_library(db, args.users, args.books, args.issues, args.seed)
+    db.close()
+    print(f"seeded {library.sizes()} into {args.db_path} in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.benchmarks.load_test import _percentile, find_failing_routes, find_regressions, main
+
+
+def _route(p95=10.0, p99=20.0, rps=100.0, statuses=None):
+    return {"count": 10, "errors": 0, "client_errors": 0, "statuses": statuses or {"200": 10}, "rps": rps,
+            "mean_ms": 5.0, "p50_ms": 5.0, "p95_ms": p95, "p99_ms": p99, "max_ms": p99}
+
+
+def _report(routes, driver="client"):
+    return {"meta": {}, "drivers": {driver: {"wall_seconds": 1.0, "total": _route(), "routes": routes}}}
+
+
+class TestPercentile(unittest.TestCase):
+
+    def test_nearest_rank(self):
+        ordered = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(_percentile(ordered, 0.50), 50.0)
+        self.assertEqual(_percentile(ordered, 0.95), 95.0)
+        self.assertEqual(_percentile(ordered, 0.99), 99.0)
+        self.assertEqual(_percentile([1.0, 2.0, 3.0], 0.50), 2.0)
+
+    def test_single_sample(self):
+        for fraction in (0.0, 0.5, 0.99, 1.0):
+            self.assertEqual(_percentile([7.5], fraction), 7.5)
+
+    def test_no_samples(self):
+        self.assertEqual(_percentile([], 0.95), 0.0)
+
+
+class TestFindRegressions(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.baseline_path = os.path.join(self.tmp_dir, "baseline.json")
+        with open(self.baseline_path, "w") as f:
+            json.dump(_report({"list_books": _route(), "search_books": _route()}), f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def baseline(self):
+        with open(self.baseline_path) as f:
+            return json.load(f)
+
+    def test_growth_within_the_threshold_passes(self):
+        report = _report({"list_books": _route(p95=12.0, p99=24.0, rps=80.0), "search_books": _route()})
+
+        self.assertEqual(find_regressions(report, self.baseline(), max_regression=0.25), [])
+
+    def test_tail_latency_and_throughput_past_the_threshold_fail(self):
+        report = _report({"list_books": _route(p95=13.0, p99=26.0, rps=70.0), "search_books": _route()})
+
+        regressions = find_regressions(report, self.baseline(), max_regression=0.25)
+
+        self.assertEqual(regressions, ["client list_books: p95_ms 10.0 -> 13.0",
+                                       "client list_books: p99_ms 20.0 -> 26.0",
+                                       "client list_books: rps 100.0 -> 70.0"])
+
+    def test_growth_below_the_noise_floor_passes(self):
+        baseline = _report({"login": _route(p95=0.4, p99=0.5)})
+        report = _report({"login": _route(p95=0.8, p99=1.0)})
+
+        self.assertEqual(find_regressions(report, baseline, max_regression=0.25), [])
+
+    def test_routes_missing_from_either_report_are_skipped(self):
+        report = _report({"list_books": _route(p95=50.0), "new_route": _route(p95=500.0)})
+
+        regressions = find_regressions(report, self.baseline())
+
+        self.assertEqual(regressions, ["client list_books: p95_ms 10.0 -> 50.0"])
+
+    def test_main_exits_1_on_regression(self):
+        report = _report({"list_books": _route(p95=50.0), "search_books": _route()})
+        output = io.StringIO()
+
+        with patch("src.benchmarks.load_test.run", return_value=report), redirect_stdout(output), \
+                self.assertRaises(SystemExit) as exit_:
+            main(["--driver", "client", "--baseline", self.baseline_path])
+
+        self.assertEqual(exit_.exception.code, 1)
+        self.assertIn("REGRESSION client list_books: p95_ms 10.0 -> 50.0", output.getvalue())
+
+
+class TestFindFailingRoutes(unittest.TestCase):
+
+    def test_route_with_only_4xx_responses_fails(self):
+        report = _report({"login": _route(statuses={"422": 10}),
+                          "issue_book": _route(statuses={"200": 8, "409": 2})})
+
+        self.assertEqual(find_failing_routes(report), ["client login: statuses {'422': 10}"])
+
+    def test_main_reports_failing_route_and_exits_1(self):
+        report = _report({"login": _route(statuses={"401": 3, "422": 7})})
+        output = io.StringIO()
+
+        with patch("src.benchmarks.load_test.run", return_value=report), redirect_stdout(output), \
+                self.assertRaises(SystemExit) as exit_:
+            main(["--driver", "client"])
+
+        self.assertEqual(exit_.exception.code, 1)
+        self.assertIn("FAILING client login: statuses {'401': 3, '422': 7}", output.getvalue())
+
+    def test_main_passes_when_every_route_succeeds(self):
+        report = _report({"list_books": _route()})
+
+        with patch("src.benchmarks.load_test.run", return_value=report), redirect_stdout(io.StringIO()):
+            main(["--driver", "client"])
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+from flask import Flask, g
+
+from src.app.controller.admin.handler import AdminHandler
+from src.app.utils.db.slow_query_log import SlowQuery, SlowQueryLog
+from src.app.config.messages import *
+
+
+class TestAdminHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+
+        self.mock_slow_query_log = MagicMock(spec=SlowQueryLog)
+        self.admin_handler = AdminHandler.create(self.mock_slow_query_log)
+
+        self.test_entry = SlowQuery(sql="SELECT * FROM issuedBook WHERE user_id = ?", duration_ms=150.0,
+                                    repository="IssuedBookRepository", method="get_issue_books_by_user_id",
+                                    parameter_types=["str"], plan=["SCAN issuedBook"], table_scans=["issuedBook"])
+
+    def test_get_slow_queries(self):
+        """Test fetching the slow-query log."""
+        with self.app.test_request_context(query_string={"limit": "10"}):
+            g.role = "admin"
+            self.mock_slow_query_log.entries.return_value = [self.test_entry]
+
+            response, status_code = self.admin_handler.get_slow_queries()
+            self.assertEqual(status_code, 200)
+            self.mock_slow_query_log.entries.assert_called_once_with(10)
+            self.assertEqual(response["data"], [self.test_entry.to_dict()])
+
+    def test_get_slow_queries_invalid_limit(self):
+        """Test a non-numeric limit is rejected."""
+        with self.app.test_request_context(query_string={"limit": "many"}):
+            g.role = "admin"
+
+            response, status_code = self.admin_handler.get_slow_queries()
+            self.assertEqual(status_code, 422)
+            self.mock_slow_query_log.entries.assert_not_called()
+
+    def test_get_slow_queries_requires_admin(self):
+        """Test the slow-query log is not served to users."""
+        with self.app.test_request_context():
+            g.role = "user"
+
+            response, status_code = self.admin_handler.get_slow_queries()
+            self.assertEqual(status_code, 403)
+
+    def test_clear_slow_queries(self):
+        """Test clearing the slow-query log."""
+        with self.app.test_request_context(method='DELETE'):
+            g.role = "admin"
+
+            response, status_code = self.admin_handler.clear_slow_queries()
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["message"], SLOW_QUERIES_CLEARED)
+            self.mock_slow_query_log.clear.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,15 @@ from unittest.mock import patch, MagicMock
 from flask import Flask, jsonify, g
 from src.app.controller.book.handler import BookHandler
 from src.app.services.book_service import BookService
+from src.app.services.catalog_snapshot import CatalogSnapshot
 from src.app.model.books import Books
 from src.app.config.enumeration import Status
 from src.app.config.messages import *
 from src.app.utils.utils import Utils
+from src.app.utils.pagination import Page
+from src.app.utils.errors.error import InvalidCursorError
+from src.app.services.catalog_import import ImportReport
+import io
 
 class TestBookHandler(unittest.TestCase):
 
@@ -62,12 +67,31 @@ class TestBookHandler(unittest.TestCase):
     def test_get_all_books(self):
         """Test fetching all books."""
         with self.app.test_request_context():
-            self.mock_book_service.get_all_books.return_value = [self.test_book]
+            self.mock_book_service.get_all_books.return_value = Page(items=[self.test_book])
 
             response, status_code = self.book_handler.get_all_books()
             self.assertEqual(status_code, 200)
-            # self.assertDictEqual(response["data"][0], self.test_book.__dict__)
-            self.assertEqual(response["data"], [self.test_book.__dict__])
+            # self.assertDictEqual(response["data"][0], self.test_book.to_dict())
+            self.assertEqual(response["data"], [self.test_book.to_dict()])
+
+    def test_get_all_books_with_cursor(self):
+        """Test fetching the next catalog page."""
+        with self.app.test_request_context(query_string={"limit": "1", "cursor": "abc"}):
+            self.mock_book_service.get_all_books.return_value = Page(items=[self.test_book], next_cursor="next", has_more=True)
+
+            response, status_code = self.book_handler.get_all_books()
+            self.assertEqual(status_code, 200)
+            self.mock_book_service.get_all_books.assert_called_once_with(1, "abc")
+            self.assertEqual(response["pagination"], {"next_cursor": "next", "has_more": True})
+
+    def test_get_all_books_invalid_cursor(self):
+        """Test fetching the catalog with a malformed cursor."""
+        with self.app.test_request_context(query_string={"cursor": "abc"}):
+            self.mock_book_service.get_all_books.side_effect = InvalidCursorError(INVALID_CURSOR)
+
+            response, status_code = self.book_handler.get_all_books()
+            self.assertEqual(status_code, 422)
+            self.assertEqual(response["message"], INVALID_CURSOR)
 
     def test_get_book_by_title(self):
         """Test fetching a book by title."""
@@ -79,7 +103,7 @@ class TestBookHandler(unittest.TestCase):
             response, status_code = self.book_handler.get_all_books()
             self.assertEqual(status_code, 200)
 
-            self.assertEqual(response["data"], self.test_book.__dict__)
+            self.assertEqual(response["data"], self.test_book.to_dict())
 
     def test_update_book_success(self):
         """Test successful update of a book."""
@@ -123,4 +147,65 @@ class TestBookHandler(unittest.TestCase):
             self.assertEqual(status_code, 500)
             self.assertEqual(response["message"], "Unexpected error")
 
+    def test_get_all_books_from_snapshot(self):
+        """Test the default catalog page is served from the snapshot."""
+        mock_snapshot = MagicMock(spec=CatalogSnapshot)
+        mock_snapshot.get.return_value = (b'{"status":"success"}', "abc", 7)
+        book_handler = BookHandler.create(self.mock_book_service, mock_snapshot)
+
+        with self.app.test_request_context():
+            response = book_handler.get_all_books()
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_data(), b'{"status":"success"}')
+            self.assertEqual(response.headers["ETag"], '"abc"')
+            self.assertEqual(response.headers["X-Catalog-Version"], "7")
+            self.mock_book_service.get_all_books.assert_not_called()
+
+        with self.app.test_request_context(headers={"If-None-Match": '"abc"'}):
+            response = book_handler.get_all_books()
+            self.assertEqual(response.status_code, 304)
+
+        with self.app.test_request_context(query_string={"cursor": "next"}):
+            self.mock_book_service.get_all_books.return_value = Page(items=[self.test_book])
+            response, status_code = book_handler.get_all_books()
+            self.assertEqual(status_code, 200)
+            self.mock_book_service.get_all_books.assert_called_once()
 
+    def test_import_books_raw_body(self):
+        """Test bulk import from a raw CSV body."""
+        with self.app.test_request_context(method='POST', data="title,author\nDune,Frank Herbert\n",
+                                           content_type="text/csv"):
+            g.role = "admin"
+            self.mock_book_service.import_books.return_value = ImportReport(rows_read=1, rows_imported=1)
+            response, status_code = self.book_handler.import_books()
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["message"], BOOKS_IMPORTED_SUCCESSFULLY)
+            self.assertEqual(response["data"]["rows_imported"], 1)
+            stream, fmt, _progress = self.mock_book_service.import_books.call_args[0]
+            self.assertEqual(fmt, "csv")
+            self.assertEqual(stream.read(), "title,author\nDune,Frank Herbert\n")
+
+    def test_import_books_file_upload(self):
+        """Test bulk import from a multipart upload."""
+        data = {"file": (io.BytesIO(b'{"title": "Dune", "author": "Frank Herbert"}\n'), "books.jsonl")}
+        with self.app.test_request_context(method='POST', data=data, content_type="multipart/form-data"):
+            g.role = "admin"
+            self.mock_book_service.import_books.return_value = ImportReport()
+            response, status_code = self.book_handler.import_books()
+            self.assertEqual(status_code, 200)
+            self.assertEqual(self.mock_book_service.import_books.call_args[0][1], "jsonl")
+
+    def test_import_books_unsupported_format(self):
+        """Test bulk import with a body that is neither CSV nor JSONL."""
+        with self.app.test_request_context(method='POST', data="x", content_type="application/octet-stream"):
+            g.role = "admin"
+            response, status_code = self.book_handler.import_books()
+            self.assertEqual(status_code, 422)
+            self.mock_book_service.import_books.assert_not_called()
+
+    def test_import_books_requires_admin(self):
+        """Test bulk import is rejected for non-admin users."""
+        with self.app.test_request_context(method='POST', data="title,author\n", content_type="text/csv"):
+            g.role = "user"
+            response, status_code = self.book_handler.import_books()
+            self.assertEqual(status_code, 403)
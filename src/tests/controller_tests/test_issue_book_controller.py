@@ -7,6 +7,8 @@ from src.app.services.issue_book_service import IssueBookService
 from src.app.model.issued_books import IssuedBooks
 from src.app.config.messages import *
 from src.app.config.enumeration import Status, Role
+from src.app.utils.pagination import Page
+from src.app.model.batch_result import BatchItemResult
 
 
 class TestIssueBookHandler(unittest.TestCase):
@@ -86,6 +88,106 @@ class TestIssueBookHandler(unittest.TestCase):
             self.assertEqual(status_code, 200)
             self.assertEqual(response["message"], RETURN_SUCCESSFULLY)
 
+    def test_issue_books_batch_success(self):
+        """Test issuing several books in one request."""
+        payload = {"items": [self.valid_issue_payload, {"book_id": "789", "return_date": "2024-01-15"}]}
+        with self.app.test_request_context(method='POST', json=payload):
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+            self.mock_issue_book_service.issue_books.return_value = [
+                BatchItemResult("456", BatchItemResult.ISSUED, issue_id="i1"),
+                BatchItemResult("789", BatchItemResult.ISSUED, issue_id="i2"),
+            ]
+
+            response, status_code = self.issue_book_handler.issue_books_by_user()
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["message"], BOOKS_ISSUED_SUCCESSFULLY)
+            issued_books, all_or_nothing = self.mock_issue_book_service.issue_books.call_args[0]
+            self.assertEqual([issued.book_id for issued in issued_books], ["456", "789"])
+            self.assertTrue(all_or_nothing)
+
+    def test_issue_books_batch_all_or_nothing_conflict(self):
+        """Test an all-or-nothing batch with a failed item is rejected with 409."""
+        with self.app.test_request_context(method='POST', json={"items": [self.valid_issue_payload]}):
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+            self.mock_issue_book_service.issue_books.return_value = [
+                BatchItemResult("456", BatchItemResult.FAILED, "book doesn't exist"),
+            ]
+
+            response, status_code = self.issue_book_handler.issue_books_by_user()
+            self.assertEqual(status_code, 409)
+            self.assertEqual(response["message"], BATCH_NOT_APPLIED)
+            self.assertEqual(response["data"][0]["status"], BatchItemResult.FAILED)
+
+    def test_issue_books_batch_validation_error(self):
+        """Test a batch with no items or an unknown mode is rejected."""
+        with self.app.test_request_context(method='POST', json={"items": [], "mode": "sometimes"}):
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+
+            response, status_code = self.issue_book_handler.issue_books_by_user()
+            self.assertEqual(status_code, 422)
+            self.mock_issue_book_service.issue_books.assert_not_called()
+
+    def test_return_books_batch_partial(self):
+        """Test a partial batch return reports the items that failed."""
+        with self.app.test_request_context(method='PATCH', json={"book_ids": ["456", "789"], "mode": "partial"}):
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+            self.mock_issue_book_service.return_issue_books.return_value = [
+                BatchItemResult("456", BatchItemResult.RETURNED),
+                BatchItemResult("789", BatchItemResult.FAILED, "issued book doesn't exist"),
+            ]
+
+            response, status_code = self.issue_book_handler.return_books_by_user()
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["message"], BATCH_PARTIALLY_APPLIED)
+            self.mock_issue_book_service.return_issue_books.assert_called_once_with(self.user_id, ["456", "789"], False)
+
+    def test_issue_books_batch_partial_all_failed(self):
+        """Test a partial batch where every item failed is reported as a failure, not a success."""
+        payload = {"items": [self.valid_issue_payload, {"book_id": "789", "return_date": "2024-01-15"}],
+                   "mode": "partial"}
+        with self.app.test_request_context(method='POST', json=payload):
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+            self.mock_issue_book_service.issue_books.return_value = [
+                BatchItemResult("456", BatchItemResult.FAILED, "book doesn't exist"),
+                BatchItemResult("789", BatchItemResult.FAILED, "no copies available"),
+            ]
+
+            response, status_code = self.issue_book_handler.issue_books_by_user()
+            self.assertEqual(status_code, 409)
+            self.assertEqual(response["status"], Status.FAIL.value)
+            self.assertEqual(response["message"], BATCH_ALL_ITEMS_FAILED)
+            self.assertEqual([item["status"] for item in response["data"]], [BatchItemResult.FAILED] * 2)
+
+    def test_export_issued_books_streams(self):
+        """Test the export streams what the service yields."""
+        with self.app.test_request_context(query_string={"format": "csv", "user_id": self.user_id}):
+            self.mock_g_context(role=self.admin_role)
+            self.mock_issue_book_service.export_issued_books.return_value = iter(["id\n", "i1\n"])
+
+            response = self.issue_book_handler.export_issued_books()
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.is_streamed)
+            self.assertEqual(response.mimetype, "text/csv")
+            self.assertEqual("".join(response.response), "id\ni1\n")
+            self.mock_issue_book_service.export_issued_books.assert_called_once_with("csv", None, None, self.user_id, None)
+
+    def test_export_issued_books_invalid_date_range(self):
+        """Test the export rejects a start date after the end date."""
+        with self.app.test_request_context(query_string={"start_date": "2024-02-01", "end_date": "2024-01-01"}):
+            self.mock_g_context(role=self.admin_role)
+
+            response, status_code = self.issue_book_handler.export_issued_books()
+            self.assertEqual(status_code, 422)
+            self.mock_issue_book_service.export_issued_books.assert_not_called()
+
+    def test_export_issued_books_requires_admin(self):
+        """Test users can't export the circulation history."""
+        with self.app.test_request_context():
+            self.mock_g_context(user_id=self.user_id, role=self.user_role)
+
+            response, status_code = self.issue_book_handler.export_issued_books()
+            self.assertEqual(status_code, 403)
+
     def test_get_issued_books_user(self):
         """Test fetching issued books for a user."""
         with self.app.test_request_context():
@@ -94,7 +196,7 @@ class TestIssueBookHandler(unittest.TestCase):
 
             response, status_code = self.issue_book_handler.get_issued_books()
             self.assertEqual(status_code, 200)
-            self.assertEqual(response["data"], [self.test_issued_book.__dict__])
+            self.assertEqual(response["data"], [self.test_issued_book.to_dict()])
 
     def test_get_issued_books_admin_with_user_id(self):
         """Test admin fetching issued books by a specific user ID."""
@@ -104,17 +206,27 @@ class TestIssueBookHandler(unittest.TestCase):
 
             response, status_code = self.issue_book_handler.get_issued_books()
             self.assertEqual(status_code, 200)
-            self.assertEqual(response["data"], [self.test_issued_book.__dict__])
+            self.assertEqual(response["data"], [self.test_issued_book.to_dict()])
 
     def test_get_all_issued_books_admin(self):
         """Test admin fetching all issued books."""
         with self.app.test_request_context():
             self.mock_g_context(role=self.admin_role)
-            self.mock_issue_book_service.get_all_issued_books.return_value = [self.test_issued_book]
+            self.mock_issue_book_service.get_all_issued_books.return_value = Page(items=[self.test_issued_book])
 
             response, status_code = self.issue_book_handler.get_issued_books()
             self.assertEqual(status_code, 200)
-            self.assertEqual(response["data"], [self.test_issued_book.__dict__])
+            self.assertEqual(response["data"], [self.test_issued_book.to_dict()])
+            self.assertEqual(response["pagination"], {"next_cursor": None, "has_more": False})
+
+    def test_get_all_issued_books_admin_invalid_limit(self):
+        """Test admin listing with a non-numeric page size."""
+        with self.app.test_request_context(query_string={"limit": "abc"}):
+            self.mock_g_context(role=self.admin_role)
+
+            response, status_code = self.issue_book_handler.get_issued_books()
+            self.assertEqual(status_code, 422)
+            self.mock_issue_book_service.get_all_issued_books.assert_not_called()
 
     def test_get_issued_books_invalid_token(self):
         """Test fetching issued books with invalid token."""
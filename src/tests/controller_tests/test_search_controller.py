@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import MagicMock
+from flask import Flask
+
+from src.app.controller.search.handler import SearchHandler
+from src.app.services.search_service import SearchService
+from src.app.model.book_search_result import BookSearchResult
+from src.app.config.messages import *
+from src.app.utils.errors.error import InvalidRequestBody
+
+
+class TestSearchHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+
+        self.mock_search_service = MagicMock(spec=SearchService)
+        self.search_handler = SearchHandler.create(self.mock_search_service)
+
+        self.test_result = BookSearchResult(id="1", title="Dune", author="Frank Herbert", no_of_copies=2,
+                                            no_of_available=1, title_snippet="<mark>Dune</mark>",
+                                            author_snippet="Frank Herbert", rank=-1.5)
+
+    def test_search_books(self):
+        """Test a successful search."""
+        with self.app.test_request_context(query_string={"q": "dune", "prefix": "true", "limit": "5"}):
+            self.mock_search_service.search_books.return_value = [self.test_result]
+
+            response, status_code = self.search_handler.search_books()
+            self.assertEqual(status_code, 200)
+            self.mock_search_service.search_books.assert_called_once_with("dune", 5, True)
+            self.assertEqual(response["data"], [self.test_result.to_dict()])
+
+    def test_search_books_missing_query(self):
+        """Test a search without a query."""
+        with self.app.test_request_context():
+            self.mock_search_service.search_books.side_effect = InvalidRequestBody(SEARCH_QUERY_REQUIRED)
+
+            response, status_code = self.search_handler.search_books()
+            self.assertEqual(status_code, 422)
+            self.assertEqual(response["message"], SEARCH_QUERY_REQUIRED)
+
+    def test_search_books_unexpected_error(self):
+        """Test handling of unexpected errors."""
+        with self.app.test_request_context(query_string={"q": "dune"}):
+            self.mock_search_service.search_books.side_effect = Exception("Unexpected error")
+
+            response, status_code = self.search_handler.search_books()
+            self.assertEqual(status_code, 500)
+            self.assertEqual(response["message"], "Unexpected error")
@@ -7,6 +7,7 @@ from src.app.model.user import User
 from src.app.config.messages import *
 from src.app.config.enumeration import Status
 from src.app.utils.validators.validators import Validators
+from src.app.utils.errors.error import HashingBusyError
 
 
 class TestUserHandler(unittest.TestCase):
@@ -147,3 +148,22 @@ class TestUserHandler(unittest.TestCase):
             self.assertEqual(response["message"], "Unexpected Error")
 
 
+
+    def test_login_hashing_busy(self):
+        """Test login when the password hashing pool is saturated."""
+        with self.app.test_request_context(method="POST", json=self.valid_login_payload):
+            self.mock_user_service.login_user.side_effect = HashingBusyError(SERVER_BUSY_TRY_AGAIN, 3)
+
+            response, status_code, headers = self.user_handler.login()
+            self.assertEqual(status_code, 429)
+            self.assertEqual(headers["Retry-After"], "3")
+            self.assertEqual(response["message"], SERVER_BUSY_TRY_AGAIN)
+
+    def test_signup_hashing_busy(self):
+        """Test signup when the password hashing pool is saturated."""
+        with self.app.test_request_context(method="POST", json=self.valid_signup_payload):
+            self.mock_user_service.signup_user.side_effect = HashingBusyError(SERVER_BUSY_TRY_AGAIN, 1)
+
+            response, status_code, headers = self.user_handler.signup()
+            self.assertEqual(status_code, 429)
+            self.assertEqual(headers["Retry-After"], "1")
@@ -0,0 +1,117 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from flask import Blueprint, Flask, g
+
+from src.app.middleware.conditional_get import ConditionalGet
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "library.db")
+        self.db = DB(self.db_path)
+        apply_migrations(self.db)
+        self.calls = 0
+        blueprint = Blueprint("conditional", __name__)
+
+        def set_user():
+            g.user_id = "user-1"
+            g.role = "user"
+        blueprint.before_request(set_user)
+        ConditionalGet(self.db, "book").register(blueprint)
+
+        def books():
+            self.calls += 1
+            return {"data": ["book"]}, 200
+        blueprint.add_url_rule("/books", "books", books, methods=["GET", "POST"])
+
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(blueprint)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, sql):
+        with self.db.transaction() as conn:
+            conn.execute(sql)
+
+    def test_sets_validators_on_get(self):
+        response = self.client.get("/books")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["ETag"].startswith('W/"'))
+        self.assertIn("Last-Modified", response.headers)
+        self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
+
+    def test_returns_304_when_unchanged(self):
+        etag = self.client.get("/books").headers["ETag"]
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.calls, 1)
+
+    def test_committed_change_invalidates_etag(self):
+        etag = self.client.get("/books").headers["ETag"]
+        self.write("INSERT INTO book VALUES ('b1', 'Dune', 'Frank Herbert', 1, 1)")
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_change_to_other_table_keeps_etag(self):
+        etag = self.client.get("/books").headers["ETag"]
+        self.write("INSERT INTO issuedBook VALUES ('i1', 'u1', 'b1', '2024-01-01', '2024-01-15')")
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_depends_on_query(self):
+        etag = self.client.get("/books?limit=5").headers["ETag"]
+
+        response = self.client.get("/books?limit=6", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_write_from_another_process_invalidates_etag(self):
+        etag = self.client.get("/books").headers["ETag"]
+        # A separate connection, as another worker, an import script or a manual edit would use
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("INSERT INTO book VALUES ('b1', 'Dune', 'Frank Herbert', 1, 1)")
+        conn.close()
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, 2)
+
+    def test_if_modified_since_alone_does_not_give_304(self):
+        future = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+        response = self.client.get("/books", headers={"If-Modified-Since": future.strftime("%a, %d %b %Y %H:%M:%S GMT")})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.calls, 1)
+
+    def test_non_get_is_not_conditional(self):
+        etag = self.client.get("/books").headers["ETag"]
+
+        response = self.client.post("/books", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from flask import Flask
+
+from src.app.middleware.metrics import RequestMetrics
+from src.app.model.responses import Response
+from src.app.utils.db.db import DB
+from src.app.utils.metrics.registry import MetricsRegistry
+from src.app.utils.utils import Utils
+
+
+class TestRequestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        self.registry = MetricsRegistry()
+        self.metrics = RequestMetrics(self.registry, self.db)
+
+        self.app = Flask(__name__)
+        self.metrics.register(self.app)
+        self.app.add_url_rule('/metrics', 'metrics', self.metrics.metrics_view)
+
+        @self.app.route('/books')
+        def books():
+            with self.db.get_connection() as conn:
+                conn.execute("SELECT 1")
+                conn.execute("SELECT 2")
+            return Response.response("ok", "success"), 200
+
+        @self.app.route('/fail')
+        def fail():
+            return Response.response("nope", "fail", 4001), 404
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_latency_and_queries_are_recorded_per_endpoint(self):
+        # Act
+        self.client.get('/books')
+        self.client.get('/books')
+
+        # Assert
+        self.assertEqual(self.metrics.latency.count(endpoint="books", method="GET"), 2)
+        self.assertEqual(self.metrics.queries.value(endpoint="books"), 4)
+        self.assertGreater(self.metrics.query_seconds.value(endpoint="books"), 0)
+        self.assertEqual(self.metrics.queries_per_request.count(endpoint="books"), 2)
+
+    def test_errors_are_counted_by_error_code(self):
+        # Act
+        self.client.get('/fail')
+        self.client.get('/missing')
+
+        # Assert
+        self.assertEqual(self.metrics.errors.value(error_code="4001", endpoint="fail"), 1)
+        self.assertEqual(self.metrics.errors.value(error_code="none", endpoint="unmatched"), 1)
+        self.assertEqual(self.metrics.requests.value(endpoint="fail", method="GET", status=404), 1)
+
+    def test_metrics_route_serves_prometheus_text(self):
+        # Arrange
+        self.registry.register_stats("db_pool", self.db.stats)
+        self.client.get('/books')
+
+        # Act
+        response = self.client.get('/metrics')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        body = response.get_data(as_text=True)
+        self.assertIn('library_http_requests_total{endpoint="books",method="GET",status="200"} 1.0', body)
+        self.assertIn("library_db_pool_checkouts", body)
+
+    def test_metrics_route_requires_an_admin_token(self):
+        # Arrange
+        app = Flask(__name__)
+        app.register_blueprint(self.metrics.create_route())
+        client = app.test_client()
+
+        def get(role=None):
+            headers = {"Authorization": f"Bearer {Utils.create_jwt_token('u1', role)}"} if role else {}
+            return client.get('/metrics', headers=headers)
+
+        # Act & Assert
+        self.assertEqual(get().status_code, 401)
+        self.assertEqual(get("user").status_code, 403)
+        self.assertEqual(get("admin").status_code, 200)
+
+    def test_metrics_route_can_be_left_open(self):
+        # Arrange
+        app = Flask(__name__)
+        app.register_blueprint(self.metrics.create_route(require_admin=False))
+
+        # Act
+        response = app.test_client().get('/metrics')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from flask import Flask, g
-from src.app.middleware.middleware import auth_middleware
+from src.app.middleware.middleware import auth_middleware, verified_token_cache
 from src.app.config.messages import *
 from src.app.config.enumeration import Status
 import jwt
@@ -60,3 +61,60 @@ class TestAuthMiddleware(unittest.TestCase):
             auth_middleware()
             self.assertEqual(g.user_id, "12345")
             self.assertEqual(g.role, "admin")
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        verified_token_cache.clear()
+
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_repeat_request_skips_verification(self, mock_decode):
+        mock_decode.return_value = {"user_id": "12345", "role": "user", "exp": time.time() + 60}
+        hits_before = verified_token_cache.stats()["hits"]
+        for _ in range(3):
+            with app.test_request_context(
+                '/some/protected/route', headers={'Authorization': 'Bearer cached.token.here'}
+            ):
+                auth_middleware()
+                self.assertEqual(g.user_id, "12345")
+
+        mock_decode.assert_called_once_with("cached.token.here")
+        self.assertEqual(verified_token_cache.stats()["hits"] - hits_before, 2)
+
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_expired_cached_token_is_verified_again(self, mock_decode):
+        mock_decode.return_value = {"user_id": "12345", "role": "user", "exp": time.time() + 60}
+        verified_token_cache.decode("expiring.token.here")
+
+        mock_decode.side_effect = jwt.ExpiredSignatureError
+        with patch('src.app.middleware.token_cache.time.time', return_value=time.time() + 61):
+            with app.test_request_context(
+                '/some/protected/route', headers={'Authorization': 'Bearer expiring.token.here'}
+            ):
+                response, status_code = auth_middleware()
+
+        self.assertEqual(status_code, 401)
+        self.assertEqual(response['message'], TOKEN_EXPIRE)
+
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_token_without_exp_is_not_cached(self, mock_decode):
+        mock_decode.return_value = {"user_id": "12345", "role": "user"}
+
+        verified_token_cache.decode("no.exp.here")
+        verified_token_cache.decode("no.exp.here")
+
+        self.assertEqual(mock_decode.call_count, 2)
+        self.assertEqual(verified_token_cache.stats()["size"], 0)
+
+    @patch('src.app.config.config.AUTH_TOKEN_CACHE_ENABLED', False)
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_cache_can_be_disabled(self, mock_decode):
+        mock_decode.return_value = {"user_id": "12345", "role": "user", "exp": time.time() + 60}
+        for _ in range(2):
+            with app.test_request_context(
+                '/some/protected/route', headers={'Authorization': 'Bearer uncached.token.here'}
+            ):
+                auth_middleware()
+
+        self.assertEqual(mock_decode.call_count, 2)
@@ -0,0 +1,35 @@
+import unittest
+
+from flask import Flask
+
+from src.app.middleware.request_id import assign_request_id, echo_request_id, release_request_id
+from src.app.utils.logger.request_id import request_id_var
+
+
+class TestRequestId(unittest.TestCase):
+
+    def setUp(self):
+        self.seen = []
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.before_request(assign_request_id)
+        app.after_request(echo_request_id)
+        app.teardown_request(release_request_id)
+
+        def view():
+            self.seen.append(request_id_var.get())
+            return {"data": None}, 200
+        app.add_url_rule("/", "view", view)
+        self.client = app.test_client()
+
+    def test_incoming_id_is_bound_and_echoed(self):
+        response = self.client.get("/", headers={"X-Request-ID": "req-42"})
+
+        self.assertEqual(response.headers["X-Request-ID"], "req-42")
+        self.assertEqual(self.seen, ["req-42"])
+
+    def test_id_is_released_after_the_request(self):
+        response = self.client.get("/")
+
+        self.assertEqual(self.seen, [response.headers["X-Request-ID"]])
+        self.assertIsNone(request_id_var.get())
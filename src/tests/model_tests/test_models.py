@@ -0,0 +1,49 @@
+import copy
+import unittest
+from unittest.mock import patch
+
+from src.app.model.books import Books
+from src.app.model.issued_books import IssuedBooks
+from src.app.model.user import User
+
+
+class TestModels(unittest.TestCase):
+
+    def test_from_row_maps_columns_without_generating_ids(self):
+        # Act
+        with patch("uuid.uuid4") as mock_uuid4:
+            book = Books.from_row(("b1", "Dune", "Herbert", 3, 2))
+            issued_book = IssuedBooks.from_row(("i1", "u1", "b1", "2024-12-20", "2024-12-30"))
+            user = User.from_row(("u1", "Ann", "user", 2, "CSE", "ann@example.com", "hash"))
+
+        # Assert
+        mock_uuid4.assert_not_called()
+        self.assertEqual(book.to_dict(), {"id": "b1", "title": "Dune", "author": "Herbert",
+                                          "no_of_copies": 3, "no_of_available": 2})
+        self.assertEqual(issued_book.to_dict()["return_date"], "2024-12-30")
+        self.assertEqual((user.id, user.role, user.email), ("u1", "user", "ann@example.com"))
+
+    def test_to_dict_matches_constructor_fields(self):
+        # Arrange
+        book = Books(title="Dune", author="Herbert", no_of_copies=3, no_of_available=2, id="b1")
+
+        # Act & Assert
+        self.assertEqual(book.to_dict(), Books.from_row(("b1", "Dune", "Herbert", 3, 2)).to_dict())
+
+    def test_models_have_no_instance_dict_and_still_copy(self):
+        # Arrange
+        book = Books(title="Dune", author="Herbert", id="b1")
+
+        # Act
+        copied = copy.copy(book)
+        copied.title = "Dune Messiah"
+
+        # Assert
+        self.assertFalse(hasattr(book, "__dict__"))
+        self.assertEqual(book.title, "Dune")
+        with self.assertRaises(AttributeError):
+            book.publisher = "Chilton"
+
+
+if __name__ == '__main__':
+    unittest.main()
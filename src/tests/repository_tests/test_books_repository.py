@@ -215,3 +215,86 @@ class TestBooksRepository(unittest.TestCase):
         self.assertIsNone(book)
 
 
+
+    def test_decrement_available_copies_success(self):
+        # Arrange
+        self.mock_conn.execute.return_value.rowcount = 1
+
+        # Act
+        result = self.books_repository.decrement_available_copies("1")
+
+        # Assert
+        self.assertTrue(result)
+        query, values = self.mock_conn.execute.call_args[0]
+        self.assertIn("number_of_available_books > 0", query)
+        self.assertEqual(values, ("1",))
+
+    def test_decrement_available_copies_none_available(self):
+        # Arrange
+        self.mock_conn.execute.return_value.rowcount = 0
+
+        # Act & Assert
+        self.assertFalse(self.books_repository.decrement_available_copies("1"))
+
+    def test_increment_available_copies_success(self):
+        # Arrange
+        self.mock_conn.execute.return_value.rowcount = 1
+
+        # Act
+        result = self.books_repository.increment_available_copies("1", 2)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(self.mock_conn.execute.call_args[0][1], (2, "1"))
+
+    def test_increment_available_copies_raises_database_error(self):
+        # Arrange
+        self.mock_conn.execute.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with self.assertRaises(DatabaseError):
+            self.books_repository.increment_available_copies("1")
+
+    def test_adjust_available_copies_single_update(self):
+        # Arrange
+        self.mock_conn.execute.return_value.rowcount = 2
+
+        # Act
+        result = self.books_repository.adjust_available_copies({"1": -2, "2": 1})
+
+        # Assert
+        self.assertEqual(result, 2)
+        self.mock_conn.execute.assert_called_once()
+        query, values = self.mock_conn.execute.call_args[0]
+        self.assertIn(">= 0", query)
+        self.assertEqual(values, ("1", -2, "2", 1, "1", "2", "1", -2, "2", 1))
+
+    def test_adjust_available_copies_empty(self):
+        # Act & Assert
+        self.assertEqual(self.books_repository.adjust_available_copies({}), 0)
+        self.mock_conn.execute.assert_not_called()
+
+    def test_upsert_books_success(self):
+        # Arrange
+        self.mock_db.transaction.return_value.__enter__.return_value = self.mock_conn
+        books = [Books(id="1", title="Dune", author="Frank Herbert", no_of_copies=3, no_of_available=3),
+                 Books(id="2", title="Emma", author="Jane Austen")]
+
+        # Act
+        written = self.books_repository.upsert_books(books)
+
+        # Assert
+        self.assertEqual(written, 2)
+        query, rows = self.mock_conn.executemany.call_args[0]
+        self.assertIn("ON CONFLICT(title) DO UPDATE", query)
+        self.assertEqual(rows, [("1", "Dune", "Frank Herbert", 3, 3), ("2", "Emma", "Jane Austen", 1, 1)])
+        self.mock_db.notify_change.assert_called_once_with("book")
+
+    def test_upsert_books_raises_database_error(self):
+        # Arrange
+        self.mock_db.transaction.return_value.__enter__.return_value = self.mock_conn
+        self.mock_conn.executemany.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with self.assertRaises(DatabaseError):
+            self.books_repository.upsert_books([Books(title="Dune", author="Frank Herbert")])
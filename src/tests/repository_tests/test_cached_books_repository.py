@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.cached_books_repository import CachedBooksRepository
+from src.app.utils.cache.cache import LRUCache
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+
+
+class TestCachedBooksRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.cache = LRUCache(ttl=60)
+        self.cached_repository = CachedBooksRepository(self.books_repository, self.cache)
+
+        self.book = Books(id="1", title="Dune", author="Frank Herbert", no_of_copies=2, no_of_available=2)
+        self.cached_repository.add_book(self.book)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_read_through(self):
+        first = self.cached_repository.get_book_by_id("1")
+        second = self.cached_repository.get_book_by_id("1")
+        self.assertEqual(first.title, "Dune")
+        self.assertIsNot(first, second)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_cached_books_are_copies(self):
+        book = self.cached_repository.get_book_by_title("Dune")
+        book.no_of_available = 0
+        self.assertEqual(self.cached_repository.get_book_by_title("Dune").no_of_available, 2)
+
+    def test_negative_caching_and_invalidation_on_add(self):
+        self.assertIsNone(self.cached_repository.get_book_by_title("Emma"))
+        self.assertIsNone(self.cached_repository.get_book_by_title("Emma"))
+        self.assertEqual(self.cache.stats()["negative_hits"], 1)
+
+        self.cached_repository.add_book(Books(title="Emma", author="Jane Austen"))
+        self.assertIsNotNone(self.cached_repository.get_book_by_title("Emma"))
+
+    def test_update_invalidates_old_title(self):
+        self.cached_repository.get_book_by_title("Dune")
+        self.cached_repository.update_book(Books(id="1", title="Dune Messiah", author="Frank Herbert"))
+
+        self.assertIsNone(self.cached_repository.get_book_by_title("Dune"))
+        self.assertEqual(self.cached_repository.get_book_by_id("1").title, "Dune Messiah")
+
+    def test_delete_drops_a_book_found_by_title(self):
+        self.cached_repository.get_book_by_title("Dune")
+        self.cached_repository.delete_book("1")
+
+        self.assertIsNone(self.cached_repository.get_book_by_title("Dune"))
+
+    def test_cache_holds_no_more_than_max_entries(self):
+        cached_repository = CachedBooksRepository(self.books_repository, LRUCache(max_entries=4, ttl=60))
+        for i in range(20):
+            self.books_repository.add_book(Books(id=f"b{i}", title=f"Title {i}", author="x"))
+            cached_repository.get_book_by_title(f"Title {i}")
+
+        self.assertEqual(cached_repository.stats()["size"], 4)
+        self.assertEqual(cached_repository.get_book_by_title("Title 19").id, "b19")
+
+    def test_availability_change_invalidates_book_and_pages(self):
+        self.cached_repository.get_book_by_id("1")
+        self.cached_repository.get_books(10)
+        self.cached_repository.decrement_available_copies("1")
+
+        self.assertEqual(self.cached_repository.get_book_by_id("1").no_of_available, 1)
+        self.assertEqual(self.cached_repository.get_books(10)[0].no_of_available, 1)
+
+    def test_invalidation_waits_for_commit(self):
+        self.cached_repository.get_book_by_id("1")
+        with self.db.transaction():
+            self.cached_repository.decrement_available_copies("1")
+            # Reads inside the transaction bypass the cache and see the uncommitted row
+            self.assertEqual(self.cached_repository.get_book_by_id("1").no_of_available, 1)
+        self.assertEqual(self.cached_repository.get_book_by_id("1").no_of_available, 1)
+
+    def test_rollback_keeps_cache(self):
+        self.cached_repository.get_book_by_id("1")
+        try:
+            with self.db.transaction():
+                self.cached_repository.decrement_available_copies("1")
+                raise ValueError("abort")
+        except ValueError:
+            pass
+        self.assertEqual(self.cached_repository.get_book_by_id("1").no_of_available, 2)
+
+    def test_delete_invalidates(self):
+        self.cached_repository.get_book_by_id("1")
+        self.cached_repository.delete_book("1")
+        self.assertIsNone(self.cached_repository.get_book_by_id("1"))
+
+    def test_write_during_load_is_not_cached(self):
+        repository = MagicMock()
+        repository.db.in_transaction.return_value = False
+        repository.db.after_commit.side_effect = lambda callback: callback()
+        cached_repository = CachedBooksRepository(repository, LRUCache())
+
+        def load(book_id, limit):
+            # A concurrent write commits while this read is in flight
+            cached_repository.invalidate(book_id)
+            return Books(id=book_id, title="Stale", author="x")
+
+        repository.get_book_by_id.side_effect = load
+        cached_repository.get_book_by_id("1")
+        cached_repository.get_book_by_id("1")
+        self.assertEqual(repository.get_book_by_id.call_count, 2)
+
+    def test_bulk_upsert_invalidates_everything(self):
+        self.cached_repository.get_book_by_title("Dune")
+        self.cached_repository.get_books(10)
+
+        self.cached_repository.upsert_books([Books(title="Dune", author="Frank Herbert", no_of_copies=3, no_of_available=3),
+                                             Books(title="Emma", author="Jane Austen")])
+
+        self.assertEqual(self.cached_repository.get_book_by_title("Dune").no_of_copies, 5)
+        self.assertEqual([book.title for book in self.cached_repository.get_books(10)], ["Dune", "Emma"])
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.cached_books_repository import CachedBooksRepository
+from src.app.repositories.coalescing_books_repository import CoalescingBooksRepository
+from src.app.utils.cache.cache import LRUCache
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+
+
+class TestCoalescingBooksRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_books_repository = MagicMock()
+        self.mock_books_repository.db.in_transaction.return_value = False
+        self.repository = CoalescingBooksRepository(self.mock_books_repository)
+        self.book = Books(id="1", title="Dune", author="Frank Herbert", no_of_copies=2, no_of_available=2)
+
+    def test_concurrent_title_lookups_share_one_query(self):
+        release = threading.Event()
+
+        def slow_lookup(title):
+            release.wait(5)
+            return self.book
+        self.mock_books_repository.get_book_by_title.side_effect = slow_lookup
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.repository.get_book_by_title("Dune")))
+                   for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while self.repository.stats()["collapsed"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.mock_books_repository.get_book_by_title.assert_called_once_with("Dune")
+        self.assertEqual([book.title for book in results], ["Dune"] * 4)
+        self.assertEqual(len({id(book) for book in results}), 4)  # waiters get their own copy
+        self.assertEqual(self.repository.stats()["collapsed"], 3)
+
+    def test_lookup_inside_transaction_is_not_coalesced(self):
+        self.mock_books_repository.db.in_transaction.return_value = True
+        self.mock_books_repository.get_book_by_id.return_value = self.book
+
+        book = self.repository.get_book_by_id("1")
+
+        self.assertIs(book, self.book)
+        self.assertEqual(self.repository.stats()["calls"], 0)
+
+    def test_writes_are_delegated(self):
+        self.repository.add_book(self.book)
+
+        self.mock_books_repository.add_book.assert_called_once_with(self.book)
+
+
+class TestCoalescingBehindCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.books_repository.add_book(Books(id="1", title="Dune", author="Frank Herbert", no_of_copies=2,
+                                             no_of_available=2))
+        self.cached_repository = CachedBooksRepository(CoalescingBooksRepository(self.books_repository),
+                                                       LRUCache(ttl=60))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lookup_after_a_write_does_not_join_an_earlier_flight(self):
+        read_old_row, release = threading.Event(), threading.Event()
+        get_book_by_id = self.books_repository.get_book_by_id
+
+        def slow_lookup(id, limit=100):
+            book = get_book_by_id(id, limit)
+            read_old_row.set()
+            release.wait(5)
+            return book
+        results = []
+
+        with patch.object(self.books_repository, "get_book_by_id", side_effect=slow_lookup) as lookup:
+            before = threading.Thread(target=lambda: results.append(self.cached_repository.get_book_by_id("1")))
+            before.start()
+            read_old_row.wait(5)
+            self.cached_repository.update_book(Books(id="1", title="Dune", author="F. Herbert", no_of_copies=2,
+                                                     no_of_available=2))
+            after = threading.Thread(target=lambda: results.append(self.cached_repository.get_book_by_id("1")))
+            after.start()
+            deadline = time.monotonic() + 2
+            while lookup.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            release.set()
+            before.join(5)
+            after.join(5)
+
+        self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(sorted(book.author for book in results), ["F. Herbert", "Frank Herbert"])
+        self.assertEqual(self.cached_repository.get_book_by_id("1").author, "F. Herbert")
@@ -78,6 +78,37 @@ class TestIssuedBookRepository(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "Database error")
 
+    def test_save_issue_books_uses_executemany(self):
+        # Arrange
+        issued_books = [IssuedBooks(id=f"id{i}", user_id="user1", book_id="book1",
+                                    borrow_date="2024-12-20", return_date="2024-12-30") for i in range(2)]
+
+        # Act
+        self.issued_book_repository.save_issue_books(issued_books)
+
+        # Assert
+        rows = self.mock_conn.executemany.call_args[0][1]
+        self.assertEqual([row[0] for row in rows], ["id0", "id1"])
+
+    def test_count_issued_books(self):
+        # Arrange
+        self.mock_conn.execute.return_value.fetchall.return_value = [("book1", 2)]
+
+        # Act
+        result = self.issued_book_repository.count_issued_books("user1", ["book1", "book2"])
+
+        # Assert
+        self.assertEqual(result, {"book1": 2})
+        self.assertEqual(self.mock_conn.execute.call_args[0][1], ("user1", "book1", "book2"))
+
+    def test_remove_issue_books_raises_database_error(self):
+        # Arrange
+        self.mock_conn.execute.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with self.assertRaises(DatabaseError):
+            self.issued_book_repository.remove_issue_books("user1", ["book1"])
+
     def test_get_issue_books_success(self):
         # Arrange
         query = "SELECT ..."
@@ -0,0 +1,75 @@
+import shutil
+import tempfile
+import unittest
+import os
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.search_repository import SearchRepository, build_match_expression
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+
+
+class TestBuildMatchExpression(unittest.TestCase):
+
+    def test_terms_are_quoted(self):
+        self.assertEqual(build_match_expression("harry potter"), '"harry" "potter"')
+
+    def test_operators_are_not_passed_through(self):
+        self.assertEqual(build_match_expression('tolkien OR "ring" -x*'), '"tolkien" "OR" "ring" "x"')
+
+    def test_prefix_applies_to_last_term(self):
+        self.assertEqual(build_match_expression("lord of the ri", prefix=True), '"lord" "of" "the" "ri"*')
+
+    def test_empty(self):
+        self.assertEqual(build_match_expression("  ?! "), "")
+
+
+class TestSearchRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.search_repository = SearchRepository(self.db)
+
+        for title, author in [
+            ("The Lord of the Rings", "J. R. R. Tolkien"),
+            ("The Hobbit", "J. R. R. Tolkien"),
+            ("Lord of the Flies", "William Golding"),
+            ("Rings of Saturn", "W. G. Sebald"),
+        ]:
+            self.books_repository.add_book(Books(title=title, author=author))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_multi_word_search_ranks_matches(self):
+        results = self.search_repository.search_books("lord rings")
+        self.assertEqual([result.title for result in results], ["The Lord of the Rings"])
+        self.assertIn("<mark>Lord</mark>", results[0].title_snippet)
+
+    def test_search_by_author(self):
+        results = self.search_repository.search_books("tolkien")
+        self.assertEqual({result.title for result in results}, {"The Lord of the Rings", "The Hobbit"})
+        self.assertIn("<mark>Tolkien</mark>", results[0].author_snippet)
+
+    def test_prefix_search(self):
+        self.assertEqual(self.search_repository.search_books("hob"), [])
+        results = self.search_repository.search_books("hob", prefix=True)
+        self.assertEqual([result.title for result in results], ["The Hobbit"])
+
+    def test_index_follows_updates_and_deletes(self):
+        book = self.books_repository.get_book_by_title("The Hobbit")
+        book.title = "The Hobbit, or There and Back Again"
+        self.books_repository.update_book(book)
+        self.assertEqual(len(self.search_repository.search_books("there back")), 1)
+
+        self.books_repository.delete_book(book.id)
+        self.assertEqual(self.search_repository.search_books("hobbit"), [])
+
+    def test_rebuild_index(self):
+        self.search_repository.rebuild_index()
+        self.assertEqual(len(self.search_repository.search_books("saturn")), 1)
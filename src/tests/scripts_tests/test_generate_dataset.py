@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.generate_dataset import PASSWORD_PREFIX, generate_dataset, hash_pool
+from src.app.services.user_service import UserService
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.errors.error import InvalidCredentialsError
+from src.app.utils.validators.validators import Validators
+
+
+class TestGenerateDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.schema = self.indexes_and_triggers()
+        self.pool = hash_pool(2, rounds=4, workers=2)
+        # Small batches, so every table is written in several of them
+        self.report = generate_dataset(self.db, users=20, books=50, issues=300, seed=7, days=30,
+                                       end_date=date(2024, 6, 30), password_pool=self.pool, batch_size=64)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def indexes_and_triggers(self):
+        with self.db.get_connection() as conn:
+            return sorted(tuple(row) for row in conn.execute("SELECT type, name, tbl_name, sql FROM sqlite_master "
+                                                             "WHERE type IN ('index', 'trigger') AND sql IS NOT NULL"))
+
+    def query(self, sql):
+        with self.db.get_connection() as conn:
+            return conn.execute(sql).fetchall()
+
+    def test_row_counts_match_the_report(self):
+        self.assertEqual((self.report.users, self.report.books, self.report.issues), (21, 50, 300))
+        self.assertEqual(self.query("SELECT COUNT(*) FROM user")[0][0], 21)  # the members plus one admin
+        self.assertEqual(self.query("SELECT COUNT(*) FROM book")[0][0], 50)
+        self.assertEqual(self.query("SELECT COUNT(*) FROM issuedBook")[0][0], 300)
+        self.assertEqual(set(self.report.seconds), {"users", "books", "issues", "copies"})
+
+    def test_copies_cover_the_loans(self):
+        rows = self.query("SELECT b.number_of_copies, b.number_of_available_books, COUNT(i.id) FROM book b "
+                          "LEFT JOIN issuedBook i ON i.book_id = b.id GROUP BY b.id")
+
+        for copies, available, loans in rows:
+            self.assertEqual(copies - available, loans)
+            self.assertGreaterEqual(available, 0)
+            self.assertGreaterEqual(copies, 1)
+        self.assertEqual(sum(loans for _, _, loans in rows), 300)
+
+    def test_loans_reference_generated_rows(self):
+        orphans = self.query("SELECT COUNT(*) FROM issuedBook i LEFT JOIN user u ON u.id = i.user_id "
+                             "LEFT JOIN book b ON b.id = i.book_id WHERE u.id IS NULL OR b.id IS NULL")
+        self.assertEqual(orphans[0][0], 0)
+        first, last = self.query("SELECT MIN(borrow_date), MAX(borrow_date) FROM issuedBook")[0]
+        self.assertGreaterEqual(first, "2024-06-01")
+        self.assertLessEqual(last, "2024-06-30")
+
+    def test_indexes_and_triggers_are_restored(self):
+        self.assertEqual(self.indexes_and_triggers(), self.schema)
+        self.assertEqual(dict(self.query("SELECT name, version > 0 FROM table_version")),
+                         {"book": 1, "issuedBook": 1})
+
+    def test_generated_users_can_log_in(self):
+        user_service = UserService(UserRepository(self.db))
+        email = "user3@jecrc.ac.in"
+
+        user = user_service.login_user(email, f"{PASSWORD_PREFIX}{3 % len(self.pool)}")
+
+        self.assertTrue(Validators.is_email_valid(email))
+        self.assertEqual(user.email, email)
+        with self.assertRaises(InvalidCredentialsError):
+            user_service.login_user(email, f"{PASSWORD_PREFIX}{4 % len(self.pool)}")
@@ -1,8 +1,17 @@
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 from unittest.mock import MagicMock
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.cached_books_repository import CachedBooksRepository
 from src.app.services.book_service import BookService
+from src.app.utils.cache.cache import LRUCache
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
 from src.app.model.books import Books
-from src.app.utils.errors.error import NotExistsError
+from src.app.utils.errors.error import NotExistsError, InvalidCursorError
 from src.app.config.messages import BOOK_NOT_EXIST
 
 
@@ -125,8 +134,31 @@ class TestBookService(unittest.TestCase):
         result = self.book_service.get_all_books()
 
         # Assert
-        self.mock_book_repository.get_books.assert_called_once()
-        self.assertEqual(result, expected_books)
+        self.mock_book_repository.get_books.assert_called_once_with(101, None)
+        self.assertEqual(result.items, expected_books)
+        self.assertFalse(result.has_more)
+        self.assertIsNone(result.next_cursor)
+
+    def test_get_all_books_next_page(self):
+        # Arrange
+        self.mock_book_repository.get_books.return_value = [
+            Books(id="101", title="Book 1",author="author1"),
+            Books(id="102", title="Book 2",author="author1"),
+            Books(id="103", title="Book 3",author="author1"),
+        ]
+
+        # Act
+        first = self.book_service.get_all_books(limit=2)
+        self.book_service.get_all_books(limit=2, cursor=first.next_cursor)
+
+        # Assert
+        self.assertTrue(first.has_more)
+        self.assertEqual([book.title for book in first.items], ["Book 1", "Book 2"])
+        self.mock_book_repository.get_books.assert_called_with(3, "Book 2")
+
+    def test_get_all_books_invalid_cursor(self):
+        with self.assertRaises(InvalidCursorError):
+            self.book_service.get_all_books(cursor="not-a-cursor")
 
     def test_get_book_by_title_success(self):
         # Arrange
@@ -151,3 +183,45 @@ class TestBookService(unittest.TestCase):
         self.assertEqual(str(context.exception), BOOK_NOT_EXIST)
 
 
+class TestBookServiceBehindCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "library.db")
+        self.db = DB(self.db_path)
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.book_service = BookService(CachedBooksRepository(self.books_repository, LRUCache(ttl=60)))
+        self.book_service.add_book(Books(id="1", title="Dune", author="Frank Herbert", no_of_copies=1,
+                                         no_of_available=1))
+        self.book_service.get_book_by_title("Dune")  # cached
+        self.book_service.book_repository.get_book_by_id("1")
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def external_write(self, sql):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute(sql)
+        conn.close()
+
+    def copies(self):
+        book = self.books_repository.get_book_by_id("1")
+        return book.no_of_copies, book.no_of_available
+
+    def test_add_copy_builds_on_the_current_row_not_the_cached_one(self):
+        self.external_write("UPDATE book SET number_of_copies = number_of_copies + 10, "
+                            "number_of_available_books = number_of_available_books + 10 WHERE id = '1'")
+
+        self.book_service.add_book(Books(title="Dune", author="Frank Herbert"))
+
+        self.assertEqual(self.copies(), (12, 12))
+
+    def test_remove_copy_builds_on_the_current_row_not_the_cached_one(self):
+        self.external_write("UPDATE book SET number_of_copies = 5, number_of_available_books = 5 WHERE id = '1'")
+
+        self.book_service.remove_book_by_id("1")
+
+        self.assertEqual(self.copies(), (4, 4))
@@ -0,0 +1,98 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.services.book_service import BookService
+from src.app.services.catalog_import import CatalogImporter, detect_format, read_rows, text_stream
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.errors.error import InvalidRequestBody
+
+
+class TestCatalogImport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.book_service = BookService(self.books_repository)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def copies(self, title):
+        book = self.books_repository.get_book_by_title(title)
+        return (book.no_of_copies, book.no_of_available) if book else None
+
+    def test_csv_import_merges_duplicates_and_adds_to_existing_titles(self):
+        self.books_repository.add_book(Books(title="Dune", author="Frank Herbert", no_of_copies=2, no_of_available=1))
+        csv_data = ("title,author,copies\n"
+                    "Dune,Frank Herbert,3\n"
+                    "Emma,Jane Austen,\n"
+                    "Emma,Jane Austen,2\n")
+
+        report = self.book_service.import_books(io.StringIO(csv_data), "csv")
+
+        self.assertEqual(report.rows_read, 3)
+        self.assertEqual(report.rows_imported, 3)
+        self.assertEqual(report.duplicates_merged, 1)
+        self.assertEqual(report.books_written, 2)
+        self.assertEqual(report.error_count, 0)
+        self.assertEqual(self.copies("Dune"), (5, 4))
+        self.assertEqual(self.copies("Emma"), (3, 3))
+
+    def test_row_errors_are_reported_with_line_numbers(self):
+        jsonl = ('{"title": "Dune", "author": "Frank Herbert"}\n'
+                 'not json\n'
+                 '\n'
+                 '["a list"]\n'
+                 '{"title": "", "author": "Nobody"}\n'
+                 '{"title": "Emma", "author": "Jane Austen", "copies": 0}\n'
+                 '{"title": "Ulysses", "author": "James Joyce", "copies": "two"}\n')
+
+        report = self.book_service.import_books(io.StringIO(jsonl), "jsonl")
+
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual(report.error_count, 5)
+        self.assertEqual([error.line for error in report.errors], [2, 4, 5, 6, 7])
+        self.assertEqual(report.errors[2].message, "title is required")
+        self.assertEqual(self.copies("Dune"), (1, 1))
+        self.assertIsNone(self.copies("Emma"))
+
+    def test_rows_are_written_in_batches(self):
+        rows = "".join(f'{{"title": "Book {i}", "author": "Author"}}\n' for i in range(25))
+        progress = []
+
+        report = CatalogImporter(self.books_repository, batch_size=10).run(
+            read_rows(io.StringIO(rows), "jsonl"), progress=lambda r: progress.append(r.books_written))
+
+        self.assertEqual(report.batches, 3)
+        self.assertEqual(progress, [10, 20, 25])
+        self.assertEqual(len(self.books_repository.get_books(100)), 25)
+
+    def test_reported_errors_are_capped(self):
+        rows = "title,author\n" + ",nobody\n" * 5
+
+        report = CatalogImporter(self.books_repository, max_errors=2).run(read_rows(io.StringIO(rows), "csv"))
+
+        self.assertEqual(report.error_count, 5)
+        self.assertEqual(len(report.errors), 2)
+
+    def test_binary_stream(self):
+        report = self.book_service.import_books(text_stream(io.BytesIO("title,author\nÉmile,Rousseau\n".encode())), "csv")
+
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual(self.copies("Émile"), (1, 1))
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format("books.CSV"), "csv")
+        self.assertEqual(detect_format("books.ndjson"), "jsonl")
+        self.assertEqual(detect_format(content_type="text/csv; charset=utf-8"), "csv")
+        with self.assertRaises(InvalidRequestBody):
+            detect_format("books.xlsx", "application/octet-stream")
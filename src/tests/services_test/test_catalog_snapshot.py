@@ -0,0 +1,120 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from flask import Flask, jsonify
+
+from src.app.model.books import Books
+from src.app.repositories.books_repository import BooksRepository
+from src.app.services.book_service import BookService
+from src.app.services.catalog_snapshot import CatalogSnapshot
+from src.app.model.responses import Response
+from src.app.config.enumeration import Status
+from src.app.config.messages import BOOK_FETCH_SUCCESSFULLY
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.json_provider import install_json_provider
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.snapshot = CatalogSnapshot(self.books_repository, limit=3)
+
+        for title in ("B", "D", "F", "H"):
+            self.books_repository.add_book(Books(id=title.lower(), title=title, author="Author é"))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def titles(self):
+        body, _etag, _version = self.snapshot.get()
+        return [book["title"] for book in json.loads(body)["data"]]
+
+    def test_body_matches_regular_response(self):
+        body, _etag, _version = self.snapshot.get()
+
+        page = BookService(self.books_repository).get_all_books(3)
+        for provider in ("auto", "stdlib"):
+            app = Flask(__name__)
+            install_json_provider(app, provider)
+            with app.app_context():
+                expected = jsonify(Response.response(BOOK_FETCH_SUCCESSFULLY, Status.SUCCESS.value,
+                                                     data=[book.to_dict() for book in page.items],
+                                                     pagination=page.meta())).get_data()
+            self.assertEqual(body, expected, provider)
+
+    def test_unchanged_snapshot_is_reused(self):
+        first = self.snapshot.get()
+        second = self.snapshot.get()
+        self.assertIs(first[0], second[0])
+        self.assertEqual(self.snapshot.full_rebuilds, 1)
+
+    def test_availability_change_is_incremental(self):
+        _body, etag, version = self.snapshot.get()
+        self.books_repository.decrement_available_copies("d")
+
+        body, new_etag, new_version = self.snapshot.get()
+        self.assertNotEqual(etag, new_etag)
+        self.assertGreater(new_version, version)
+        self.assertEqual(json.loads(body)["data"][1]["no_of_available"], 0)
+        self.assertEqual(self.snapshot.full_rebuilds, 1)
+        self.assertEqual(self.snapshot.incremental_rebuilds, 1)
+
+    def test_new_book_in_page_rebuilds(self):
+        self.snapshot.get()
+        self.books_repository.add_book(Books(id="a", title="A", author="x"))
+        self.assertEqual(self.titles(), ["A", "B", "D"])
+        self.assertEqual(self.snapshot.full_rebuilds, 2)
+
+    def test_new_book_after_full_page_is_ignored(self):
+        self.snapshot.get()
+        self.books_repository.add_book(Books(id="z", title="Z", author="x"))
+        self.assertEqual(self.titles(), ["B", "D", "F"])
+        self.assertEqual(self.snapshot.full_rebuilds, 1)
+
+    def test_delete_rebuilds(self):
+        self.snapshot.get()
+        self.books_repository.delete_book("b")
+        self.assertEqual(self.titles(), ["D", "F", "H"])
+
+    def test_rolled_back_change_is_not_seen(self):
+        self.snapshot.get()
+        try:
+            with self.db.transaction():
+                self.books_repository.decrement_available_copies("b")
+                raise ValueError("abort")
+        except ValueError:
+            pass
+        self.snapshot.get()
+        self.assertEqual(self.snapshot.incremental_rebuilds, 0)
+
+    def test_bulk_change_rebuilds(self):
+        self.titles()
+        self.books_repository.upsert_books([Books(title="A", author="Author é")])
+
+        self.assertEqual(self.titles(), ["A", "B", "D"])
+        self.assertEqual(self.snapshot.full_rebuilds, 2)
+
+    def test_write_from_another_process_rebuilds(self):
+        body, etag, version = self.snapshot.get()
+        conn = sqlite3.connect(os.path.join(self.tmp_dir, "library.db"))
+        with conn:
+            conn.execute("INSERT INTO book (id, title, author, number_of_copies, number_of_available_books) "
+                         "VALUES ('a', 'A', 'x', 1, 1)")
+        conn.close()
+
+        new_body, new_etag, new_version = self.snapshot.get()
+        self.assertNotEqual(new_body, body)
+        self.assertNotEqual(new_etag, etag)
+        self.assertGreater(new_version, version)
+        self.assertEqual([book["title"] for book in json.loads(new_body)["data"]], ["A", "B", "D"])
+        self.assertEqual(self.snapshot.full_rebuilds, 2)
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+from src.app.model.issued_books import IssuedBooks
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.issued_book_repository import IssuedBookRepository
+from src.app.services.circulation_export import encode_chunks
+from src.app.services.issue_book_service import IssueBookService
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.errors.error import InvalidRequestBody
+
+
+class TestCirculationExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.issued_book_repository = IssuedBookRepository(self.db)
+        self.service = IssueBookService(self.issued_book_repository, BooksRepository(self.db))
+        with self.db.get_connection() as conn:
+            conn.execute("PRAGMA foreign_keys = OFF")
+        self.issued_book_repository.save_issue_books([
+            IssuedBooks(id=f"i{day}", user_id=f"u{day % 2}", book_id="b1",
+                        borrow_date=f"2024-01-{day:02d}", return_date="2024-02-01")
+            for day in range(1, 6)
+        ])
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_rows_are_read_in_chunks(self):
+        # Act
+        chunks = list(self.issued_book_repository.iter_issue_book_rows(chunk_size=2))
+
+        # Assert
+        self.assertEqual([len(rows) for rows in chunks], [2, 2, 1])
+        self.assertEqual([row[0] for rows in chunks for row in rows], ["i1", "i2", "i3", "i4", "i5"])
+
+    def test_ndjson_export_with_filters(self):
+        # Act
+        body = "".join(self.service.export_issued_books("ndjson", date(2024, 1, 2), date(2024, 1, 4), user_id="u1"))
+
+        # Assert
+        self.assertEqual(body.splitlines(), [
+            '{"id":"i3","user_id":"u1","book_id":"b1","borrow_date":"2024-01-03","return_date":"2024-02-01"}',
+        ])
+
+    def test_csv_export_has_one_header(self):
+        # Act
+        body = "".join(self.service.export_issued_books("csv", chunk_size=2))
+
+        # Assert
+        lines = body.splitlines()
+        self.assertEqual(lines[0], "id,user_id,book_id,borrow_date,return_date")
+        self.assertEqual(len(lines), 6)
+
+    def test_csv_export_without_rows_sends_header(self):
+        # Act
+        body = "".join(self.service.export_issued_books("csv", book_id="missing"))
+
+        # Assert
+        self.assertEqual(body, "id,user_id,book_id,borrow_date,return_date\n")
+
+    def test_unknown_format(self):
+        # Act & Assert
+        with self.assertRaises(InvalidRequestBody):
+            encode_chunks(iter([]), "xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.app.model.batch_result import BatchItemResult
+from src.app.model.books import Books
+from src.app.model.issued_books import IssuedBooks
+from src.app.repositories.books_repository import BooksRepository
+from src.app.repositories.issued_book_repository import IssuedBookRepository
+from src.app.services.issue_book_service import IssueBookService
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+
+
+class TestIssueBookBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DB(os.path.join(self.tmp_dir, "library.db"))
+        apply_migrations(self.db)
+        self.books_repository = BooksRepository(self.db)
+        self.issued_book_repository = IssuedBookRepository(self.db)
+        self.service = IssueBookService(self.issued_book_repository, self.books_repository)
+        self.books_repository.add_book(Books(id="a", title="A", author="x", no_of_copies=2, no_of_available=2))
+        self.books_repository.add_book(Books(id="b", title="B", author="y", no_of_copies=1, no_of_available=1))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def issue(self, book_id):
+        return IssuedBooks(user_id="u1", book_id=book_id, borrow_date="2024-12-20", return_date="2024-12-30")
+
+    def available(self, book_id):
+        return self.books_repository.get_book_by_id(book_id).no_of_available
+
+    def test_issue_books_all_or_nothing_writes_nothing_on_failure(self):
+        # Act
+        results = self.service.issue_books([self.issue("a"), self.issue("b"), self.issue("missing")])
+
+        # Assert
+        self.assertEqual([r.status for r in results],
+                         [BatchItemResult.ABORTED, BatchItemResult.ABORTED, BatchItemResult.FAILED])
+        self.assertEqual((self.available("a"), self.available("b")), (2, 1))
+        self.assertEqual(self.issued_book_repository.get_issue_book_by_user_id("u1"), [])
+
+    def test_issue_books_partial_hands_out_available_copies_in_order(self):
+        # Act
+        results = self.service.issue_books([self.issue("a") for _ in range(3)] + [self.issue("b")],
+                                         all_or_nothing=False)
+
+        # Assert
+        self.assertEqual([r.status for r in results],
+                         [BatchItemResult.ISSUED, BatchItemResult.ISSUED, BatchItemResult.FAILED, BatchItemResult.ISSUED])
+        self.assertEqual((self.available("a"), self.available("b")), (0, 0))
+        self.assertEqual(len(self.issued_book_repository.get_issue_book_by_user_id("u1")), 3)
+
+    def test_return_issue_books_restores_every_copy(self):
+        # Arrange
+        self.service.issue_books([self.issue("a"), self.issue("a"), self.issue("b")])
+
+        # Act
+        results = self.service.return_issue_books("u1", ["a", "b", "a"])
+
+        # Assert
+        self.assertEqual([(r.book_id, r.status) for r in results],
+                         [("a", BatchItemResult.RETURNED), ("b", BatchItemResult.RETURNED)])
+        self.assertEqual((self.available("a"), self.available("b")), (2, 1))
+        self.assertEqual(self.issued_book_repository.get_issue_book_by_user_id("u1"), [])
+
+    def test_return_issue_books_partial_skips_books_not_held(self):
+        # Arrange
+        self.service.issue_books([self.issue("a")])
+
+        # Act
+        results = self.service.return_issue_books("u1", ["a", "b"], all_or_nothing=False)
+
+        # Assert
+        self.assertEqual([r.status for r in results], [BatchItemResult.RETURNED, BatchItemResult.FAILED])
+        self.assertEqual((self.available("a"), self.available("b")), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from src.app.services.issue_book_service import IssueBookService
 from src.app.model.issued_books import IssuedBooks
 from src.app.model.books import Books
+from src.app.model.batch_result import BatchItemResult
 from src.app.utils.errors.error import NotExistsError, InvalidOperationError
 
 
@@ -24,28 +25,29 @@ class TestIssueBookService(unittest.TestCase):
         result = self.issue_book_service.get_all_issued_books()
 
         # Assert
-        self.mock_issued_book_repository.get_issue_books.assert_called_once()
-        self.assertEqual(result, expected_issued_books)
+        self.mock_issued_book_repository.get_issue_books.assert_called_once_with(101, None)
+        self.assertEqual(result.items, expected_issued_books)
+        self.assertFalse(result.has_more)
 
     def test_issue_book_successfully(self):
         # Arrange
-        book = Books(id="101", title="Book Title", no_of_available=5,author="author1")
         issued_book = IssuedBooks(user_id="1", book_id=None,borrow_date="2024-12-20",id="id1",return_date="2024-12-30")
-        self.mock_book_repository.get_book_by_id.return_value = book
+        self.mock_book_repository.decrement_available_copies.return_value = True
 
         # Act
         self.issue_book_service.issue_book(issued_book, "101")
 
         # Assert
-        self.mock_book_repository.get_book_by_id.assert_called_once_with("101")
+        self.mock_book_repository.transaction.assert_called_once()
+        self.mock_book_repository.decrement_available_copies.assert_called_once_with("101")
+        self.mock_book_repository.get_book_by_id.assert_not_called()
         self.mock_issued_book_repository.save_issue_book.assert_called_once_with(issued_book)
-        self.mock_book_repository.update_book_availability.assert_called_once()
         self.assertEqual(issued_book.book_id, "101")
-        self.assertEqual(book.no_of_available, 4)
 
     def test_issue_book_not_exists(self):
         # Arrange
         issued_book = IssuedBooks(user_id="1", book_id=None,borrow_date="2024-12-20",id="id1",return_date="2024-12-30")
+        self.mock_book_repository.decrement_available_copies.return_value = False
         self.mock_book_repository.get_book_by_id.return_value = None
 
         # Act & Assert
@@ -58,6 +60,7 @@ class TestIssueBookService(unittest.TestCase):
         # Arrange
         book = Books(id="101", title="Book Title", no_of_available=0,author="author1")
         issued_book = IssuedBooks(user_id="1", book_id=None,borrow_date="2024-12-20",id="id1",return_date="2024-12-30")
+        self.mock_book_repository.decrement_available_copies.return_value = False
         self.mock_book_repository.get_book_by_id.return_value = book
 
         # Act & Assert
@@ -66,30 +69,104 @@ class TestIssueBookService(unittest.TestCase):
         self.mock_book_repository.get_book_by_id.assert_called_once_with("101")
         self.mock_issued_book_repository.save_issue_book.assert_not_called()
 
+    def test_issue_book_rolls_back_on_error(self):
+        # Arrange
+        issued_book = IssuedBooks(user_id="1", book_id=None,borrow_date="2024-12-20",id="id1",return_date="2024-12-30")
+        self.mock_book_repository.decrement_available_copies.return_value = True
+        self.mock_issued_book_repository.save_issue_book.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with self.assertRaises(Exception):
+            self.issue_book_service.issue_book(issued_book, "101")
+        exit_args = self.mock_book_repository.transaction.return_value.__exit__.call_args[0]
+        self.assertIsNotNone(exit_args[0])
+
     def test_return_issue_book_successfully(self):
         # Arrange
-        book = Books(id="101", title="Book Title", no_of_available=5,author="author1")
-        self.mock_book_repository.get_book_by_id.return_value = book
+        self.mock_issued_book_repository.remove_issue_book.return_value = 1
+        self.mock_book_repository.increment_available_copies.return_value = True
 
         # Act
         self.issue_book_service.return_issue_book("1", "101")
 
         # Assert
-        self.mock_book_repository.get_book_by_id.assert_called_once_with("101")
-        self.mock_book_repository.update_book_availability.assert_called_once()
+        self.mock_book_repository.transaction.assert_called_once()
         self.mock_issued_book_repository.remove_issue_book.assert_called_once_with("1", "101")
-        self.assertEqual(book.no_of_available, 6)
+        self.mock_book_repository.increment_available_copies.assert_called_once_with("101", 1)
+
+    def test_return_issue_book_not_issued(self):
+        # Arrange
+        self.mock_issued_book_repository.remove_issue_book.return_value = 0
+
+        # Act & Assert
+        with self.assertRaises(NotExistsError):
+            self.issue_book_service.return_issue_book("1", "101")
+        self.mock_book_repository.increment_available_copies.assert_not_called()
 
     def test_return_issue_book_not_exists(self):
         # Arrange
-        self.mock_book_repository.get_book_by_id.return_value = None
+        self.mock_issued_book_repository.remove_issue_book.return_value = 1
+        self.mock_book_repository.increment_available_copies.return_value = False
 
         # Act & Assert
         with self.assertRaises(NotExistsError):
             self.issue_book_service.return_issue_book("1", "101")
-        self.mock_book_repository.get_book_by_id.assert_called_once_with("101")
-        self.mock_book_repository.update_book_availability.assert_not_called()
-        self.mock_issued_book_repository.remove_issue_book.assert_not_called()
+        self.mock_book_repository.increment_available_copies.assert_called_once_with("101", 1)
+
+    def test_issue_books_single_availability_query_and_update(self):
+        # Arrange
+        issued_books = [IssuedBooks(user_id="1", book_id=book_id, borrow_date="2024-12-20", return_date="2024-12-30")
+                        for book_id in ("101", "101", "102")]
+        self.mock_book_repository.get_available_copies.return_value = {"101": 5, "102": 1}
+        self.mock_book_repository.adjust_available_copies.return_value = 2
+
+        # Act
+        results = self.issue_book_service.issue_books(issued_books)
+
+        # Assert
+        self.mock_book_repository.get_available_copies.assert_called_once_with(["101", "102"])
+        self.mock_book_repository.adjust_available_copies.assert_called_once_with({"101": -2, "102": -1})
+        self.mock_issued_book_repository.save_issue_books.assert_called_once_with(issued_books)
+        self.assertTrue(all(result.status == BatchItemResult.ISSUED for result in results))
+
+    def test_issue_books_all_or_nothing_skips_writes_on_failure(self):
+        # Arrange
+        issued_books = [IssuedBooks(user_id="1", book_id=book_id, borrow_date="2024-12-20", return_date="2024-12-30")
+                        for book_id in ("101", "102")]
+        self.mock_book_repository.get_available_copies.return_value = {"101": 1, "102": 0}
+
+        # Act
+        results = self.issue_book_service.issue_books(issued_books)
+
+        # Assert
+        self.assertEqual([r.status for r in results], [BatchItemResult.ABORTED, BatchItemResult.FAILED])
+        self.assertIsNone(results[0].issue_id)
+        self.mock_book_repository.adjust_available_copies.assert_not_called()
+        self.mock_issued_book_repository.save_issue_books.assert_not_called()
+
+    def test_issue_books_rolls_back_when_availability_changed(self):
+        # Arrange
+        issued_books = [IssuedBooks(user_id="1", book_id="101", borrow_date="2024-12-20", return_date="2024-12-30")]
+        self.mock_book_repository.get_available_copies.return_value = {"101": 1}
+        self.mock_book_repository.adjust_available_copies.return_value = 0
+
+        # Act & Assert
+        with self.assertRaises(InvalidOperationError):
+            self.issue_book_service.issue_books(issued_books)
+        self.mock_issued_book_repository.save_issue_books.assert_not_called()
+
+    def test_return_issue_books_partial(self):
+        # Arrange
+        self.mock_issued_book_repository.count_issued_books.return_value = {"101": 2}
+        self.mock_book_repository.adjust_available_copies.return_value = 1
+
+        # Act
+        results = self.issue_book_service.return_issue_books("1", ["101", "102"], all_or_nothing=False)
+
+        # Assert
+        self.assertEqual([r.status for r in results], [BatchItemResult.RETURNED, BatchItemResult.FAILED])
+        self.mock_issued_book_repository.remove_issue_books.assert_called_once_with("1", ["101"])
+        self.mock_book_repository.adjust_available_copies.assert_called_once_with({"101": 2})
 
     def test_get_issue_book_by_user_id(self):
         # Arrange
@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.app.config.messages import SEARCH_QUERY_REQUIRED
+from src.app.services.search_service import SearchService
+from src.app.utils.errors.error import InvalidRequestBody
+import src.app.config.config as config
+
+
+class TestSearchService(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_search_repository = MagicMock()
+        self.search_service = SearchService(self.mock_search_repository)
+
+    def test_search_books(self):
+        self.mock_search_repository.search_books.return_value = []
+
+        result = self.search_service.search_books("dune", 10, prefix=True)
+
+        self.mock_search_repository.search_books.assert_called_once_with("dune", 10, True)
+        self.assertEqual(result, [])
+
+    def test_search_books_caps_limit(self):
+        self.search_service.search_books("dune", config.SEARCH_LIMIT_MAX + 50)
+
+        self.mock_search_repository.search_books.assert_called_once_with("dune", config.SEARCH_LIMIT_MAX, False)
+
+    def test_search_books_empty_query(self):
+        for text in ("", "   ", "?!"):
+            with self.assertRaises(InvalidRequestBody) as context:
+                self.search_service.search_books(text)
+            self.assertEqual(str(context.exception), SEARCH_QUERY_REQUIRED)
+        self.mock_search_repository.search_books.assert_not_called()
@@ -110,3 +110,22 @@ class TestUserService(unittest.TestCase):
 
 
 
+
+    def test_signup_and_login_use_password_hasher(self):
+        # Arrange
+        hasher = MagicMock()
+        hasher.hash.return_value = "hashed_password"
+        hasher.verify.return_value = True
+        user_service = UserService(self.mock_user_repository, hasher)
+        self.mock_user_repository.fetch_user_by_email.return_value = None
+        user = User(id="1", name="John Doe", email="example@gmail.com", branch="IT", year="1st", password="password")
+
+        # Act
+        user_service.signup_user(user)
+        self.mock_user_repository.fetch_user_by_email.return_value = user
+        logged_in = user_service.login_user("example@gmail.com", "password")
+
+        # Assert
+        hasher.hash.assert_called_once_with("password")
+        hasher.verify.assert_called_once_with("password", "hashed_password")
+        self.assertIs(logged_in, user)
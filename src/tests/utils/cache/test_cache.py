@@ -0,0 +1,63 @@
+import time
+import unittest
+
+from src.app.utils.cache.cache import Cache, LRUCache, MISSING
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        self.assertIs(cache.get("a"), MISSING)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_negative_entry(self):
+        cache = LRUCache()
+        cache.set("missing", None)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats()["negative_hits"], 1)
+
+    def test_lru_eviction(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(ttl=60)
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIs(cache.get("a"), MISSING)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        self.assertIs(cache.get("a"), MISSING)
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.stats()["invalidations"], 2)
+
+    def test_delete_returns_the_removed_value(self):
+        cache = LRUCache(ttl=60)
+        cache.set("a", 1)
+
+        self.assertEqual(cache.delete("a"), 1)
+        self.assertIs(cache.delete("a"), MISSING)
+
+    def test_incomplete_backend_fails_when_created(self):
+        class GetOnly(Cache):
+            def get(self, key):
+                return MISSING
+
+        with self.assertRaises(TypeError):
+            GetOnly()
@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+
+from src.app.utils.cache.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.release = threading.Event()
+        self.executions = 0
+
+    def _slow_load(self):
+        self.executions += 1
+        self.release.wait(5)
+        return {"title": "Dune"}
+
+    def _run_concurrently(self, key, func, callers):
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(self.single_flight.do(key, func))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while self.single_flight.stats()["collapsed"] < callers - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results, errors
+
+    def test_concurrent_calls_share_one_execution(self):
+        results, errors = self._run_concurrently("dune", self._slow_load, 5)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.executions, 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True, True])
+        self.assertEqual(self.single_flight.stats(), {"calls": 5, "executions": 1, "collapsed": 4, "in_flight": 0})
+
+    def test_error_is_shared_with_waiters(self):
+        def failing_load():
+            self.release.wait(5)
+            raise ValueError("database down")
+
+        results, errors = self._run_concurrently("dune", failing_load, 3)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+
+    def test_sequential_calls_are_not_collapsed(self):
+        self.release.set()
+        self.single_flight.do("dune", self._slow_load)
+        self.single_flight.do("dune", self._slow_load)
+
+        self.assertEqual(self.executions, 2)
+        self.assertEqual(self.single_flight.stats()["collapsed"], 0)
+
+    def test_different_keys_run_separately(self):
+        self.release.set()
+        self.single_flight.do("dune", self._slow_load)
+        self.single_flight.do("emma", self._slow_load)
+
+        self.assertEqual(self.single_flight.stats()["executions"], 2)
@@ -1,7 +1,94 @@
 from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
 
 
-def test_db_connection():
-    conn = DB.get_connection()
+def test_db_connection(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    conn = db.get_connection()
 
-    assert conn is not None
\ No newline at end of file
+    assert conn is not None
+    with conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_repositories_share_pool(tmp_path):
+    db = DB(str(tmp_path / "library.db"), pool_size=2)
+
+    with db.get_connection():
+        with db.get_connection():
+            pass
+
+    stats = db.stats()
+    assert stats["checkouts"] == 1
+    assert stats["size"] == 1
+    assert stats["idle"] == 1
+    db.close()
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    with db.get_connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+    with db.transaction():
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+
+    try:
+        with db.transaction():
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO t VALUES (3)")
+            raise ValueError("abort")
+    except ValueError:
+        pass
+
+    with db.get_connection() as conn:
+        assert [row[0] for row in conn.execute("SELECT x FROM t ORDER BY x")] == [1, 2]
+    db.close()
+
+
+def test_table_versions_count_committed_writes_only(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    apply_migrations(db)
+    versions = db.table_versions("book", "user")
+    assert versions["book"][0] == 0
+    assert versions["user"] == (0, 0.0)  # not tracked
+
+    try:
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO book VALUES ('b1', 'Dune', 'Frank Herbert', 1, 1)")
+            raise RuntimeError("rollback")
+    except RuntimeError:
+        pass
+    assert db.table_versions("book")["book"][0] == 0
+
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO book VALUES ('b1', 'Dune', 'Frank Herbert', 1, 1)")
+        conn.execute("UPDATE book SET number_of_available_books = 0 WHERE id = 'b1'")
+    version, modified_at = db.table_versions("book")["book"]
+    assert version == 2
+    assert modified_at >= versions["book"][1]
+    assert db.table_versions("issuedBook")["issuedBook"][0] == 0
+    db.close()
+
+
+def test_query_listeners_see_every_statement(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    seen = []
+    db.add_query_listener(lambda sql, parameters, seconds: seen.append((sql, parameters, seconds >= 0)))
+
+    with db.get_connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        cursor = conn.cursor()
+        cursor.execute("SELECT x FROM t WHERE x > ?", (1,))
+        assert cursor.fetchall()[0]["x"] == 2
+
+    assert seen == [
+        ("CREATE TABLE t (x INTEGER)", (), True),
+        ("INSERT INTO t VALUES (?)", None, True),
+        ("SELECT x FROM t WHERE x > ?", (1,), True),
+    ]
+    db.close()
@@ -0,0 +1,40 @@
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations, get_schema_version, LATEST_VERSION
+
+
+def test_apply_migrations_creates_schema(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+
+    assert get_schema_version(db) == 0
+    assert apply_migrations(db) == LATEST_VERSION
+
+    with db.get_connection() as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"user", "book", "issuedBook"} <= tables
+    assert {"idx_issuedBook_user_id", "idx_issuedBook_book_id"} <= indexes
+    db.close()
+
+
+def test_apply_migrations_is_idempotent(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    apply_migrations(db)
+    checkouts = db.stats()["checkouts"]
+
+    assert apply_migrations(db) == LATEST_VERSION
+    # The fast path only reads the schema version
+    assert db.stats()["checkouts"] == checkouts + 1
+    db.close()
+
+
+def test_issued_book_lookup_uses_index(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    apply_migrations(db)
+
+    with db.get_connection() as conn:
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id, user_id, book_id, borrow_date, return_date "
+            "FROM issuedBook WHERE user_id = ?", ("1",)
+        ))
+    assert "COVERING INDEX idx_issuedBook_user_id" in plan
+    db.close()
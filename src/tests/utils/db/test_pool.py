@@ -0,0 +1,110 @@
+import sqlite3
+import threading
+import unittest
+
+from src.app.utils.db.pool import ConnectionPool, PooledConnection
+from src.app.utils.errors.error import PoolExhaustedError, DatabaseError
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.opened = []
+
+        def factory():
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self.opened.append(conn)
+            return conn
+
+        self.factory = factory
+
+    def test_same_thread_reuses_connection(self):
+        pool = ConnectionPool(self.factory, max_size=2)
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIs(first, second)
+        pool.release()
+        pool.release()
+        self.assertEqual(pool.stats()["checkouts"], 1)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_connection_reused_after_release(self):
+        pool = ConnectionPool(self.factory, max_size=2)
+        first = pool.acquire()
+        pool.release()
+        second = pool.acquire()
+        pool.release()
+        self.assertIs(first, second)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_checkout_times_out_when_exhausted(self):
+        pool = ConnectionPool(self.factory, max_size=1, timeout=0.05)
+        pool.acquire()
+        errors = []
+
+        def worker():
+            try:
+                pool.acquire()
+            except PoolExhaustedError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_waiter_gets_released_connection(self):
+        pool = ConnectionPool(self.factory, max_size=1, timeout=2)
+        conn = pool.acquire()
+        acquired = []
+        started = threading.Event()
+
+        def worker():
+            started.set()
+            acquired.append(pool.acquire())
+            pool.release()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait()
+        pool.release()
+        thread.join()
+        self.assertIs(acquired[0], conn)
+
+    def test_expired_connection_is_recycled(self):
+        pool = ConnectionPool(self.factory, max_size=1, max_lifetime=0)
+        first = pool.acquire()
+        pool.release()
+        second = pool.acquire()
+        pool.release()
+        self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_failed_health_check_discards_connection(self):
+        pool = ConnectionPool(self.factory, max_size=1, health_check_interval=0)
+        first = pool.acquire()
+        pool.release()
+        first.close()
+        second = pool.acquire()
+        pool.release()
+        self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["failed_health_checks"], 1)
+
+    def test_pooled_connection_rolls_back_on_error(self):
+        pool = ConnectionPool(self.factory, max_size=1)
+        with PooledConnection(pool) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with self.assertRaises(ValueError):
+            with PooledConnection(pool) as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise ValueError("boom")
+
+        with PooledConnection(pool) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+
+    def test_pooled_connection_outside_with_block(self):
+        pool = ConnectionPool(self.factory, max_size=1)
+        with self.assertRaises(DatabaseError):
+            PooledConnection(pool).execute("SELECT 1")
@@ -0,0 +1,40 @@
+import sqlite3
+import unittest
+
+from src.app.utils.db.db import DB
+from src.app.utils.db.pragmas import resolve_profile, apply_pragmas, check_pragmas
+
+
+class TestPragmas(unittest.TestCase):
+
+    def test_resolve_profile_with_overrides(self):
+        settings = resolve_profile("durable", {"cache_size": -1000})
+        self.assertEqual(settings["synchronous"], "FULL")
+        self.assertEqual(settings["cache_size"], -1000)
+
+    def test_resolve_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            resolve_profile("fastest")
+
+    def test_resolve_unsupported_override(self):
+        with self.assertRaises(ValueError):
+            resolve_profile("balanced", {"foreign_keys": "ON"})
+
+    def test_wal_not_applied_to_memory_database(self):
+        conn = sqlite3.connect(":memory:")
+        settings = resolve_profile("throughput")
+        apply_pragmas(conn, settings)
+        report = check_pragmas(conn, settings)
+        self.assertFalse(report["journal_mode"]["applied"])
+        self.assertTrue(report["synchronous"]["applied"])
+        self.assertTrue(report["temp_store"]["applied"])
+        self.assertTrue(report["cache_size"]["applied"])
+
+
+def test_db_applies_profile_to_pooled_connections(tmp_path):
+    db = DB(str(tmp_path / "library.db"), pragma_profile="durable")
+    report = db.check_pragmas()
+
+    assert report["journal_mode"]["effective"] == "wal"
+    assert all(result["applied"] for result in report.values())
+    db.close()
@@ -85,4 +85,54 @@ class TestGenericQueryBuilder(unittest.TestCase):
         expected_values = ["John Doe", 1]
         query, values = GenericQueryBuilder.update(table, data, where)
         self.assertEqual(query, expected_query)
-        self.assertEqual(values, expected_values)
\ No newline at end of file
+        self.assertEqual(values, expected_values)
+
+    def test_select_keyset_single_column(self):
+        query, values = GenericQueryBuilder.select("book", ["id", "title"], order_by="title", limit=10,
+                                                   after={"title": "Dune"})
+        self.assertEqual(query, "SELECT id, title FROM book WHERE title > ? ORDER BY title LIMIT 10")
+        self.assertEqual(values, ["Dune"])
+
+    def test_select_keyset_with_where_and_composite_key(self):
+        query, values = GenericQueryBuilder.select("issuedBook", ["id"], {"user_id": "u1"},
+                                                   order_by="borrow_date, id", limit=5,
+                                                   after={"borrow_date": "2024-01-01", "id": "x"})
+        self.assertEqual(
+            query,
+            "SELECT id FROM issuedBook WHERE user_id = ? AND (borrow_date, id) > (?, ?) ORDER BY borrow_date, id LIMIT 5"
+        )
+        self.assertEqual(values, ["u1", "2024-01-01", "x"])
+
+    def test_update_multiple_where_keys_joined_with_and(self):
+        query, values = GenericQueryBuilder.update("issuedBook", {"return_date": "2024-02-01"},
+                                                   {"user_id": "u1", "book_id": "b1"})
+        self.assertEqual(query, "UPDATE issuedBook SET return_date = ? WHERE user_id = ? AND book_id = ?")
+        self.assertEqual(values, ["2024-02-01", "u1", "b1"])
+
+    def test_update_without_where(self):
+        query, values = GenericQueryBuilder.update("book", {"number_of_copies": 0})
+        self.assertEqual(query, "UPDATE book SET number_of_copies = ?")
+        self.assertEqual(values, [0])
+
+    def test_delete_without_where(self):
+        query, values = GenericQueryBuilder.delete("book")
+        self.assertEqual(query, "DELETE FROM book")
+        self.assertEqual(values, [])
+
+    def test_same_shape_reuses_compiled_statement(self):
+        GenericQueryBuilder.clear_cache()
+        first, first_values = GenericQueryBuilder.select("book", ["id"], {"title": "Dune"}, limit=5)
+        second, second_values = GenericQueryBuilder.select("book", ["id"], {"title": "Emma"}, limit=5)
+
+        self.assertIs(first, second)
+        self.assertEqual((first_values, second_values), (["Dune"], ["Emma"]))
+        self.assertEqual(GenericQueryBuilder.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_different_shapes_compile_separately(self):
+        first, _ = GenericQueryBuilder.select("book", ["id"], {"title": "Dune"}, limit=5)
+        by_author, _ = GenericQueryBuilder.select("book", ["id"], {"author": "Frank Herbert"}, limit=5)
+        larger_page, _ = GenericQueryBuilder.select("book", ["id"], {"title": "Dune"}, limit=50)
+
+        self.assertEqual(by_author, "SELECT id FROM book WHERE author = ? LIMIT 5")
+        self.assertEqual(larger_page, "SELECT id FROM book WHERE title = ? LIMIT 50")
+        self.assertNotEqual(first, by_author)
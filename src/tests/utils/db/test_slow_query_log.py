@@ -0,0 +1,106 @@
+import json
+
+from flask import Flask
+
+from src.app.repositories.books_repository import BooksRepository
+from src.app.utils.db.db import DB
+from src.app.utils.db.migrations import apply_migrations
+from src.app.utils.db.slow_query_log import SlowQueryLog
+
+
+def _db(tmp_path):
+    db = DB(str(tmp_path / "library.db"))
+    apply_migrations(db)
+    return db
+
+
+def test_records_repository_method_and_plan(tmp_path):
+    db = _db(tmp_path)
+    slow_queries = SlowQueryLog(db, threshold_ms=0)
+    repository = BooksRepository(db)
+
+    repository.get_book_by_title("Dune")
+
+    entry = slow_queries.entries()[0]
+    assert entry.repository == "BooksRepository"
+    assert entry.method == "get_book_by_title"
+    assert entry.parameter_types == ["str"]
+    assert entry.plan and not entry.plan[0].startswith("EXPLAIN failed")
+    db.close()
+
+
+def test_ignores_statements_under_threshold(tmp_path):
+    db = _db(tmp_path)
+    slow_queries = SlowQueryLog(db, threshold_ms=60_000)
+
+    BooksRepository(db).get_books()
+
+    assert slow_queries.entries() == []
+    assert slow_queries.stats()["recorded"] == 0
+    db.close()
+
+
+def test_flags_table_scans_and_caches_plans(tmp_path):
+    db = _db(tmp_path)
+    slow_queries = SlowQueryLog(db, threshold_ms=0)
+    sql = "SELECT id FROM book WHERE author = ?"
+
+    with db.get_connection() as conn:
+        conn.execute(sql, ("Frank Herbert",)).fetchall()
+        conn.execute(sql, ("Ursula K. Le Guin",)).fetchall()
+
+    first, second = slow_queries.entries()
+    assert first.table_scans == ["book"]
+    assert first.plan is second.plan
+    assert first.repository is None
+    # The EXPLAIN itself isn't reported back to the log
+    assert not any(entry.sql.startswith("EXPLAIN") for entry in slow_queries.entries())
+    db.close()
+
+
+def test_executemany_is_explained_without_parameters(tmp_path):
+    db = _db(tmp_path)
+    slow_queries = SlowQueryLog(db, threshold_ms=0)
+
+    with db.get_connection() as conn:
+        conn.executemany("UPDATE book SET number_of_copies = ? WHERE author = ?", [(2, "A"), (3, "B")])
+
+    entry = slow_queries.entries()[0]
+    assert entry.parameter_types is None
+    assert entry.table_scans == ["book"]
+    db.close()
+
+
+def test_keeps_newest_entries_up_to_capacity(tmp_path):
+    db = _db(tmp_path)
+    slow_queries = SlowQueryLog(db, threshold_ms=0, capacity=2, explain=False)
+
+    with db.get_connection() as conn:
+        for i in range(5):
+            conn.execute(f"SELECT {i}")
+
+    assert [entry.sql for entry in slow_queries.entries()] == ["SELECT 4", "SELECT 3"]
+    assert [entry.sql for entry in slow_queries.entries(limit=1)] == ["SELECT 4"]
+    assert slow_queries.stats() == {"recorded": 5, "buffered": 2, "threshold_ms": 0}
+
+    slow_queries.clear()
+    assert slow_queries.entries() == []
+    db.close()
+
+
+def test_writes_json_lines_with_request_context(tmp_path):
+    db = _db(tmp_path)
+    log_file = tmp_path / "slow.log"
+    slow_queries = SlowQueryLog(db, threshold_ms=0, explain=False, log_file=str(log_file))
+    app = Flask(__name__)
+
+    with app.test_request_context("/books"):
+        with db.get_connection() as conn:
+            conn.execute("SELECT 1")
+
+    for handler in slow_queries.file_logger.handlers:
+        handler.flush()
+    record = json.loads(log_file.read_text().splitlines()[-1])
+    assert record["sql"] == "SELECT 1"
+    assert record["duration_ms"] >= 0
+    db.close()
@@ -0,0 +1,132 @@
+import io
+import json
+import logging
+import unittest
+from unittest.mock import patch
+
+from flask import Flask, g
+
+from src.app.utils.logger.api_logger import api_logger
+from src.app.utils.logger.formatters import JsonFormatter
+from src.app.utils.logger.logger import Logger
+
+app = Flask(__name__)
+
+
+class _Handler:
+    def get(self):
+        return "ok"
+
+    def fail(self):
+        raise ValueError("boom")
+
+    def not_found(self):
+        return {"status": "fail"}, 404
+
+
+class TestApiLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = Logger()
+        self.saved_handlers, self.saved_level = self.logger.logger.handlers[:], self.logger.logger.level
+        self.stream = io.StringIO()
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s | %(context)s"))
+        self.logger.logger.handlers = [handler]
+
+    def tearDown(self):
+        self.logger.logger.handlers = self.saved_handlers
+        self.logger.logger.setLevel(self.saved_level)
+
+    def _call(self, method, level, headers=None):
+        self.logger.logger.setLevel(level)
+        with app.test_request_context('/user/book', method='POST', json={"title": "Dune", "password": "secret"},
+                                      headers=headers):
+            g.user_id = "user-1"
+            g.role = "admin"
+            return api_logger(self.logger)(method)(_Handler())
+
+    def test_debug_logs_sanitized_request_details(self):
+        result = self._call(_Handler.get, logging.DEBUG)
+
+        output = self.stream.getvalue()
+        self.assertEqual(result, "ok")
+        self.assertIn("Entering get", output)
+        self.assertIn("'password': '***'", output)
+        self.assertNotIn("secret'", output)
+        self.assertIn("for user_id=user-1 | role=admin", output)
+        self.assertIn("Exiting get", output)
+
+    def test_request_details_not_built_when_debug_disabled(self):
+        with patch.object(Logger, "_sanitize_body") as mock_sanitize:
+            self._call(_Handler.get, logging.INFO)
+
+        mock_sanitize.assert_not_called()
+        self.assertEqual(self.stream.getvalue().strip(), "INFO get executed successfully. | for user_id=user-1 | role=admin")
+
+    def test_nothing_formatted_when_level_disabled(self):
+        with patch.object(Logger, "_build_context", wraps=self.logger._build_context) as mock_context:
+            self._call(_Handler.get, logging.WARNING)
+
+        self.assertEqual(self.stream.getvalue(), "")
+        self.assertEqual(mock_context.call_count, 1)
+
+    def test_error_logs_request_body_without_headers(self):
+        with self.assertRaises(ValueError):
+            self._call(_Handler.fail, logging.ERROR)
+
+        output = self.stream.getvalue()
+        self.assertIn("Error occurred in fail: boom", output)
+        self.assertIn("'password': '***'", output)
+        self.assertNotIn("headers", output)
+
+    def _json_lines(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_json_format_has_one_line_per_record_with_request_fields(self):
+        self.logger.logger.handlers[0].setFormatter(JsonFormatter())
+
+        self._call(_Handler.get, logging.DEBUG, headers={"X-Request-ID": "req-42"})
+
+        records = self._json_lines()
+        self.assertEqual([record["level"] for record in records], ["DEBUG", "INFO", "DEBUG"])
+        self.assertTrue(all(record["request_id"] == "req-42" for record in records))
+        completed = records[1]
+        self.assertEqual(completed["message"], "get executed successfully.")
+        self.assertEqual(completed["user_id"], "user-1")
+        self.assertEqual(completed["role"], "admin")
+        self.assertEqual(completed["route"], "/user/book")
+        self.assertEqual(completed["method"], "POST")
+        self.assertEqual(completed["status"], 200)
+        self.assertGreaterEqual(completed["duration_ms"], 0)
+
+    def test_unsafe_request_id_is_replaced(self):
+        self.logger.logger.handlers[0].setFormatter(JsonFormatter())
+
+        self._call(_Handler.get, logging.INFO, headers={"X-Request-ID": "bad id; with spaces"})
+
+        request_id = self._json_lines()[0]["request_id"]
+        self.assertEqual(len(request_id), 32)
+
+    @patch("src.app.config.config.LOG_SAMPLE_RATE", 0.0)
+    def test_unsampled_request_skips_success_logs(self):
+        self._call(_Handler.get, logging.DEBUG)
+
+        self.assertEqual(self.stream.getvalue(), "")
+
+    @patch("src.app.config.config.LOG_SAMPLE_RATE", 0.0)
+    def test_unsampled_request_still_logs_errors_and_failed_statuses(self):
+        self.logger.logger.handlers[0].setFormatter(JsonFormatter())
+        with self.assertRaises(ValueError):
+            self._call(_Handler.fail, logging.DEBUG)
+        self._call(_Handler.not_found, logging.DEBUG)
+
+        records = self._json_lines()
+        self.assertEqual([(record["level"], record["status"]) for record in records],
+                         [("ERROR", 500), ("WARNING", 404)])
+
+    @patch("src.app.config.config.LOG_SAMPLE_RATES", {"/user/book": 0.0})
+    def test_per_route_sample_rate(self):
+        self._call(_Handler.get, logging.INFO)
+
+        self.assertEqual(self.stream.getvalue(), "")
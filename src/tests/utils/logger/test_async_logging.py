@@ -0,0 +1,166 @@
+import logging
+import threading
+import unittest
+
+from unittest.mock import patch
+
+from src.app.utils.logger.async_logging import (_STOP, BatchingQueueListener, BoundedQueueHandler,
+                                                BufferedRotatingFileHandler)
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestBoundedQueueHandler(unittest.TestCase):
+
+    def _drain(self, handler):
+        messages = []
+        while not handler.queue.empty():
+            messages.append(handler.queue.get_nowait().getMessage())
+        return messages
+
+    def test_message_is_merged_before_queuing(self):
+        handler = BoundedQueueHandler(max_size=10)
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+
+        handler.handle(record)
+
+        queued = handler.queue.get_nowait()
+        self.assertEqual(queued.msg, "hello world")
+        self.assertIsNone(queued.args)
+
+    def test_drop_oldest(self):
+        handler = BoundedQueueHandler(max_size=2, policy="drop-oldest")
+
+        for message in ("a", "b", "c"):
+            handler.handle(_record(message))
+
+        self.assertEqual(self._drain(handler), ["b", "c"])
+        self.assertEqual(handler.stats()["dropped"], 1)
+        self.assertEqual(handler.stats()["queued"], 3)
+
+    def test_drop_debug_drops_only_debug_records(self):
+        handler = BoundedQueueHandler(max_size=1, policy="drop-debug")
+        handler.handle(_record("first"))
+
+        handler.handle(_record("noise", logging.DEBUG))
+        self.assertEqual(handler.stats()["dropped"], 1)
+
+        writer = threading.Thread(target=handler.handle, args=(_record("important", logging.ERROR),))
+        writer.start()
+        writer.join(0.05)
+        self.assertTrue(writer.is_alive())  # waiting for room rather than dropping
+        self.assertEqual(handler.queue.get(timeout=1).getMessage(), "first")
+        writer.join(1)
+        self.assertEqual(self._drain(handler), ["important"])
+        self.assertEqual(handler.stats()["dropped"], 1)
+
+    def test_block_waits_for_room(self):
+        handler = BoundedQueueHandler(max_size=1, policy="block")
+        handler.handle(_record("first"))
+
+        writer = threading.Thread(target=handler.handle, args=(_record("second", logging.DEBUG),))
+        writer.start()
+        writer.join(0.05)
+        self.assertTrue(writer.is_alive())
+        handler.queue.get(timeout=1)
+        writer.join(1)
+
+        self.assertEqual(self._drain(handler), ["second"])
+        self.assertEqual(handler.stats()["dropped"], 0)
+
+    def test_drop_oldest_keeps_the_stop_sentinel(self):
+        handler = BoundedQueueHandler(max_size=1, policy="drop-oldest")
+        handler.queue.put(_STOP)
+
+        handler.handle(_record("late"))
+
+        self.assertIs(handler.queue.get_nowait(), _STOP)
+        self.assertEqual(handler.stats()["dropped"], 1)
+
+    def test_fallback_skips_the_queue(self):
+        handler = BoundedQueueHandler(max_size=1)
+        target = _ListHandler()
+        handler.fall_back_to(BatchingQueueListener(handler.queue, [target]).handle)
+
+        handler.handle(_record("after stop"))
+
+        self.assertTrue(handler.queue.empty())
+        self.assertEqual(target.messages, ["after stop"])
+        self.assertEqual(target.flushes, 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(policy="drop-everything")
+
+
+class TestBatchingQueueListener(unittest.TestCase):
+
+    def test_writes_queued_records_in_batches_and_flushes_on_stop(self):
+        handler = BoundedQueueHandler(max_size=100)
+        target = _ListHandler()
+        for i in range(10):
+            handler.handle(_record(f"message {i}"))
+        listener = BatchingQueueListener(handler.queue, [target], batch_size=4)
+
+        listener.start()
+        listener.stop()
+
+        self.assertEqual(target.messages, [f"message {i}" for i in range(10)])
+        self.assertEqual(listener.written, 10)
+        self.assertLessEqual(target.flushes, listener.batches)
+        self.assertLess(listener.batches, 10)
+
+    def test_respects_handler_level(self):
+        handler = BoundedQueueHandler(max_size=10)
+        target = _ListHandler()
+        target.setLevel(logging.WARNING)
+        handler.handle(_record("debug", logging.DEBUG))
+        handler.handle(_record("warning", logging.WARNING))
+        listener = BatchingQueueListener(handler.queue, [target])
+
+        listener.start()
+        listener.stop()
+
+        self.assertEqual(target.messages, ["warning"])
+
+    def test_failing_handler_does_not_stop_the_listener(self):
+        handler = BoundedQueueHandler(max_size=10)
+        broken, target = _ListHandler(), _ListHandler()
+        broken.emit = broken.flush = lambda *args: 1 / 0
+        handler.handle(_record("first"))
+        handler.handle(_record("second"))
+        listener = BatchingQueueListener(handler.queue, [broken, target], batch_size=1)
+
+        with patch.object(broken, "handleError") as handle_error:
+            listener.start()
+            listener.stop()
+
+        self.assertEqual(target.messages, ["first", "second"])
+        self.assertEqual(listener.written, 2)
+        self.assertEqual(handle_error.call_count, 4)  # one emit and one flush per record
+
+
+def test_buffered_file_handler_writes_after_flush(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BufferedRotatingFileHandler(str(path), maxBytes=1024 * 1024, backupCount=1)
+
+    handler.handle(_record("hello"))
+    handler.flush()
+
+    assert path.read_text() == "hello\n"
+    handler.close()
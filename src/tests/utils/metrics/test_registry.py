@@ -0,0 +1,87 @@
+import unittest
+
+from src.app.utils.metrics.registry import MetricsRegistry, _Metric
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry("test")
+
+    def test_counter_renders_labels(self):
+        # Arrange
+        counter = self.registry.counter("requests_total", "Requests.", ("endpoint",))
+
+        # Act
+        counter.inc(endpoint="book")
+        counter.inc(2, endpoint='say "hi"')
+
+        # Assert
+        text = self.registry.render()
+        self.assertIn("# TYPE test_requests_total counter", text)
+        self.assertIn('test_requests_total{endpoint="book"} 1.0', text)
+        self.assertIn('test_requests_total{endpoint="say \\"hi\\""} 2.0', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        # Arrange
+        histogram = self.registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        # Assert
+        lines = self.registry.render().splitlines()
+        self.assertIn('test_latency_seconds_bucket{le="0.1"} 2', lines)
+        self.assertIn('test_latency_seconds_bucket{le="1.0"} 3', lines)
+        self.assertIn('test_latency_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("test_latency_seconds_sum 3.65", lines)
+        self.assertIn("test_latency_seconds_count 4", lines)
+
+    def test_stats_sources_become_gauges(self):
+        # Arrange
+        self.registry.register_stats("pool", lambda: {"in_use": 2, "async": True, "mode": "wal", "avg-ms": 1.5})
+        self.registry.register_stats("broken", lambda: 1 / 0)
+
+        # Act
+        lines = self.registry.render().splitlines()
+
+        # Assert
+        self.assertIn("test_pool_in_use 2", lines)
+        self.assertIn("test_pool_async 1", lines)
+        self.assertIn("test_pool_avg_ms 1.5", lines)
+        self.assertFalse(any("mode" in line or "broken" in line for line in lines))
+
+    def test_stats_counters_are_exported_as_counters(self):
+        # Arrange
+        self.registry.register_stats("pool", lambda: {"in_use": 2, "checkouts": 40}, counters=("checkouts",))
+
+        # Act
+        lines = self.registry.render().splitlines()
+
+        # Assert
+        self.assertIn("# TYPE test_pool_in_use gauge", lines)
+        self.assertIn("# TYPE test_pool_checkouts_total counter", lines)
+        self.assertIn("test_pool_checkouts_total 40", lines)
+        self.assertNotIn("test_pool_checkouts 40", lines)
+
+    def test_metric_without_samples_fails_when_created(self):
+        # Arrange
+        class Gauge(_Metric):
+            kind = "gauge"
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            Gauge("test_gauge", "Gauge.")
+
+    def test_duplicate_metric_names_are_rejected(self):
+        # Arrange
+        self.registry.counter("requests_total", "Requests.")
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            self.registry.counter("requests_total", "Requests.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from flask import Flask, request
+from werkzeug.exceptions import BadRequest
+
+import src.app.utils.json_provider as json_provider
+from src.app.utils.json_provider import OrjsonJSONProvider, StdlibJSONProvider, install_json_provider
+
+
+class TestJsonProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.payload = {"status": "success", "message": "ok",
+                        "data": [{"title": "Dune – Zoë", "borrow_date": date(2024, 12, 20), "author": "Herbert"}]}
+
+    def encode(self, provider_name):
+        install_json_provider(self.app, provider_name)
+        with self.app.app_context():
+            return self.app.json.response(self.payload).get_data()
+
+    @unittest.skipIf(json_provider.orjson is None, "orjson not installed")
+    def test_auto_prefers_orjson(self):
+        # Act
+        provider = install_json_provider(self.app)
+
+        # Assert
+        self.assertIsInstance(provider, OrjsonJSONProvider)
+
+    def test_auto_falls_back_to_stdlib(self):
+        # Act
+        with patch.object(json_provider, "orjson", None):
+            provider = install_json_provider(self.app)
+
+        # Assert
+        self.assertIsInstance(provider, StdlibJSONProvider)
+
+    @unittest.skipIf(json_provider.orjson is None, "orjson not installed")
+    def test_providers_write_the_same_body(self):
+        # Act
+        fast, stdlib = self.encode("orjson"), self.encode("stdlib")
+
+        # Assert
+        self.assertEqual(fast, stdlib)
+        self.assertIn(b'"borrow_date":"2024-12-20"', fast)
+        self.assertTrue(fast.endswith(b"\n"))
+
+    @unittest.skipIf(json_provider.orjson is None, "orjson not installed")
+    def test_values_orjson_rejects_fall_back_to_stdlib(self):
+        # Arrange
+        self.payload = {"total": 2 ** 70}
+
+        # Act
+        body = self.encode("orjson")
+
+        # Assert
+        self.assertEqual(json.loads(body), {"total": 2 ** 70})
+
+    @unittest.skipIf(json_provider.orjson is None, "orjson not installed")
+    def test_invalid_request_body_is_a_bad_request(self):
+        # Arrange
+        install_json_provider(self.app, "orjson")
+
+        # Act & Assert
+        with self.app.test_request_context(method="POST", data="{not json", content_type="application/json"):
+            self.assertIsNone(request.get_json(silent=True))
+            with self.assertRaises(BadRequest):
+                request.get_json()
+
+    def test_unknown_provider(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            install_json_provider(self.app, "ujson")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from src.app.utils.errors.error import InvalidCursorError, InvalidRequestBody
+from src.app.utils.pagination import encode_cursor, decode_cursor, parse_limit, Page
+import src.app.config.config as config
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_cursor_round_trip(self):
+        token = encode_cursor("book", {"title": "Dune"})
+        self.assertEqual(decode_cursor("book", token, "title"), {"title": "Dune"})
+
+    def test_cursor_from_other_listing_rejected(self):
+        token = encode_cursor("issuedBook", {"id": "1"})
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor("book", token, "title")
+
+    def test_garbage_cursor_rejected(self):
+        for token in ("%%%", "bm90IGpzb24", encode_cursor("book", {})):
+            with self.assertRaises(InvalidCursorError):
+                decode_cursor("book", token, "title")
+
+    def test_parse_limit(self):
+        self.assertEqual(parse_limit(None), config.PAGE_SIZE_DEFAULT)
+        self.assertEqual(parse_limit("10"), 10)
+        self.assertEqual(parse_limit(str(config.PAGE_SIZE_MAX + 1)), config.PAGE_SIZE_MAX)
+        for raw in ("0", "-1", "ten"):
+            with self.assertRaises(InvalidRequestBody):
+                parse_limit(raw)
+
+    def test_page_from_rows(self):
+        page = Page.from_rows([1, 2, 3], 2, "n", lambda n: {"n": n})
+        self.assertEqual(page.items, [1, 2])
+        self.assertTrue(page.has_more)
+        self.assertEqual(decode_cursor("n", page.next_cursor, "n"), {"n": 2})
+
+        last = Page.from_rows([3], 2, "n", lambda n: {"n": n})
+        self.assertFalse(last.has_more)
+        self.assertIsNone(last.next_cursor)
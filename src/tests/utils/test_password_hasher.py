@@ -0,0 +1,61 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.app.utils.errors.error import HashingBusyError
+from src.app.utils.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher(unittest.TestCase):
+
+    def setUp(self):
+        self.hasher = PasswordHasher(workers=1, queue_size=1, rounds=4)
+
+    def tearDown(self):
+        self.hasher.shutdown()
+
+    def test_hash_and_verify(self):
+        hashed = self.hasher.hash("secret")
+
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        self.assertTrue(self.hasher.verify("secret", hashed))
+        self.assertFalse(self.hasher.verify("wrong", hashed))
+        stats = self.hasher.stats()
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertGreater(stats["hash_ms_avg"], 0)
+
+    def test_rejects_when_saturated(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_hash(password, rounds):
+            started.set()
+            release.wait(5)
+            return "hashed"
+
+        with patch("src.app.utils.utils.Utils.hash_password", side_effect=slow_hash):
+            running = threading.Thread(target=self.hasher.hash, args=("a",))
+            running.start()
+            started.wait(5)
+            queued = threading.Thread(target=self.hasher.hash, args=("b",))
+            queued.start()
+            while self.hasher.stats()["queue_depth"] < 1:
+                time.sleep(0.001)
+
+            with self.assertRaises(HashingBusyError) as raised:
+                self.hasher.hash("c")
+
+            self.assertGreaterEqual(raised.exception.retry_after, 1)
+            release.set()
+            running.join(5)
+            queued.join(5)
+
+        stats = self.hasher.stats()
+        self.assertEqual(stats["rejected"], 1)
+        self.assertEqual(stats["completed"], 2)
+
+    def test_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            PasswordHasher(workers=0)